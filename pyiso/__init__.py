@@ -1,7 +1,9 @@
+import copy
 import imp
 import os.path
 from os import environ
 import logging
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
 
 __version__ = '0.3.16'
 
@@ -82,3 +84,76 @@ def client_factory(client_name, **kwargs):
     client_inst.NAME = client_name
 
     return client_inst
+
+
+def fetch_many(ba_names, data='load', timeout_sec=None, return_exceptions=False, **kwargs):
+    """
+    Get the same data from several balancing authorities at once.
+    Each BA's client runs its get_* call on its own thread, so the whole call takes about as long as the slowest BA.
+
+    :param ba_names: Balancing authority names, as for client_factory.
+    :param str data: Which get_* method to call, eg 'load' for get_load.
+    :param timeout_sec: Seconds to wait for each BA, either one number for all of them
+        or a dict of numbers by BA name (BAs not in the dict don't time out). None for no timeout.
+        A BA's timeout is also the deadline for retrying its requests.
+    :param bool return_exceptions: If True, a BA that fails or times out gets its exception as its result.
+        If False, failures are logged and the BA is left out of the results.
+    :param kwargs: Passed to each get_* call, eg latest=True.
+    :return: Dict of get_* results keyed by BA name.
+    """
+    from pyiso import retry
+
+    ba_names = list(ba_names)
+    if not ba_names:
+        return {}
+    method_name = 'get_%s' % data
+
+    def timeout_for(ba_name):
+        if isinstance(timeout_sec, dict):
+            return timeout_sec.get(ba_name)
+        return timeout_sec
+
+    def call(ba_name):
+        client = client_factory(ba_name)
+
+        # stop retrying once nobody is waiting for the result any more
+        ba_timeout = timeout_for(ba_name)
+        if ba_timeout is not None:
+            policy = copy.copy(client.retry_policy or retry.DEFAULT_POLICY)
+            if policy.deadline_sec is None or policy.deadline_sec > ba_timeout:
+                policy.deadline_sec = ba_timeout
+            client.retry_policy = policy
+
+        try:
+            method = getattr(client, method_name)
+        except AttributeError:
+            raise ValueError('%s has no %s' % (ba_name, method_name))
+        return method(**kwargs)
+
+    # one thread per BA, so a slow BA never holds up the start of another
+    executor = ThreadPoolExecutor(max_workers=len(ba_names))
+    try:
+        started = retry.monotonic()
+        futures = [(ba_name, executor.submit(call, ba_name)) for ba_name in ba_names]
+
+        results = {}
+        for ba_name, future in futures:
+            # each timeout counts from the start, not from when we got round to waiting for this BA
+            ba_timeout = timeout_for(ba_name)
+            if ba_timeout is not None:
+                ba_timeout = max(0, retry.time_left(started + ba_timeout))
+
+            try:
+                results[ba_name] = future.result(timeout=ba_timeout)
+            except TimeoutError as e:
+                LOGGER.warn('%s: %s timed out after %s seconds' % (ba_name, method_name, timeout_for(ba_name)))
+                if return_exceptions:
+                    results[ba_name] = e
+            except Exception as e:
+                LOGGER.warn('%s: %s failed: %s' % (ba_name, method_name, e))
+                if return_exceptions:
+                    results[ba_name] = e
+        return results
+    finally:
+        # don't wait for BAs that timed out; their threads finish in the background
+        executor.shutdown(wait=False)
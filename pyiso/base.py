@@ -1,21 +1,20 @@
 from collections import namedtuple
 from dateutil.parser import parse as dateutil_parse
+import copy
+import functools
+import lxml.html
+import numpy as np
 from datetime import datetime, timedelta
 import pytz
 import requests
 import pandas as pd
+from pandas.io.parsers import TextParser
+import re
 import zipfile
 from io import StringIO, BytesIO
-from time import sleep
-from pyiso import LOGGER
+from pyiso import LOGGER, cache, cassette, ratelimit, retry, sessions
 from pytz import AmbiguousTimeError
-import ssl
-
-
-try:
-    from urllib2 import urlopen
-except ImportError:
-    from urllib.request import urlopen  # Changed from urllib2 for python3.x
+import tempfile
 
 # named tuple for time period interval labels
 IntervalChoices = namedtuple('IntervalChoices', ['hourly', 'fivemin', 'tenmin', 'fifteenmin', 'na', 'dam'])
@@ -27,6 +26,61 @@ FUEL_CHOICES = ['biogas', 'biomass', 'coal', 'geo', 'hydro',
                 'solarth', 'thermal', 'wind', 'fossil', 'dual']
 
 
+# downloads bigger than this are spooled to disk by BaseClient.fetch_to_file
+SPOOL_MAX_BYTES = 16 * 1024 ** 2
+
+# read size for streamed downloads
+SPOOL_CHUNK_BYTES = 64 * 1024
+
+# runs of whitespace in html table cells, which are collapsed to one space like pd.read_html does
+WHITESPACE_RE = re.compile(r'[\r\n]+|\s{2,}')
+
+
+class ZipMembers(object):
+    """
+    List-like view of the files in a zip archive.
+    Each file is decompressed only when it is accessed: indexing returns its content as bytes,
+    and :py:meth:`open` or :py:meth:`files` return file-like objects that pandas can read from directly.
+    """
+    def __init__(self, zf):
+        self.zipfile = zf
+        self.names = zf.namelist()
+        self._contents = {}
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        # keep what we read, since callers often look at the same file twice
+        name = self.names[index]
+        if name not in self._contents:
+            self._contents[name] = self.zipfile.read(name)
+        return self._contents[name]
+
+    def __iter__(self):
+        # read each file in turn without keeping them all
+        for name in self.names:
+            if name in self._contents:
+                yield self._contents[name]
+            else:
+                yield self.zipfile.read(name)
+
+    def open(self, index):
+        """Returns a file-like object for reading the file at this index."""
+        return self.zipfile.open(self.names[index])
+
+    def files(self):
+        """Returns a list of file-like objects, one for each file."""
+        return [self.open(i) for i in range(len(self))]
+
+    def close(self):
+        self._contents = {}
+        self.zipfile.close()
+
+
 class BaseClient(object):
     """
     Base class for scraper/parser clients.
@@ -43,6 +97,19 @@ class BaseClient(object):
 
     TIMEOUT_SECONDS = 20
 
+    # RetryPolicy for this client's requests, or None to use pyiso.retry.DEFAULT_POLICY
+    retry_policy = None
+
+    # time.monotonic() time after which requests for the current get_* call aren't retried, or None
+    deadline = None
+
+    # number of requests to run at once within a get_* call, or None to use pyiso.parallel.MAX_WORKERS
+    max_workers = None
+
+    # number of processes to parse fetched payloads on in backfills that support it,
+    # or None to use pyiso.parallel.PARSE_PROCESSES
+    parse_processes = None
+
     def __init__(self, timeout_seconds=20):
         # will hold query options
         self.options = {}
@@ -136,12 +203,63 @@ class BaseClient(object):
         """
         raise NotImplementedError('Derived classes must implement the get_lmp method.')
 
+    def aget_generation(self, *args, **kwargs):
+        """
+        Awaitable version of :py:meth:`get_generation` for use inside an asyncio event loop,
+        eg ``data = await client.aget_generation(latest=True)``.
+        Takes the same arguments and returns the same data.
+        """
+        return self._run_in_executor('get_generation', *args, **kwargs)
+
+    def aget_load(self, *args, **kwargs):
+        """
+        Awaitable version of :py:meth:`get_load` for use inside an asyncio event loop,
+        eg ``data = await client.aget_load(latest=True)``.
+        Takes the same arguments and returns the same data.
+        """
+        return self._run_in_executor('get_load', *args, **kwargs)
+
+    def aget_trade(self, *args, **kwargs):
+        """
+        Awaitable version of :py:meth:`get_trade` for use inside an asyncio event loop,
+        eg ``data = await client.aget_trade(latest=True)``.
+        Takes the same arguments and returns the same data.
+        """
+        return self._run_in_executor('get_trade', *args, **kwargs)
+
+    def aget_lmp(self, *args, **kwargs):
+        """
+        Awaitable version of :py:meth:`get_lmp` for use inside an asyncio event loop,
+        eg ``data = await client.aget_lmp(latest=True)``.
+        Takes the same arguments and returns the same data.
+        """
+        return self._run_in_executor('get_lmp', *args, **kwargs)
+
+    def _run_in_executor(self, method_name, *args, **kwargs):
+        """
+        Run a blocking get_* method in the running event loop's default executor
+        and return an asyncio future for its result.
+        Each call works on a shallow copy of the client, so concurrent calls on one client
+        do not overwrite each other's options, but still share its connection.
+        """
+        # asyncio is python 3 only, so import here rather than at module level
+        import asyncio
+        loop = asyncio.get_event_loop()
+
+        worker = copy.copy(self)
+        worker.options = {}
+        func = functools.partial(getattr(worker, method_name), *args, **kwargs)
+        return loop.run_in_executor(None, func)
+
     def handle_options(self, **kwargs):
         """
         Process and store keyword argument options.
         """
         self.options = kwargs
 
+        # start the clock on retries for this call
+        self.deadline = (self.retry_policy or retry.DEFAULT_POLICY).new_deadline()
+
         # check start_at and end_at args
         if self.options.get('start_at', None) and self.options.get('end_at', None):
             assert self.options['start_at'] < self.options['end_at']
@@ -199,7 +317,7 @@ class BaseClient(object):
         # parse
         try:
             local_ts = dateutil_parse(local_ts_str)
-        except AttributeError:  # already parsed
+        except (AttributeError, TypeError):  # already parsed
             local_ts = local_ts_str
 
         # localize
@@ -217,6 +335,54 @@ class BaseClient(object):
         # return
         return aware_utc_ts
 
+    def utcify_many(self, local_values, tz_name=None, is_dst=None):
+        """
+        Convert many datetimes or datetime strings to UTC at once.
+
+        Gives the same times as calling utcify on each value, but parses and localizes them all together,
+        which is much faster for long lists.
+
+        :param local_values: List-like of the local datetimes or datetime strings to be converted.
+        :param string tz_name: Naive values are assumed to be in timezone tz. If tz is not provided, the client's default timezone is used.
+        :param is_dst: If provided, explicitly set daylight savings time for ambiguous times,
+            either as True or False for every value or as a list-like of booleans with one for each value.
+        :return: DatetimeIndex in UTC.
+        :rtype: DatetimeIndex
+        """
+        # set up tz
+        if tz_name is None:
+            tz_name = self.TZ_NAME
+        tz = pytz.timezone(tz_name)
+
+        # set up dst flags; like utcify, ambiguous times are standard time unless told otherwise
+        if len(local_values) == 0:
+            return pd.DatetimeIndex([], tz=pytz.utc)
+        if is_dst is None or isinstance(is_dst, bool):
+            dst_flags = np.array([bool(is_dst)] * len(local_values))
+        else:
+            dst_flags = np.asarray(is_dst, dtype=bool)
+
+        try:
+            # parse
+            local_index = pd.DatetimeIndex(pd.to_datetime(local_values))
+
+            # localize; times that don't exist locally (skipped at the start of DST) raise, so are done one at a time
+            if local_index.tz is None:  # unaware
+                aware_local_index = local_index.tz_localize(tz, ambiguous=dst_flags)
+            else:  # already aware
+                aware_local_index = local_index
+        except (ValueError, TypeError, pytz.InvalidTimeError) as e:
+            # mixed formats or timezones, or nonexistent times, so do one at a time
+            LOGGER.debug(e)
+            return pd.DatetimeIndex([BaseClient.utcify(self, local_value, tz_name=tz_name, is_dst=flag)
+                                     for local_value, flag in zip(local_values, dst_flags)]).tz_convert(pytz.utc)
+
+        # convert to utc
+        aware_utc_index = aware_local_index.tz_convert(pytz.utc)
+
+        # return
+        return aware_utc_index
+
     def parse_row(self, row, delimiter=',', datetime_col=None, drop_vals=None):
         raw_vals = row.split(delimiter)
         if datetime_col is not None:
@@ -229,68 +395,168 @@ class BaseClient(object):
 
         return cleaned_vals
 
-    def fetch_xls(self, url):
-        # follow http://stackoverflow.com/questions/27835619/ssl-certificate-verify-failed-error
-        context = ssl._create_unverified_context()
-        socket = urlopen(url, context=context)
-        xd = pd.ExcelFile(socket)
-        return xd
+    def fetch_xls(self, url, **kwargs):
+        """
+        Download a spreadsheet with :py:meth:`fetch_to_file`, so it goes through the pooled session,
+        retries and the response cache like any other request, and never has to fit in memory.
+        Returns a pandas.ExcelFile, or None if an error was encountered.
+        Any kwargs are passed to :py:meth:`request`.
+        """
+        xls_file = self.fetch_to_file(url, **kwargs)
+        if xls_file is None:
+            return None
+        return pd.ExcelFile(xls_file)
 
-    def request(self, url, mode='get', retry_sec=5, retries_remaining=5, **kwargs):
+    def request(self, url, mode='get', retry_sec=None, retries_remaining=None, **kwargs):
         """
         Get or post to a URL with the provided kwargs.
         Returns the response, or None if an error was encountered.
         If the mode is not 'get' or 'post', raises ValueError.
+
+        Unless the client has a session of its own, requests use the pooled session for the URL's host
+        (see :py:mod:`pyiso.sessions`), so connections are reused across client instances.
+        GET responses from URLs that never change once published are served from
+        the on-disk response cache when it is turned on (see :py:mod:`pyiso.cache`).
+        GETs for pages that sent an ETag or Last-Modified header before are made conditional,
+        and on a 304 the previous response object is returned, so :py:meth:`parse_once` can skip parsing it again.
+        Requests are paced by the process-wide limiter for the URL's host (see :py:mod:`pyiso.ratelimit`).
+        Connection errors, timeouts and retryable statuses like 429 and 503 are retried
+        up to retries_remaining times, after the server's Retry-After time or a jittered backoff
+        starting at retry_sec and doubling on each retry, as set by the client's retry policy (see :py:mod:`pyiso.retry`).
+        A 429 holds off all requests to that host while waiting.
+        Nothing is retried past the deadline of the current get_* call, if the policy has one.
+        Identical GETs made at the same time from other threads share one round-trip and one response.
+        When a cassette is configured (see :py:mod:`pyiso.cassette`), responses are recorded to it,
+        or answered from it without touching the network.
         """
         # check args
         allowed_modes = ['get', 'post']
         if mode not in allowed_modes:
             raise ValueError('Invalid request mode %s' % mode)
 
-        # check for session
-        try:
-            session = getattr(self, 'session')
-        except AttributeError:
-            self.session = requests.Session()
-            session = self.session
+        # replay or record
+        tape = cassette.get_cassette()
+        if tape is not None and tape.replaying:
+            return tape.play(mode, url, kwargs)
 
-        # carry out request
-        try:
-            response = getattr(session, mode)(url, verify=False,
-                                              timeout=self.timeout_seconds,
-                                              **kwargs)
-        # except requests.exceptions.ChunkedEncodingError as e:
-        #     # JSON incomplete or not found
-        #     msg = '%s: chunked encoding error for %s, %s:\n%s' % (self.NAME, url, kwargs, e)
-        #     LOGGER.error(msg)
-        #     return None
-        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
-            # eg max retries exceeded
-            msg = '%s: connection error for %s, %s:\n%s' % (self.NAME, url, kwargs, e)
-            LOGGER.error(msg)
-            return None
-        # except requests.exceptions.RequestException:
-        #     msg = '%s: request exception for %s, %s:\n%s' % (self.NAME, url, kwargs, e)
-        #     LOGGER.error(msg)
-        #     return None
+        def do_request():
+            return self._request(url, mode=mode, retry_sec=retry_sec, retries_remaining=retries_remaining, **kwargs)
 
-        if response.status_code == 200:
-            # success
-            LOGGER.debug('%s: request success for %s, %s with cache hit %s' % (self.NAME, url, kwargs, getattr(response, 'from_cache', None)))
+        # share the round-trip with any identical request already in flight
+        key = self._in_flight_key(url, mode, kwargs)
+        if key is None:
+            response = do_request()
+        else:
+            response = sessions.in_flight.do(key, do_request)
+        if tape is not None and response is not None:
+            tape.record(mode, url, kwargs, response)
+        return response
 
-        elif response.status_code == 429:
-            if retries_remaining > 0:
-                # retry on throttle
-                LOGGER.warn('%s: retrying in %d seconds (%d retries remaining), throttled for %s, %s' % (self.NAME, retry_sec, retries_remaining, url, kwargs))
-                sleep(retry_sec)
-                retries_remaining -= 1
-                return self.request(url, mode=mode,
-                                    retry_sec=retry_sec*2, retries_remaining=retries_remaining,
-                                    **kwargs)
+    def _request(self, url, mode, retry_sec, retries_remaining, **kwargs):
+        # serve from the response cache if we can; fetch_to_file caches streamed downloads itself
+        store, cache_url, cache_ttl = None, None, None
+        if not kwargs.get('stream'):
+            store, cache_url, cache_ttl = self._cache_for(url, mode, kwargs)
+        if store is not None:
+            cached = store.get(cache_url)
+            if cached is not None:
+                LOGGER.debug('%s: request success for %s, %s with cache hit %s' % (self.NAME, url, kwargs, True))
+                return cached
+
+        # if we have seen this page before, ask the server to skip the body if it hasn't changed
+        conditional_url = None
+        if mode == 'get' and not (kwargs.get('data') or kwargs.get('json') or kwargs.get('stream')):
+            conditional_url = cache.cache_url(url, kwargs.get('params'))
+            validators = cache.conditional.headers_for(conditional_url)
+            if validators:
+                headers = dict(kwargs.get('headers') or {})
+                headers.update(validators)
+                kwargs['headers'] = headers
+
+        # use the client's own session if it has one, eg for logins, or else the shared one for this host
+        session = getattr(self, 'session', None)
+        if session is None:
+            session = sessions.get_session(url)
+
+        policy = self.retry_policy or retry.DEFAULT_POLICY
+        if retries_remaining is None:
+            retries_remaining = policy.max_retries
+        retry_num = 0
+
+        while True:
+            # wait for our turn with this host
+            ratelimit.acquire(url)
+
+            # don't wait for a response past the deadline
+            timeout = self.timeout_seconds
+            time_left = retry.time_left(self.deadline)
+            if time_left is not None and time_left > 0 and (timeout is None or time_left < timeout):
+                timeout = time_left
+
+            # carry out request
+            error = None
+            try:
+                response = getattr(session, mode)(url, verify=False,
+                                                  timeout=timeout,
+                                                  **kwargs)
+            # except requests.exceptions.ChunkedEncodingError as e:
+            #     # JSON incomplete or not found
+            #     msg = '%s: chunked encoding error for %s, %s:\n%s' % (self.NAME, url, kwargs, e)
+            #     LOGGER.error(msg)
+            #     return None
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                # eg max retries exceeded
+                msg = '%s: connection error for %s, %s:\n%s' % (self.NAME, url, kwargs, e)
+                if not policy.retry_connection_errors:
+                    LOGGER.error(msg)
+                    return None
+                response, error = None, msg
+            # except requests.exceptions.RequestException:
+            #     msg = '%s: request exception for %s, %s:\n%s' % (self.NAME, url, kwargs, e)
+            #     LOGGER.error(msg)
+            #     return None
             else:
-                # exhausted retries
+                if not policy.is_retryable_status(response.status_code):
+                    break
+                error = '%s: request failure with code %s for %s, %s' % (self.NAME, response.status_code, url, kwargs)
+
+            # honor the server's Retry-After, or back off
+            wait_sec = policy.backoff(retry_num, retry_sec)
+            if response is not None:
+                wait_sec = self.retry_after(response, wait_sec)
+
+            # out of retries or time
+            time_left = retry.time_left(self.deadline)
+            if retries_remaining <= 0 or (time_left is not None and time_left < wait_sec):
                 LOGGER.warn('%s: exhausted retries for %s, %s' % (self.NAME, url, kwargs))
-                return None
+                if response is None or response.status_code == 429:
+                    LOGGER.error(error)
+                    return None
+                break
+
+            LOGGER.warn('%s; retrying in %d seconds (%d retries remaining)' % (error, wait_sec, retries_remaining))
+            if response is not None and response.status_code == 429:
+                # throttled, so hold off every client that uses this host
+                ratelimit.penalize(url, wait_sec)
+            else:
+                retry.sleep(wait_sec)
+            retries_remaining -= 1
+            retry_num += 1
+
+        if response.status_code == 304 and conditional_url:
+            # not modified, so reuse the response we already have
+            previous = cache.conditional.get(conditional_url)
+            if previous is not None:
+                LOGGER.debug('%s: request not modified for %s, %s' % (self.NAME, url, kwargs))
+                return previous
+
+        if response.status_code == 200:
+            # success
+            LOGGER.debug('%s: request success for %s, %s with cache hit %s' % (self.NAME, url, kwargs, getattr(response, 'from_cache', None)))
+            if store is not None:
+                store.set(cache_url, response, ttl=cache_ttl)
+            if conditional_url:
+                cache.conditional.set(conditional_url, response)
 
         else:
             # non-throttle error
@@ -298,18 +564,125 @@ class BaseClient(object):
 
         return response
 
+    def _in_flight_key(self, url, mode, kwargs):
+        """
+        Returns a key identifying this request among concurrent requests, or None if it can't be shared:
+        only plain GETs through the pooled sessions are shared, not streamed ones or ones with a client's own session.
+        """
+        if mode != 'get' or getattr(self, 'session', None) is not None:
+            return None
+        if kwargs.get('stream') or kwargs.get('data') or kwargs.get('json'):
+            return None
+        extra = sorted((k, repr(v)) for k, v in kwargs.items() if k != 'params')
+        return (cache.cache_url(url, kwargs.get('params')), tuple(extra))
+
+    def _cache_for(self, url, mode, kwargs):
+        """
+        Returns the response cache, the URL to cache under, and the ttl for this request,
+        or (None, None, None) if it shouldn't be cached.
+        """
+        store = cache.get_cache()
+        if store is None or mode != 'get' or kwargs.get('data') or kwargs.get('json'):
+            return None, None, None
+
+        cache_url = store.cache_url(url, kwargs.get('params'))
+        cache_ttl = store.ttl_for(cache_url)
+        if cache_ttl == 0:
+            return None, None, None
+        return store, cache_url, cache_ttl
+
+    def retry_after(self, response, default_sec):
+        """
+        Returns the number of seconds the server asked us to wait in the Retry-After header,
+        or default_sec if there is no usable header.
+        """
+        try:
+            return max(float(response.headers['Retry-After']), 0)
+        except (KeyError, TypeError, ValueError):
+            return default_sec
+
+    def parse_once(self, response, parser, key=None, copy_result=True):
+        """
+        Returns parser(response), reusing the stored result if this response object was already parsed
+        with the same parser and options, as happens when a conditional GET comes back 304 Not Modified.
+
+        :param response: A response returned by :py:meth:`request`.
+        :param parser: Function that takes the response and returns parsed data.
+        :param str key: Name for the parser, defaults to its __name__. Must be given for lambdas.
+        :param bool copy_result: If True (default), return a deep copy of a stored result,
+            so callers can modify it freely. Set to False for results that are only read, eg soups.
+        """
+        memo_key = (key or parser.__name__, repr(sorted(self.options.items())))
+        memo = getattr(response, 'parsed_results', None)
+        if memo is None:
+            memo = {}
+            response.parsed_results = memo
+
+        try:
+            result = memo[memo_key]
+        except KeyError:
+            result = parser(response)
+            memo[memo_key] = result
+            return copy.deepcopy(result) if copy_result else result
+
+        LOGGER.debug('%s: reusing %s for unmodified response' % (self.NAME, memo_key[0]))
+        return copy.deepcopy(result) if copy_result else result
+
+    def fetch_to_file(self, url, **kwargs):
+        """
+        Stream the response from a GET to this URL into a temporary file,
+        which stays in memory while it is under SPOOL_MAX_BYTES and moves to disk after that.
+        Returns the file, positioned at the start, or None if an error was encountered.
+        Any kwargs are passed to :py:meth:`request`.
+        Downloads are kept in the response cache when it is on, and cache hits are read straight from disk.
+        """
+        # serve from the response cache if we can
+        store, cache_url, cache_ttl = self._cache_for(url, 'get', kwargs)
+        if store is not None:
+            cached = store.open(cache_url)
+            if cached is not None:
+                LOGGER.debug('%s: download from cache for %s, %s' % (self.NAME, url, kwargs))
+                return cached
+
+        response = self.request(url, stream=True, **kwargs)
+        if not response:
+            # an error status still holds a pooled connection until its streamed body is closed
+            if response is not None:
+                response.close()
+            return None
+
+        spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+        try:
+            for chunk in response.iter_content(chunk_size=SPOOL_CHUNK_BYTES):
+                spool.write(chunk)
+        except (requests.exceptions.RequestException, IOError) as e:
+            LOGGER.error('%s: download failure for %s:\n%s' % (self.NAME, url, e))
+            spool.close()
+            return None
+        finally:
+            response.close()
+
+        spool.seek(0)
+        if store is not None and response.status_code == 200:
+            store.set_file(cache_url, response, spool, ttl=cache_ttl)
+        return spool
+
     def unzip(self, content):
         """
-        Unzip encoded data.
-        Returns the unzipped content as an array of strings, each representing one file's content
+        Unzip encoded data, either bytes or a file-like object such as the one returned by :py:meth:`fetch_to_file`.
+        Returns the unzipped content as a list-like ZipMembers, where each item is one file's content as bytes
+        and files are only decompressed when they are accessed,
         or returns None if an error was encountered.
         ***Previous behavior: Only returned the content from the first file***
         """
         # create zip file
-        try:
-            filecontent = BytesIO(content)
-        except TypeError:
-            filecontent = StringIO(content)
+        if hasattr(content, 'read'):
+            filecontent = content
+        else:
+            try:
+                filecontent = BytesIO(content)
+            except TypeError:
+                filecontent = StringIO(content)
 
         try:
             # have zipfile
@@ -318,12 +691,8 @@ class BaseClient(object):
             LOGGER.error('%s: unzip failure for content:\n%s' % (self.NAME, content))
             return None
 
-        # have unzipped content
-        unzipped = [z.read(thisfile) for thisfile in z.namelist()]
-        z.close()
-
-        # return
-        return unzipped
+        # return lazily unzipped content
+        return ZipMembers(z)
 
     def parse_to_df(self, filelike, mode='csv', header_names=None, sheet_names=None, **kwargs):
         """
@@ -387,6 +756,122 @@ class BaseClient(object):
 
         return df
 
+    def parse_html(self, content):
+        """
+        Parse an html page once, so that a timestamp and a table can both be pulled out of it.
+
+        :param content: string or bytes of html
+        :return: Root element of the page, or None if the page is empty.
+        """
+        if isinstance(content, bytes):
+            parser = lxml.html.HTMLParser(recover=True)
+        else:  # unicode, which may declare an encoding
+            content = content.encode('utf-8')
+            parser = lxml.html.HTMLParser(recover=True, encoding='utf-8')
+        return lxml.html.parse(BytesIO(content), parser=parser).getroot()
+
+    def html_table(self, doc, index=0, table_id=None, **kwargs):
+        """
+        Convert one table in a parsed html page to a DataFrame.
+
+        Gives the same DataFrame as pd.read_html(content, **kwargs)[index],
+        but only the one table is converted.
+
+        :param doc: Root element from parse_html.
+        :param int index: Position of the table among the tables on the page that contain text.
+        :param string table_id: If provided, use the table with this id instead.
+        :return: DataFrame, or None if there is no such table.
+        """
+        # find table
+        if doc is None:
+            return None
+        if table_id is not None:
+            tables = doc.xpath('//table[@id=$table_id]', table_id=table_id)
+        else:
+            tables = doc.xpath('//table[.//text()[re:test(., ".+")]]',
+                               namespaces={'re': 'http://exslt.org/regular-expressions'})
+        tables = [table for table in tables if not self._html_hidden(table)]
+        try:
+            table = tables[0 if table_id is not None else index]
+        except IndexError:
+            return None
+
+        # leave out styles and hidden elements, without changing doc
+        table = copy.deepcopy(table)
+        for elt in table.xpath('.//style') + [elt for elt in table.xpath('.//*[@style]') if self._html_hidden(elt)]:
+            if elt.getparent() is not None:
+                elt.drop_tree()
+
+        # get text of rows, with all-th rows at the top as the header if there is no thead
+        head_rows = []
+        for thead in table.xpath('.//thead'):
+            head_rows += thead.xpath('./tr')
+            if thead.xpath('./td|./th'):  # cells without a row
+                head_rows.append(thead)
+        body_rows = table.xpath('.//tbody//tr') + table.xpath('./tr')
+        if not head_rows:
+            while body_rows and all(cell.tag == 'th' for cell in body_rows[0].xpath('./td|./th')):
+                head_rows.append(body_rows.pop(0))
+        rows = self._html_row_texts(head_rows + body_rows + table.xpath('.//tfoot//tr'))
+        if not rows:
+            return pd.DataFrame()
+
+        # pad ragged rows
+        width = max(len(row) for row in rows)
+        rows = [row + [''] * (width - len(row)) for row in rows]
+
+        # use header rows as header
+        kwargs.setdefault('header', None)
+        if head_rows and kwargs['header'] is None:
+            if len(head_rows) == 1:
+                kwargs['header'] = 0
+            else:
+                kwargs['header'] = [i for i, row in enumerate(rows[:len(head_rows)]) if any(row)]
+
+        # convert
+        kwargs.setdefault('thousands', ',')
+        reader = TextParser(rows, **kwargs)
+        try:
+            return reader.read()
+        finally:
+            reader.close()
+
+    def _html_hidden(self, elt):
+        return 'display:none' in elt.get('style', '').replace(' ', '')
+
+    def _html_row_texts(self, rows):
+        """Returns a list of the cell texts in each row, repeating cells that span several columns or rows."""
+        row_texts = []
+        spans = []  # (column, text, rows left) for cells spanning down from earlier rows
+        for row in rows:
+            texts = []
+            next_spans = []
+            for cell in row.xpath('./td|./th'):
+                # cells spanning down from above that come before this one
+                while spans and spans[0][0] <= len(texts):
+                    col, text, rows_left = spans.pop(0)
+                    texts.append(text)
+                    if rows_left > 1:
+                        next_spans.append((col, text, rows_left - 1))
+
+                # this cell
+                text = WHITESPACE_RE.sub(' ', cell.text_content().strip())
+                rowspan = int(cell.get('rowspan') or 1)
+                for i in range(int(cell.get('colspan') or 1)):
+                    if rowspan > 1:
+                        next_spans.append((len(texts), text, rowspan - 1))
+                    texts.append(text)
+
+            # cells spanning down from above at the end of the row
+            for col, text, rows_left in spans:
+                texts.append(text)
+                if rows_left > 1:
+                    next_spans.append((col, text, rows_left - 1))
+
+            row_texts.append(texts)
+            spans = next_spans
+        return row_texts
+
     def utcify_index(self, local_index, tz_name=None, tz_col=None):
         """
         Convert a DateTimeIndex to UTC.
@@ -403,21 +888,25 @@ class BaseClient(object):
 
         # use tz col if given
         if tz_col is not None:
-            # it seems like we shouldn't have to iterate, but all the smart ways aren't working
-            aware_utc_list = []
-            for i in range(len(local_index)):
+            if len(local_index) == 0:
+                return pd.DatetimeIndex([], tz=pytz.utc)
+
+            # localize all the rows with the same tz label at once, eg all EST rows then all EDT rows
+            tz_labels = np.asarray(pd.Series(tz_col).astype(object).where(pd.notnull(tz_col), None))
+            pieces = []
+            for tz_label in pd.unique(tz_labels):
+                positions = np.flatnonzero(tz_labels == tz_label)
                 try:
-                    aware_local_ts = pytz.timezone(tz_col[i]).localize(local_index[i])
+                    pytz.timezone(tz_label)
+                    group_tz_name, group_is_dst = tz_label, None
                 except pytz.UnknownTimeZoneError:
-                    # fall back to local ts
-                    aware_local_ts = pytz.timezone(tz_name).localize(local_index[i])
-
-                # utcify
-                aware_utc_ts = self.utcify(aware_local_ts)
-                aware_utc_list.append(aware_utc_ts)
+                    # fall back to local ts, with repeated times in daylight time (eg for EDT)
+                    group_tz_name, group_is_dst = tz_name, True
+                group_index = self.utcify_many(local_index[positions], tz_name=group_tz_name, is_dst=group_is_dst)
+                pieces.append(pd.Series(group_index, index=positions))
 
-            # indexify
-            aware_utc_index = pd.DatetimeIndex(aware_utc_list)
+            # put the rows back in order and indexify
+            aware_utc_index = pd.DatetimeIndex(pd.concat(pieces).sort_index().values).tz_localize(pytz.utc)
 
         else:
             # localize
@@ -46,6 +46,8 @@ class BPAClient(BaseClient):
         pieces = []
         for url in request_urls:
             xd = self.fetch_xls(url)
+            if xd is None:
+                continue
             piece = self.parse_to_df(xd, mode='xls', sheet_names=xd.sheet_names,
                                      skiprows=18, parse_cols=cols,
                                      index_col=0, parse_dates=True,
@@ -53,6 +55,8 @@ class BPAClient(BaseClient):
             pieces.append(piece)
 
         # return
+        if len(pieces) == 0:
+            return pd.DataFrame()
         df = pd.concat(pieces)
         return df
 
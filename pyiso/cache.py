@@ -0,0 +1,418 @@
+"""
+On-disk cache of raw responses, shared by all clients in the process.
+
+Many files that pyiso fetches never change once they are published, like a daily report for a day in the past.
+Each URL is matched against RULES to decide how long its response may be reused:
+forever once the day, month or year that the URL is dated by has been over for SETTLE_DAYS,
+and for the rule's ttl seconds before that. URLs that match no rule are not cached.
+The cache is capped at max_bytes, evicting the least recently used responses first.
+
+Caching is off unless a directory is configured, either with :py:func:`configure`
+or with the PYISO_CACHE_DIR environment variable (and optionally PYISO_CACHE_MAX_BYTES).
+
+Separately, the last response from each URL that sent an ETag or Last-Modified header is kept in memory
+in :py:data:`conditional`, so that polling an unchanged page costs a 304 instead of a download and a parse.
+"""
+from collections import OrderedDict
+from collections import namedtuple
+from io import BytesIO
+from datetime import datetime, date, timedelta
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+from threading import Lock
+import time
+import zipfile
+import requests
+from requests.structures import CaseInsensitiveDict
+from pyiso import LOGGER
+
+
+# a URL matching pattern is dated by the 'date' group, parsed with date_format.
+# once the period ('day', 'month' or 'year') containing that date has been over for SETTLE_DAYS
+# the response never expires, before that (or if period is None) it expires after ttl seconds.
+# if check is given, a response is only stored if check(body_file) is True.
+CacheRule = namedtuple('CacheRule', ['pattern', 'date_format', 'period', 'ttl', 'check'])
+CacheRule.__new__.__defaults__ = (None,)
+
+# an XML error element in an OASIS report, like <m:ERROR>
+OASIS_ERROR_RE = re.compile(br'<(\w+:)?ERROR[\s>]')
+
+
+def oasis_report_ok(body_file):
+    """
+    Returns True if body_file is a zip of one or more non-empty reports without an error element.
+    OASIS sends error reports, eg for an invalid date range, as zips with status 200, and they shouldn't be kept.
+    """
+    n_bytes = 0
+    try:
+        with zipfile.ZipFile(body_file) as zf:
+            for name in zf.namelist():
+                with zf.open(name) as f:
+                    # keep the end of the last chunk in case an element is split between chunks
+                    tail = b''
+                    for chunk in iter(lambda: f.read(64 * 1024), b''):
+                        if OASIS_ERROR_RE.search(tail + chunk):
+                            return False
+                        n_bytes += len(chunk)
+                        tail = chunk[-16:]
+    except (zipfile.BadZipfile, zipfile.LargeZipFile, IOError):
+        return False
+    return n_bytes > 0
+
+
+RULES = [
+    # NYISO daily csvs and monthly zips
+    CacheRule(r'mis\.nyiso\.com/public/csv/\w+/(?P<date>\d{8})\w+\.csv$', '%Y%m%d', 'day', 300),
+    CacheRule(r'mis\.nyiso\.com/public/csv/\w+/(?P<date>\d{8})\w+_csv\.zip$', '%Y%m%d', 'month', 3600),
+    # MISO daily market reports; preliminary reports are replaced, so don't keep them
+    CacheRule(r'misoenergy\.org/Library/Repository/Market%20Reports/(?P<date>\d{8})_(da_expost_lmp|da_exante_lmp|rt_lmp_final)\.csv$', '%Y%m%d', 'day', 3600),
+    CacheRule(r'misoenergy\.org/Library/Repository/Market%20Reports/(?P<date>\d{8})_da_ex\.xls$', '%Y%m%d', 'day', 3600),
+    # CAISO daily renewables reports and OASIS queries for past windows
+    CacheRule(r'content\.caiso\.com/green/renewrpt/(?P<date>\d{8})_DailyRenewablesWatch\.txt$', '%Y%m%d', 'day', 3600),
+    CacheRule(r'oasis\.caiso\.com/oasisapi/SingleZip\?.*enddatetime=(?P<date>\d{8})T', '%Y%m%d', 'day', 60,
+              oasis_report_ok),
+    # BPA and PJM yearly spreadsheets
+    CacheRule(r'transmission\.bpa\.gov/.*/WindGenTotalLoadYTD_(?P<date>\d{4})\.xls$', '%Y', 'year', 3600),
+    CacheRule(r'pjm\.com/pub/operations/hist-meter-load/(?P<date>\d{4})-hourly-loads\.xls$', '%Y', 'year', 3600),
+    # NVEnergy monthly tables
+    CacheRule(r'oasis\.oati\.com/.*/Monthly_Ties_and_Loads_L_from_(?P<date>\d\d_\d\d_\d{4})_to_', '%m_%d_%Y', 'month', 3600),
+    # ISONE daily endpoints
+    CacheRule(r'webservices\.iso-ne\.com/api/v1\.1/.*/day/(?P<date>\d{8})', '%Y%m%d', 'day', 300),
+    # "current" pages that are polled, only reused for a few seconds
+    CacheRule(r'content\.caiso\.com/outlook/', None, None, 30),
+    CacheRule(r'ercot\.com/content/cdr/html/real_time_system_conditions\.html', None, None, 30),
+    CacheRule(r'misoenergy\.org/ria/FuelMix\.aspx', None, None, 30),
+    CacheRule(r'datasnapshot\.pjm\.com/content/', None, None, 30),
+]
+
+# days after the end of a dated period before its files are assumed final
+SETTLE_DAYS = 2
+
+# default size cap
+MAX_BYTES = 2 * 1024 ** 3
+
+
+def cache_url(url, params=None):
+    """Returns the full URL that a GET with these params would request."""
+    try:
+        return requests.Request('GET', url, params=params).prepare().url
+    except requests.exceptions.RequestException:
+        # not a URL we can prepare, so the request will fail anyway
+        return url
+
+
+def response_meta(url, response):
+    """Returns a json-serializable dict of everything but the body needed to rebuild this response."""
+    return {
+        'url': url,
+        'status_code': response.status_code,
+        'reason': response.reason,
+        'headers': dict(response.headers),
+        'encoding': response.encoding,
+    }
+
+
+def build_response(meta, body):
+    """Returns a requests.Response rebuilt from a dict made by response_meta and the body bytes."""
+    response = requests.Response()
+    response.status_code = meta['status_code']
+    response.reason = meta.get('reason')
+    response.headers = CaseInsensitiveDict(meta['headers'])
+    response.url = meta['url']
+    response.encoding = meta['encoding']
+    response._content = body
+    response._content_consumed = True
+    return response
+
+
+def write_atomic(path, content, mode):
+    """
+    Write content (a string, bytes or file-like object) to path by writing a temporary file and renaming it,
+    so readers never see a partial file.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+    with os.fdopen(fd, mode) as f:
+        if hasattr(content, 'read'):
+            shutil.copyfileobj(content, f)
+        else:
+            f.write(content)
+    getattr(os, 'replace', os.rename)(tmp_path, path)
+
+
+class ResponseCache(object):
+    """
+    Cache of successful GET responses in a directory on disk.
+    Each response is stored as a body file and a json metadata file, named by a hash of the URL.
+    """
+    def __init__(self, directory, max_bytes=MAX_BYTES, rules=None):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.rules = [(re.compile(rule.pattern), rule) for rule in (RULES if rules is None else rules)]
+        self.lock = Lock()
+        self._total_bytes = None
+
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    def cache_url(self, url, params=None):
+        """Returns the full URL that a GET with these params would request."""
+        return cache_url(url, params)
+
+    def ttl_for(self, url, today=None):
+        """
+        Returns the number of seconds a response from this URL can be reused,
+        None if it can be reused forever, or 0 if it should not be cached.
+        """
+        if today is None:
+            today = datetime.utcnow().date()
+
+        match, rule = self._match(url)
+        if rule is None:
+            return 0
+
+        if rule.period is None:
+            return rule.ttl
+
+        # is the dated period over?
+        try:
+            start = datetime.strptime(match.group('date'), rule.date_format).date()
+        except ValueError:
+            return rule.ttl
+        if rule.period == 'day':
+            end = start + timedelta(days=1)
+        elif rule.period == 'month':
+            end = date(start.year + start.month // 12, start.month % 12 + 1, 1)
+        else:
+            end = date(start.year + 1, 1, 1)
+
+        if end + timedelta(days=SETTLE_DAYS) <= today:
+            return None
+        return rule.ttl
+
+    def _match(self, url):
+        """Returns the match and the first rule that matches this URL, or (None, None)."""
+        for regex, rule in self.rules:
+            match = regex.search(url)
+            if match:
+                return match, rule
+        return None, None
+
+    def _paths(self, url):
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        subdir = os.path.join(self.directory, key[:2])
+        return subdir, os.path.join(subdir, key + '.json'), os.path.join(subdir, key + '.body')
+
+    def _open(self, url):
+        """Returns the metadata and open body file for a fresh entry for this URL, or (None, None)."""
+        subdir, meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+            if meta['expires'] is not None and meta['expires'] < time.time():
+                return None, None
+            body_file = open(body_path, 'rb')
+        except (IOError, OSError, ValueError, KeyError):
+            return None, None
+
+        # mark as recently used
+        try:
+            os.utime(body_path, None)
+        except OSError:
+            pass
+
+        return meta, body_file
+
+    def get(self, url):
+        """Returns a cached requests.Response for this URL, or None if there is no fresh entry."""
+        meta, body_file = self._open(url)
+        if meta is None:
+            return None
+        with body_file:
+            body = body_file.read()
+
+        response = build_response(meta, body)
+        response.from_cache = True
+        return response
+
+    def open(self, url):
+        """Returns the cached body for this URL as an open binary file, or None if there is no fresh entry."""
+        return self._open(url)[1]
+
+    def set(self, url, response, ttl=None):
+        """Store a response for this URL, for ttl seconds or forever if ttl is None."""
+        self.set_file(url, response, BytesIO(response.content), ttl=ttl)
+
+    def set_file(self, url, response, body_file, ttl=None):
+        """
+        Store a response for this URL with its body read from body_file, eg a streamed download,
+        for ttl seconds or forever if ttl is None. The file is left positioned at its start.
+        """
+        # some sources send errors with a 200
+        match, rule = self._match(url)
+        if rule is not None and rule.check is not None:
+            body_file.seek(0)
+            ok = rule.check(body_file)
+            body_file.seek(0)
+            if not ok:
+                LOGGER.debug('Not caching response for %s, which failed its check' % url)
+                return
+
+        subdir, meta_path, body_path = self._paths(url)
+        meta = response_meta(url, response)
+        meta['expires'] = None if ttl is None else time.time() + ttl
+
+        try:
+            if not os.path.isdir(subdir):
+                os.makedirs(subdir)
+            body_file.seek(0)
+            write_atomic(body_path, body_file, 'wb')
+            write_atomic(meta_path, json.dumps(meta), 'w')
+            size = os.path.getsize(body_path)
+        except (IOError, OSError) as e:
+            LOGGER.warn('Could not cache response for %s: %s' % (url, e))
+            return
+        finally:
+            body_file.seek(0)
+
+        with self.lock:
+            if self._total_bytes is not None:
+                self._total_bytes += size
+        self.evict()
+
+    def _entries(self):
+        """Returns a list of (last used time, size, body path) for every cached body."""
+        entries = []
+        for dirpath, dirnames, filenames in os.walk(self.directory):
+            for filename in filenames:
+                if filename.endswith('.body'):
+                    path = os.path.join(dirpath, filename)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def evict(self):
+        """Delete least recently used entries until the cache is under max_bytes."""
+        with self.lock:
+            if self._total_bytes is None:
+                self._total_bytes = sum(size for mtime, size, path in self._entries())
+            if self._total_bytes <= self.max_bytes:
+                return
+
+            # leave some headroom so we don't scan on every write
+            target = 0.9 * self.max_bytes
+            entries = sorted(self._entries())
+            total = sum(size for mtime, size, path in entries)
+            for mtime, size, body_path in entries:
+                if total <= target:
+                    break
+                for path in [body_path, body_path[:-len('.body')] + '.json']:
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+                total -= size
+            self._total_bytes = total
+
+    def clear(self):
+        """Delete every cached response."""
+        with self.lock:
+            for mtime, size, body_path in self._entries():
+                for path in [body_path, body_path[:-len('.body')] + '.json']:
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+            self._total_bytes = 0
+
+
+class ConditionalStore(object):
+    """
+    In-memory store of the last response from each URL that had an ETag or Last-Modified header,
+    for making conditional GETs. Holds at most max_entries responses, dropping the least recently used.
+    """
+    def __init__(self, max_entries=64, max_entry_bytes=5 * 1024 ** 2):
+        self.max_entries = max_entries
+        self.max_entry_bytes = max_entry_bytes
+        self.responses = OrderedDict()
+        self.lock = Lock()
+
+    def headers_for(self, url):
+        """Returns If-None-Match and If-Modified-Since headers for this URL, or an empty dict."""
+        with self.lock:
+            response = self.responses.get(url)
+        if response is None:
+            return {}
+
+        headers = {}
+        if response.headers.get('ETag'):
+            headers['If-None-Match'] = response.headers['ETag']
+        if response.headers.get('Last-Modified'):
+            headers['If-Modified-Since'] = response.headers['Last-Modified']
+        return headers
+
+    def get(self, url):
+        """Returns the stored response for this URL, or None."""
+        with self.lock:
+            response = self.responses.pop(url, None)
+            if response is not None:
+                self.responses[url] = response
+            return response
+
+    def set(self, url, response):
+        """Store this response if it has validators and isn't too big."""
+        if not (response.headers.get('ETag') or response.headers.get('Last-Modified')):
+            return
+        if len(response.content) > self.max_entry_bytes:
+            return
+
+        with self.lock:
+            self.responses.pop(url, None)
+            self.responses[url] = response
+            while len(self.responses) > self.max_entries:
+                self.responses.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.responses.clear()
+
+
+# shared by all clients in the process
+conditional = ConditionalStore()
+
+_cache = None
+_configured = False
+
+
+def configure(directory, max_bytes=MAX_BYTES, rules=None):
+    """
+    Turn on the response cache for all clients in this process.
+
+    :param str directory: Directory to keep cached responses in. If None, turn the cache off.
+    :param int max_bytes: Size cap, least recently used responses are evicted beyond this.
+    :param list rules: List of CacheRule to use instead of the default RULES.
+    """
+    global _cache, _configured
+    if directory is None:
+        _cache = None
+    else:
+        _cache = ResponseCache(directory, max_bytes=max_bytes, rules=rules)
+    _configured = True
+    return _cache
+
+
+def get_cache():
+    """Returns the configured ResponseCache, or None if caching is off."""
+    global _configured
+    if not _configured:
+        directory = os.environ.get('PYISO_CACHE_DIR')
+        if directory:
+            configure(directory, max_bytes=int(os.environ.get('PYISO_CACHE_MAX_BYTES', MAX_BYTES)))
+        _configured = True
+    return _cache
@@ -1,9 +1,10 @@
 from datetime import datetime, timedelta, time
 from pyiso.base import BaseClient
-from pyiso import LOGGER
+from pyiso import LOGGER, parallel
 import copy
 import re
 from bs4 import BeautifulSoup
+from lxml import etree
 from io import BytesIO, StringIO
 import pandas as pd
 import pytz
@@ -106,8 +107,8 @@ class CAISOClient(BaseClient):
                             start_at=start_at, end_at=end_at, **kwargs)
 
         # construct and execute OASIS request
-        payload = self.construct_oasis_payload('SLD_FCST')
-        oasis_data = self.fetch_oasis(payload=payload)
+        payload = self.construct_oasis_payload('SLD_FCST', resultformat=6)
+        oasis_data = self.fetch_oasis_frame(payload=payload)
 
         # parse data
         parsed_data = self.parse_oasis_demand_forecast(oasis_data)
@@ -138,8 +139,8 @@ class CAISOClient(BaseClient):
                             start_at=start_at, end_at=end_at, **kwargs)
 
         # construct and execute OASIS request
-        payload = self.construct_oasis_payload('ENE_SLRS')
-        oasis_data = self.fetch_oasis(payload=payload)
+        payload = self.construct_oasis_payload('ENE_SLRS', resultformat=6)
+        oasis_data = self.fetch_oasis_frame(payload=payload)
 
         # parse data
         parsed_data = self.parse_oasis_slrs(oasis_data)
@@ -459,54 +460,70 @@ class CAISOClient(BaseClient):
         return df
 
     def _generation_historical(self):
-        # set up storage
-        parsed_data = []
-
-        # collect data
+        # set up dates
+        dates = []
         this_date = self.options['start_at'].date()
         while this_date <= self.options['end_at'].date():
-            # set up request
-            url_file = this_date.strftime('%Y%m%d_DailyRenewablesWatch.txt')
-            url = self.base_url_gen + url_file
-
-            # carry out request
-            response = self.request(url)
-            if not response:
-                this_date += timedelta(days=1)
-                continue
+            dates.append(this_date)
+            this_date += timedelta(days=1)
 
-            # process both halves of page
-            for header in [1, 27]:
-                df = self.parse_to_df(response.text,
-                                      nrows=24, header=header,
-                                      delimiter='\t+')
+        # fetch several days at once and parse them, keeping them in date order
+        parsed_data = []
+        for day_data in parallel.imap_pipeline(self._fetch_daily_renewables, self._parse_daily_renewables, dates,
+                                               max_workers=self.max_workers, parse_processes=self.parse_processes):
+            parsed_data += day_data
 
-                # combine date with hours to index
-                indexed = self.set_dt_index(df, this_date, df['Hour'])
+        # return
+        return parsed_data
 
-                # original header is fuel names
-                indexed.rename(columns=self.fuels, inplace=True)
+    def _fetch_daily_renewables(self, this_date):
+        """Returns the text of the daily renewables report for this date, or None if an error was encountered."""
+        # set up request
+        url_file = this_date.strftime('%Y%m%d_DailyRenewablesWatch.txt')
+        url = self.base_url_gen + url_file
 
-                # remove non-fuel cols
-                fuel_cols = list(set(self.fuels.values()) & set(indexed.columns))
-                subsetted = indexed[fuel_cols]
+        # carry out request
+        response = self.request(url)
+        if not response:
+            return None
+        return response.text
 
-                # pivot
-                pivoted = self.unpivot(subsetted)
-                pivoted.rename(columns={'level_1': 'fuel_name', 0: 'gen_MW'}, inplace=True)
+    def _parse_daily_renewables(self, this_date, text):
+        """Returns a list of generation dicts from the text of the daily renewables report for this date."""
+        # set up storage
+        parsed_data = []
+        if text is None:
+            return parsed_data
 
-                # slice times
-                sliced = self.slice_times(pivoted)
+        # process both halves of page
+        for header in [1, 27]:
+            df = self.parse_to_df(text,
+                                  nrows=24, header=header,
+                                  delimiter='\t+')
 
-                # store
-                parsed_data += self.serialize(sliced,
-                                      header=['timestamp', 'fuel_name', 'gen_MW'],
-                                      extras={'ba_name': self.NAME,
-                                              'market': self.MARKET_CHOICES.hourly,
-                                              'freq': self.FREQUENCY_CHOICES.hourly})
+            # combine date with hours to index
+            indexed = self.set_dt_index(df, this_date, df['Hour'])
 
-            # finish day
-            this_date += timedelta(days=1)
+            # original header is fuel names
+            indexed.rename(columns=self.fuels, inplace=True)
+
+            # remove non-fuel cols
+            fuel_cols = list(set(self.fuels.values()) & set(indexed.columns))
+            subsetted = indexed[fuel_cols]
+
+            # pivot
+            pivoted = self.unpivot(subsetted)
+            pivoted.rename(columns={'level_1': 'fuel_name', 0: 'gen_MW'}, inplace=True)
+
+            # slice times
+            sliced = self.slice_times(pivoted)
+
+            # store
+            parsed_data += self.serialize(sliced,
+                                  header=['timestamp', 'fuel_name', 'gen_MW'],
+                                  extras={'ba_name': self.NAME,
+                                          'market': self.MARKET_CHOICES.hourly,
+                                          'freq': self.FREQUENCY_CHOICES.hourly})
 
         # return
         return parsed_data
@@ -530,13 +547,13 @@ class CAISOClient(BaseClient):
             default_return_val = ''
 
         # try get
-        response = self.request(self.base_url_oasis, params=payload)
-        if not response:
+        zipped = self.fetch_to_file(self.base_url_oasis, params=payload)
+        if not zipped:
             return default_return_val
 
         # read data from zip
-        # This will be an array of content if successful, and None if unsuccessful
-        content = self.unzip(response.content)
+        # This will be a list-like of content if successful, and None if unsuccessful
+        content = self.unzip(zipped)
         if not content:
             return default_return_val
 
@@ -565,28 +582,166 @@ class CAISOClient(BaseClient):
                 raw_data = soup.find_all(['REPORT_DATA', 'report_data'])
                 return raw_data
 
+    def fetch_oasis_frame(self, payload={}):
+        """
+        Returns a DataFrame of the report data in an OASIS report (see parse_oasis_xml and parse_oasis_csv),
+        which is empty if an error was encountered.
+
+        Unlike fetch_oasis, the report is streamed out of the zip instead of being loaded into BeautifulSoup,
+        so parsing is much faster and memory use doesn't grow with the size of the report.
+        Request CSV reports (resultformat=6) where possible, since they are smaller and faster to parse.
+        """
+        # try get
+        zipped = self.fetch_to_file(self.base_url_oasis, params=payload)
+        if not zipped:
+            return self.oasis_frame([])
+
+        # stream the first file in the zip,
+        # which is an XML error report instead of the CSV one if the request failed
+        content = self.unzip(zipped)
+        if not content:
+            return self.oasis_frame([])
+        try:
+            if content.names[0].lower().endswith('.csv'):
+                df = self.parse_oasis_csv(content.open(0))
+            else:
+                df = self.parse_oasis_xml(content.open(0))
+        finally:
+            content.close()
+
+        if df is None:
+            LOGGER.error('Bad report for CAISO OASIS with payload %s' % payload)
+            return self.oasis_frame([])
+        return df
+
+    # report data fields that are kept, by OASIS tag name
+    oasis_fields = {
+        'DATA_ITEM': 'data_item',
+        'RESOURCE_NAME': 'resource_name',
+        'RENEWABLE_TYPE': 'renewable_type',
+        'INTERVAL_START_GMT': 'timestamp',
+        'VALUE': 'value',
+    }
+
+    def parse_oasis_xml(self, filelike):
+        """
+        Parse an OASIS XML report from a file-like object, one report data element at a time.
+        Returns a DataFrame with a row for each element and a column for each of oasis_fields,
+        or None if the report is an error or isn't valid XML.
+        """
+        columns = dict((name, []) for name in self.oasis_fields.values())
+
+        try:
+            # recover from markup errors like BeautifulSoup does, rather than losing the whole report
+            for event, elem in etree.iterparse(filelike, events=('end',), recover=True,
+                                               tag=('{*}REPORT_DATA', '{*}report_data', '{*}ERROR', '{*}error')):
+                # fields, by upper case tag name without namespace
+                values = dict((child.tag.rpartition('}')[2].upper(), child.text) for child in elem)
+
+                # check for errors
+                if elem.tag.rpartition('}')[2].upper() == 'ERROR':
+                    LOGGER.error('XML error for CAISO OASIS: %s %s' % (values.get('ERR_CODE'), values.get('ERR_DESC')))
+                    return None
+
+                for tag, name in self.oasis_fields.items():
+                    columns[name].append(values.get(tag))
+
+                # throw away elements once they're read, so the tree never holds more than one
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+        except etree.XMLSyntaxError as e:
+            LOGGER.error('Could not parse CAISO OASIS XML: %s' % e)
+            return None
+
+        return self._oasis_frame_from_columns(columns)
+
+    # CSV report columns for each of oasis_fields, in order of preference
+    oasis_csv_columns = {
+        'data_item': ['XML_DATA_ITEM', 'DATA_ITEM'],
+        'resource_name': ['TAC_AREA_NAME', 'TAC_ZONE_NAME', 'RESOURCE_NAME'],
+        'renewable_type': ['RENEWABLE_TYPE'],
+        'timestamp': ['INTERVALSTARTTIME_GMT', 'INTERVAL_START_GMT'],
+        'value': ['MW', 'VALUE'],
+    }
+
+    def parse_oasis_csv(self, filelike):
+        """
+        Parse an OASIS CSV report from a file-like object.
+        Returns a DataFrame like parse_oasis_xml, or None if the report can't be read
+        or doesn't have data item, timestamp and value columns.
+        """
+        wanted = set(col for cols in self.oasis_csv_columns.values() for col in cols)
+        try:
+            raw = pd.read_csv(filelike, usecols=lambda col: col in wanted, dtype=str)
+        except (ValueError, pd.errors.ParserError) as e:
+            LOGGER.error('Could not parse CAISO OASIS CSV: %s' % e)
+            return None
+
+        # pick a report column for each field, if there is one
+        columns = {}
+        for name, csv_cols in self.oasis_csv_columns.items():
+            present = [col for col in csv_cols if col in raw.columns]
+            if present:
+                columns[name] = raw[present[0]]
+            elif name in ['data_item', 'timestamp', 'value']:
+                LOGGER.error('CAISO OASIS CSV has no %s column: %s' % (name, list(raw.columns)))
+                return None
+            else:
+                columns[name] = [None] * len(raw)
+
+        return self._oasis_frame_from_columns(columns)
+
+    def oasis_frame(self, raw_data):
+        """
+        Returns a DataFrame like parse_oasis_xml for the raw data output of fetch_oasis
+        (a list of report data soups), or raw_data itself if it is already a DataFrame.
+        """
+        if isinstance(raw_data, pd.DataFrame):
+            return raw_data
+
+        columns = dict((name, []) for name in self.oasis_fields.values())
+        for raw_soup_dp in raw_data:
+            for tag, name in self.oasis_fields.items():
+                found = raw_soup_dp.find([tag, tag.lower()])
+                columns[name].append(found.string if found else None)
+
+        return self._oasis_frame_from_columns(columns)
+
+    def _oasis_frame_from_columns(self, columns):
+        df = pd.DataFrame({
+            'data_item': columns['data_item'],
+            'resource_name': columns['resource_name'],
+            'renewable_type': columns['renewable_type'],
+        }, columns=['data_item', 'resource_name', 'renewable_type'])
+
+        # convert all timestamps and values at once, rather than row by row
+        df['timestamp'] = self.utcify_many(pd.Series(columns['timestamp'], dtype=object), tz_name='UTC')
+        df['value'] = pd.to_numeric(pd.Series(columns['value'], dtype=object), errors='coerce')
+        return df
+
+    def _oasis_timestamps(self, df):
+        """Returns the timestamp column of an OASIS DataFrame as a list of UTC datetimes."""
+        return list(pd.DatetimeIndex(df['timestamp']).to_pydatetime())
+
     def parse_oasis_renewable(self, raw_data):
-        """Parse raw data output of fetch_oasis for renewables."""
+        """Parse raw data output of fetch_oasis or fetch_oasis_frame for renewables."""
         # set up storage
         preparsed_data = {}
         parsed_data = []
 
-        # extract values from xml
-
-        for raw_soup_dp in raw_data:
+        # extract values from report data
+        df = self.oasis_frame(raw_data)
+        for ts, fuel_name, gen_MW in zip(self._oasis_timestamps(df), df['renewable_type'], df['value'].tolist()):
             # set up storage for timestamp
-            ts = self.utcify(raw_soup_dp.find(['INTERVAL_START_GMT', 'interval_start_gmt']).string)
             if ts not in preparsed_data:
                 preparsed_data[ts] = {'wind': 0, 'solar': 0}
 
             # store generation value
-            try:
-                fuel_name = raw_soup_dp.find(['RENEWABLE_TYPE', 'renewable_type']).string.lower()
-                gen_MW = float(raw_soup_dp.find(['VALUE', 'value']).string)
-                preparsed_data[ts][fuel_name] += gen_MW
-            except TypeError:
-                LOGGER.error('Error in schema for CAISO OASIS result %s' % raw_soup_dp.prettify())
+            if pd.isnull(fuel_name) or pd.isnull(gen_MW):
+                LOGGER.error('Error in schema for CAISO OASIS result at %s' % ts)
                 continue
+            preparsed_data[ts][fuel_name.lower()] += gen_MW
 
         # collect values into dps
         freq = self.options.get('freq', self.FREQUENCY_CHOICES.hourly)
@@ -610,7 +765,7 @@ class CAISOClient(BaseClient):
         return parsed_data
 
     def parse_oasis_slrs(self, raw_data):
-        """Parse raw data output of fetch_oasis for System Load and Resource Schedules."""
+        """Parse raw data output of fetch_oasis or fetch_oasis_frame for System Load and Resource Schedules."""
         # set strings to search on
         if self.options['data'] == 'gen':
             data_items = ['ISO_TOT_GEN_MW']
@@ -629,24 +784,16 @@ class CAISOClient(BaseClient):
         extracted_data = {}
         parsed_data = []
 
-        # extract values from xml
-        for raw_soup_dp in raw_data:
-            data_item = raw_soup_dp.find(['DATA_ITEM', 'data_item']).string
-            if data_item in data_items:
-                # parse timestamp
-                ts = self.utcify(raw_soup_dp.find(['INTERVAL_START_GMT', 'interval_start_gmt']).string)
-
-                # parse val
-                if data_item == 'ISO_TOT_IMP_MW':
-                    val = -float(raw_soup_dp.find(['VALUE', 'value']).string)
-                else:
-                    val = float(raw_soup_dp.find(['VALUE', 'value']).string)
-
-                # add to storage
-                try:
-                    extracted_data[ts] += val
-                except KeyError:
-                    extracted_data[ts] = val
+        # extract values from report data, with imports negative
+        df = self.oasis_frame(raw_data)
+        df = df[df['data_item'].isin(data_items)]
+        vals = df['value'].where(df['data_item'] != 'ISO_TOT_IMP_MW', -df['value'])
+        for ts, val in zip(self._oasis_timestamps(df), vals.tolist()):
+            # add to storage
+            try:
+                extracted_data[ts] += val
+            except KeyError:
+                extracted_data[ts] = val
 
         # assemble data
         for ts in sorted(extracted_data.keys()):
@@ -662,7 +809,7 @@ class CAISOClient(BaseClient):
         return parsed_data
 
     def parse_oasis_demand_forecast(self, raw_data):
-        """Parse raw data output of fetch_oasis for system-wide 5-min RTM demand forecast."""
+        """Parse raw data output of fetch_oasis or fetch_oasis_frame for system-wide 5-min RTM demand forecast."""
         # set up storage
         parsed_data = []
 
@@ -674,23 +821,19 @@ class CAISOClient(BaseClient):
         else:
             data_item_key = 'SYS_FCST_5MIN_MW'
 
-        # extract values from xml
-        for raw_soup_dp in raw_data:
-            if raw_soup_dp.find(['DATA_ITEM', 'data_item']).string == data_item_key and \
-                    raw_soup_dp.find(['RESOURCE_NAME', 'resource_name']).string == 'CA ISO-TAC':
-
-                # parse timestamp
-                ts = self.utcify(raw_soup_dp.find(['INTERVAL_START_GMT', 'interval_start_gmt']).string)
-
-                # set up base
-                parsed_dp = {'timestamp': ts,
-                             'freq': freq,
-                             'market': market,
-                             'ba_name': self.NAME}
+        # extract values from report data
+        df = self.oasis_frame(raw_data)
+        df = df[(df['data_item'] == data_item_key) & (df['resource_name'] == 'CA ISO-TAC')]
+        for ts, load_MW in zip(self._oasis_timestamps(df), df['value'].tolist()):
+            # set up base
+            parsed_dp = {'timestamp': ts,
+                         'freq': freq,
+                         'market': market,
+                         'ba_name': self.NAME}
 
-                # store generation value
-                parsed_dp['load_MW'] = float(raw_soup_dp.find(['VALUE', 'value']).string)
-                parsed_data.append(parsed_dp)
+            # store load value
+            parsed_dp['load_MW'] = load_MW
+            parsed_data.append(parsed_dp)
 
         # return
         return parsed_data
@@ -708,11 +851,13 @@ class CAISOClient(BaseClient):
     def fetch_todays_outlook_renewables(self):
         # get renewables data
         response = self.request(self.base_url_outlook+'renewables.html')
-        try:
-            return BeautifulSoup(response.content, 'lxml')
-        except AttributeError:
+        if response is None:
             LOGGER.warn('No response for CAISO today outlook renewables')
             return None
+        return self.parse_once(response, self._outlook_soup, copy_result=False)
+
+    def _outlook_soup(self, response):
+        return BeautifulSoup(response.content, 'lxml')
 
     def parse_todays_outlook_renewables(self, soup, ts):
         # set up storage
@@ -766,7 +911,7 @@ class CAISOClient(BaseClient):
         response = self.request(self.base_url_outlook+'systemconditions.html')
         ts = None
         if response:
-            demand_soup = BeautifulSoup(response.content, 'lxml')
+            demand_soup = self.parse_once(response, self._outlook_soup, copy_result=False)
             ts = self.todays_outlook_time(demand_soup)
 
         parsed_data += self.parse_todays_outlook_renewables(soup, ts)
@@ -776,8 +921,8 @@ class CAISOClient(BaseClient):
         ts = parsed_data[0]['timestamp']
 
         # get OASIS total gen data
-        payload = self.construct_oasis_payload(queryname='ENE_SLRS', schedule='ALL')
-        oasis_data = self.fetch_oasis(payload=payload)
+        payload = self.construct_oasis_payload(queryname='ENE_SLRS', schedule='ALL', resultformat=6)
+        oasis_data = self.fetch_oasis_frame(payload=payload)
 
         # parse OASIS data
         for dp in self.parse_oasis_slrs(oasis_data):
@@ -795,13 +940,13 @@ class CAISOClient(BaseClient):
         parsed_data = []
 
         # get OASIS total gen data
-        gen_payload = self.construct_oasis_payload(queryname='ENE_SLRS', schedule='ALL')
-        gen_oasis_data = self.fetch_oasis(payload=gen_payload)
+        gen_payload = self.construct_oasis_payload(queryname='ENE_SLRS', schedule='ALL', resultformat=6)
+        gen_oasis_data = self.fetch_oasis_frame(payload=gen_payload)
         gen_dps = self.parse_oasis_slrs(gen_oasis_data)
 
         # get OASIS renewable gen data
-        ren_payload = self.construct_oasis_payload(queryname='SLD_REN_FCST')
-        ren_oasis_data = self.fetch_oasis(payload=ren_payload)
+        ren_payload = self.construct_oasis_payload(queryname='SLD_REN_FCST', resultformat=6)
+        ren_oasis_data = self.fetch_oasis_frame(payload=ren_payload)
         ren_dps = self.parse_oasis_renewable(ren_oasis_data)
 
         # set of times with both gen and renewable data
@@ -0,0 +1,124 @@
+"""
+Record and replay of HTTP traffic, shared by all clients in the process.
+
+In record mode, the response to every :py:meth:`BaseClient.request` call (including spreadsheet downloads)
+is written to a cassette directory. In replay mode, those calls are answered from the cassette without
+touching the network, so parsing can be profiled or tested on real payloads repeatably and offline.
+
+Each recorded response is stored as a json metadata file and a body file,
+named by a hash of the request method, full URL (including params) and request body.
+The metadata file also holds the request, so a cassette can be read or edited by hand.
+
+Recording and replay are off unless a directory is configured, either with :py:func:`configure`
+or with the PYISO_CASSETTE_DIR environment variable (and PYISO_CASSETTE_MODE, 'replay' by default).
+"""
+import hashlib
+import json
+import os
+import requests
+from pyiso import LOGGER, cache
+
+
+RECORD = 'record'
+REPLAY = 'replay'
+
+
+def request_for(mode, url, kwargs):
+    """Returns the method, full URL and body of the request that these request args would make."""
+    try:
+        prepared = requests.Request(mode.upper(), url, params=kwargs.get('params'),
+                                    data=kwargs.get('data'), json=kwargs.get('json')).prepare()
+    except requests.exceptions.RequestException:
+        # not a URL we can prepare, so the request will fail anyway
+        return mode.upper(), url, None
+    body = prepared.body
+    if body is not None and not isinstance(body, bytes):
+        body = body.encode('utf-8')
+    return prepared.method, prepared.url, body
+
+
+class Cassette(object):
+    """Directory of recorded responses, in either RECORD or REPLAY mode."""
+    def __init__(self, directory, mode=REPLAY):
+        if mode not in [RECORD, REPLAY]:
+            raise ValueError('Invalid cassette mode %s' % mode)
+        self.directory = directory
+        self.mode = mode
+
+        if mode == RECORD and not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    @property
+    def replaying(self):
+        return self.mode == REPLAY
+
+    def _paths(self, method, url, body):
+        key = hashlib.sha1(method.encode('utf-8') + b' ' + url.encode('utf-8') + b'\n' + (body or b'')).hexdigest()
+        return os.path.join(self.directory, key + '.json'), os.path.join(self.directory, key + '.body')
+
+    def play(self, mode, url, kwargs=None):
+        """Returns the recorded requests.Response for this request, or None if there is no recording."""
+        method, full_url, body = request_for(mode, url, kwargs or {})
+        meta_path, body_path = self._paths(method, full_url, body)
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+            with open(body_path, 'rb') as f:
+                content = f.read()
+        except (IOError, OSError, ValueError):
+            LOGGER.error('No recorded response for %s %s in cassette %s' % (method, full_url, self.directory))
+            return None
+
+        response = cache.build_response(meta['response'], content)
+        response.from_cassette = True
+        return response
+
+    def record(self, mode, url, kwargs, response):
+        """Store this response to this request, replacing any earlier recording."""
+        method, full_url, body = request_for(mode, url, kwargs or {})
+        meta_path, body_path = self._paths(method, full_url, body)
+        meta = {
+            'request': {
+                'method': method,
+                'url': full_url,
+                'body': None if body is None else body.decode('utf-8', 'replace'),
+            },
+            'response': cache.response_meta(response.url or full_url, response),
+        }
+
+        try:
+            cache.write_atomic(body_path, response.content, 'wb')
+            cache.write_atomic(meta_path, json.dumps(meta, indent=2, sort_keys=True), 'w')
+        except (IOError, OSError) as e:
+            LOGGER.warn('Could not record response for %s %s: %s' % (method, full_url, e))
+
+
+_cassette = None
+_configured = False
+
+
+def configure(directory, mode=REPLAY):
+    """
+    Turn on recording or replay for all clients in this process.
+
+    :param str directory: Cassette directory. If None, turn recording and replay off.
+    :param str mode: RECORD to record responses, REPLAY to answer requests from the recordings.
+    """
+    global _cassette, _configured
+    if directory is None:
+        _cassette = None
+    else:
+        _cassette = Cassette(directory, mode=mode)
+    _configured = True
+    return _cassette
+
+
+def get_cassette():
+    """Returns the configured Cassette, or None if recording and replay are off."""
+    global _configured
+    if not _configured:
+        directory = os.environ.get('PYISO_CASSETTE_DIR')
+        if directory:
+            configure(directory, mode=os.environ.get('PYISO_CASSETTE_MODE', REPLAY))
+        _configured = True
+    return _cassette
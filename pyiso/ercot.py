@@ -1,6 +1,6 @@
 from bs4 import BeautifulSoup
 from pyiso.base import BaseClient
-from pyiso import LOGGER
+from pyiso import LOGGER, parallel
 import pandas as pd
 from io import StringIO
 import re
@@ -25,6 +25,36 @@ class ERCOTClient(BaseClient):
     TZ_NAME = 'US/Central'
 
     def _request_report(self, report_type, date=None):
+        # find the endpoint to download
+        listing = self._request_report_listing(report_type)
+        report_endpoint = self._find_report(listing, report_type, date)
+
+        # test endpoint found
+        if not report_endpoint:
+            raise ValueError(
+                'ERCOT: No report available for %s' % (report_type))
+
+        return self._fetch_report(report_endpoint)
+
+    def _request_reports(self, report_type, dates):
+        """
+        Returns a list of DataFrames, one for each date that has a report,
+        fetching the reports list once and the reports themselves concurrently.
+        """
+        listing = self._request_report_listing(report_type)
+        index = self._index_reports(listing, report_type)
+
+        # find the endpoints to download, skipping dates without a report
+        report_endpoints = []
+        for date in dates:
+            report_endpoint = index.get(self._report_key(report_type, date))
+            if report_endpoint and report_endpoint not in report_endpoints:
+                report_endpoints.append(report_endpoint)
+
+        return parallel.map_ordered(self._fetch_report, report_endpoints, max_workers=self.max_workers)
+
+    def _request_report_listing(self, report_type):
+        """Returns a list of (label, endpoint) for the csv reports of this type, newest first."""
         # request reports list
         params = {'reportTypeId': self.report_type_ids[report_type]}
         response = self.request(self.base_report_url+'/misapp/GetReports.do',
@@ -33,43 +63,61 @@ class ERCOTClient(BaseClient):
             raise ValueError('ERCOT: No report available for %s' % (report_type))
         report_list_soup = BeautifulSoup(response.content, 'lxml')
 
-        # Round minute down to nearest 5 minute period
-        if date:
-            date = datetime(date.year, date.month, date.day, date.hour,
-                            date.minute - (date.minute % 5), tzinfo=date.tzinfo)
-            date = pytz.timezone(self.TZ_NAME).normalize(date)
-
-            # DAM reports named 20150520 are for day 20150521
-            if report_type == 'dam_hrly_lmp':
-                date = date - timedelta(days=1)
-
-        # find the endpoint to download
-        report_endpoint = None
+        listing = []
         for elt in report_list_soup.find_all('tr'):
             label = elt.find(class_='labelOptional_ind')
             if label and 'csv' in label.string:
-                if date:
-                    if label.string.split('.')[3] == date.strftime('%Y%m%d'):
-                        # RT5M requires correct 5minute report
-                        if report_type == 'rt5m_lmp':
-                            if not label.string.split('.')[4].startswith(date.strftime('%H%M')):
-                                continue
-                    else:
-                        continue
-                report_endpoint = self.base_report_url + elt.a.attrs['href']
-                break
+                listing.append((label.string, self.base_report_url + elt.a.attrs['href']))
+        return listing
 
-        # test endpoint found
-        if not report_endpoint:
-            raise ValueError(
-                'ERCOT: No report available for %s' % (report_type))
+    def _report_key(self, report_type, date):
+        """Returns the (date, time) label parts of the report for this type and date."""
+        # Round minute down to nearest 5 minute period
+        date = datetime(date.year, date.month, date.day, date.hour,
+                        date.minute - (date.minute % 5), tzinfo=date.tzinfo)
+        date = pytz.timezone(self.TZ_NAME).normalize(date)
+
+        # DAM reports named 20150520 are for day 20150521
+        if report_type == 'dam_hrly_lmp':
+            date = date - timedelta(days=1)
+
+        # RT5M requires correct 5minute report
+        if report_type == 'rt5m_lmp':
+            return date.strftime('%Y%m%d'), date.strftime('%H%M')
+        return date.strftime('%Y%m%d'), None
+
+    def _label_key(self, report_type, label):
+        parts = label.split('.')
+        if report_type == 'rt5m_lmp':
+            return parts[3], parts[4][:4]
+        return parts[3], None
+
+    def _find_report(self, listing, report_type, date=None):
+        """Returns the endpoint of the first report in the listing for this date, or any date if None."""
+        if not date:
+            return listing[0][1] if listing else None
+        return self._index_reports(listing, report_type).get(self._report_key(report_type, date))
+
+    def _index_reports(self, listing, report_type):
+        """Returns a dict of endpoints keyed by report date and time, keeping the first of any duplicates."""
+        index = {}
+        for label, report_endpoint in listing:
+            try:
+                key = self._label_key(report_type, label)
+            except IndexError:
+                continue
+            index.setdefault(key, report_endpoint)
+        return index
 
+    def _fetch_report(self, report_endpoint):
         # read report from zip
-        r = self.request(report_endpoint)
-        if r:
-            content = self.unzip(r.content)
+        zipped = self.fetch_to_file(report_endpoint)
+        if zipped:
+            content = self.unzip(zipped)
         else:
             return pd.DataFrame()
+        if not content:
+            return pd.DataFrame()
 
         # parse csv
         df = pd.read_csv(StringIO(content[0].decode('unicode_escape')))
@@ -92,7 +140,7 @@ class ERCOTClient(BaseClient):
 
             # parse load from response
             if response:
-                data = self.parse_rtm(response.text)
+                data = self.parse_once(response, lambda r: self.parse_rtm(r.text), key='parse_rtm')
             else:
                 data = []
 
@@ -112,7 +160,7 @@ class ERCOTClient(BaseClient):
 
             # parse load from response
             if response:
-                data = self.parse_rtm(response.text)
+                data = self.parse_once(response, lambda r: self.parse_rtm(r.text), key='parse_rtm')
             else:
                 data = []
 
@@ -124,13 +172,11 @@ class ERCOTClient(BaseClient):
                 return []
 
             # convert column of hour ending (1:00-24:00) to hour beginning (0:00-23:00)
-            df['HourBeginning'] = df.apply(lambda dp: int(dp['HourEnding'].split(':')[0])-1,
-                                           axis=1)
+            df['HourBeginning'] = df['HourEnding'].str.split(':').str[0].astype(int) - 1
 
             # create datetime index of hour beginning
-            df.index = df.apply(lambda dp: self.utcify(pd.to_datetime('%s %d:00' % (dp['DeliveryDate'], dp['HourBeginning'])),
-                                                       is_dst=self.is_dst(dp['DSTFlag'], 'N')),
-                                axis=1)
+            local_tss = df['DeliveryDate'].astype(str) + ' ' + df['HourBeginning'].astype(str) + ':00'
+            df.index = self.utcify_many(local_tss, is_dst=self.is_dst(df['DSTFlag'], 'N'))
 
             # slice times
             sliced = self.slice_times(df)
@@ -155,23 +201,30 @@ class ERCOTClient(BaseClient):
         return data
 
     def parse_rtm(self, content):
-        # make soup
-        soup = BeautifulSoup(content, 'lxml')
+        # parse html
+        doc = self.parse_html(content)
 
         # timestamp text starts with 'Last Updated'
-        timestamp_elt = soup.find(text=re.compile('Last Updated'))
+        timestamp_elt = doc.xpath('//text()[contains(., "Last Updated")]')[0]
         timestamp_str = timestamp_elt.strip('Last Updated: ')
         timestamp = self.utcify(timestamp_str)
 
-        # parse rest of page as html table
-        df = pd.read_html(content, index_col=0)[0]
+        # each value is in the cell after its label
+        # (rows on this page aren't always inside a <tr>, so it can't be read as a table)
+        values = {}
+        for label_elt in doc.xpath('//td[@class="tdLeft"]'):
+            value_elt = label_elt.getnext()
+            try:
+                values[label_elt.text_content().strip()] = float(value_elt.text_content().replace(',', ''))
+            except (AttributeError, ValueError):
+                continue
 
         # get other values
-        load_val = df.loc['Actual System Demand'][1]
-        wind_val = df.loc['Total Wind Output'][1]
+        load_val = values['Actual System Demand']
+        wind_val = values['Total Wind Output']
         tie_flow_labels = ['DC_E (East)', 'DC_L (Laredo VFT)', 'DC_N (North)',
                            'DC_R (Railroad)', 'DC_S (Eagle Pass)']
-        total_imports_val = sum([df.loc[label][1] for label in tie_flow_labels])
+        total_imports_val = sum([values[label] for label in tie_flow_labels])
 
         # use options to get labels
         if self.options['data'] == 'load':
@@ -295,25 +348,22 @@ class ERCOTClient(BaseClient):
 
                 # warn if this could take a long time
                 if len(p_list) > 5:
-                    LOGGER.warn('Making %d data requests (one for each 5min period), this could take a while' % len(p_list))
+                    LOGGER.warn('Fetching the ERCOT reports list, then up to %d reports concurrently (one for each 5min period), '
+                                'this could take a while' % len(p_list))
 
-                # make request for each period
-                for period in p_list:
-                    try:
-                        report = self._request_report(report_name, date=period)
-                        pieces.append(report)
-                    except ValueError:
-                        pass
+                # get the reports list once, then the report for each period
+                try:
+                    pieces = self._request_reports(report_name, p_list)
+                except ValueError:
+                    pass
 
             else:
                 start = datetime(start.year, start.month, start.day, tzinfo=start.tzinfo)
                 days_list = [end - timedelta(days=x) for x in range((end-start).days + 1)]
-                for day in days_list:
-                    try:
-                        report = self._request_report(report_name, day)
-                        pieces.append(report)
-                    except ValueError:
-                        pass
+                try:
+                    pieces = self._request_reports(report_name, days_list)
+                except ValueError:
+                    pass
 
             # combine pieces, if any
             if len(pieces) > 0:
@@ -1,10 +1,8 @@
 from pyiso.base import BaseClient
-from pyiso import LOGGER
-import requests
+from pyiso import LOGGER, parallel, ratelimit, sessions
 import pandas as pd
 import numpy as np
 from io import StringIO
-from time import sleep
 from datetime import datetime, timedelta
 import pytz
 from os import environ
@@ -113,16 +111,51 @@ class EUClient(BaseClient):
 
     def get_load(self, control_area=None, latest=False, start_at=None, end_at=None,
                  forecast=False, **kwargs):
+        """
+        Get load for one or more control areas.
+
+        :param control_area: A key of CONTROL_AREAS, a list of them, or 'all' for every control area.
+            Every control area and day is fetched concurrently, up to max_workers at once,
+            and the result has the control area code as ba_name.
+
+        See :py:meth:`BaseClient.get_load` for the other parameters.
+        """
         self.handle_options(data='load', start_at=start_at, end_at=end_at, forecast=forecast,
                             latest=latest, control_area=control_area, **kwargs)
 
+        # set up one request for each control area and day
+        if control_area == 'all':
+            control_areas = sorted(self.CONTROL_AREAS.keys())
+        elif isinstance(control_area, (list, tuple)):
+            control_areas = list(control_area)
+        else:
+            control_areas = [control_area]
+        url = self.base_url + self.export_endpoint
+        area_payloads = [(area, self.construct_payload(date, area)) for area in control_areas for date in self.dates()]
+
+        # log in once, so every request shares the session
+        if not getattr(self, 'session', None):
+            self.auth()
+
+        def fetch_and_parse(area_payload):
+            # one area and day with a failed request or unreadable response shouldn't lose the others
+            area, payload = area_payload
+            try:
+                response = self.fetch_entsoe(url, payload)
+                if not response:
+                    LOGGER.warn('No ENTSOe load found for %s on %s' % (area, payload['dateTime.dateTime']))
+                    return []
+                return [self.parse_load_response(response, area)]
+            except (ValueError, KeyError, pd.errors.ParserError) as e:
+                LOGGER.warn('Failed to get ENTSOe load for control area %s on %s: %s' %
+                            (area, payload['dateTime.dateTime'], e))
+                return []
+
         pieces = []
-        for date in self.dates():
-            payload = self.construct_payload(date)
-            url = self.base_url + self.export_endpoint
-            response = self.fetch_entsoe(url, payload)
-            day_df = self.parse_load_response(response)
-            pieces.append(day_df)
+        for area_pieces in parallel.map_ordered(fetch_and_parse, area_payloads, max_workers=self.max_workers):
+            pieces += area_pieces
+        if len(pieces) == 0:
+            return []
 
         df = pd.concat(pieces)
         sliced = self.slice_times(df)
@@ -143,7 +176,8 @@ class EUClient(BaseClient):
 
     def auth(self):
         if not getattr(self, 'session', None):
-            self.session = requests.Session()
+            # login cookies belong to this client, so don't use the shared session
+            self.session = sessions.new_session()
 
         payload = {'username': environ['ENTSOe_USERNAME'],
                    'password': environ['ENTSOe_PASSWORD'],
@@ -171,29 +205,35 @@ class EUClient(BaseClient):
             self.auth()
 
         r = self.request(url, params=payload)
-        # TODO error checking
+        if r is None:
+            LOGGER.warn('Request failed for %s with %s' % (url, payload))
+            return False
         if len(r.text) == 0:
             if count > 3:  # try 3 times to get response
                 LOGGER.warn('Request failed, no response found after %i attempts' % count)
                 return False
-            # throttled
-            sleep(5)
+            # throttled, so hold off every request to ENTSOe
+            ratelimit.penalize(url, 5)
             return self.fetch_entsoe(url, payload, count + 1)
         if 'UNKNOWN_EXCEPTION' in r.text:
             LOGGER.warn('UNKNOWN EXCEPTION')
             return False
         return r.text
 
-    def construct_payload(self, date):
+    def construct_payload(self, date, control_area=None):
+        # default to the control area in options
+        if control_area is None:
+            control_area = self.options['control_area']
+
         # format date
         format_str = '%d.%m.%Y'
         date_str = date.strftime(format_str) + ' 00:00|UTC|DAY'
 
         # TSO ID from control area code
         try:
-            TSO_ID = self.CONTROL_AREAS[self.options['control_area']]['ENTSOe_ID']
-        except KeyError:
-            msg = 'Control area code not found for %s. Options are %s' % (self.options['control_area'],
+            TSO_ID = self.CONTROL_AREAS[control_area]['ENTSOe_ID']
+        except (KeyError, TypeError):
+            msg = 'Control area code not found for %s. Options are %s' % (control_area,
                                                                           sorted(self.CONTROL_AREAS.keys()))
             raise ValueError(msg)
 
@@ -213,7 +253,11 @@ class EUClient(BaseClient):
         }
         return payload
 
-    def parse_load_response(self, response):
+    def parse_load_response(self, response, control_area=None):
+        # default to the control area in options
+        if control_area is None:
+            control_area = self.options['control_area']
+
         df = pd.read_csv(StringIO(response))
 
         # get START_TIME_UTC as tz-aware datetime
@@ -246,7 +290,7 @@ class EUClient(BaseClient):
         df.dropna(subset=['load_MW'], inplace=True)
 
         # Add columns
-        df['ba_name'] = self.options['control_area']
+        df['ba_name'] = control_area
         df['freq'] = '1hr'
         df['market'] = 'RTHR'  # not necessarily appropriate terminology
 
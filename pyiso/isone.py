@@ -1,5 +1,5 @@
 from pyiso.base import BaseClient
-from pyiso import LOGGER
+from pyiso import LOGGER, parallel
 from os import environ
 import pandas as pd
 
@@ -36,6 +36,9 @@ class ISONEClient(BaseClient):
         'NEMASSBOST': 4008,
     }
 
+    # ISO-NE web services limit concurrent requests per account, so keep this low
+    max_workers = 3
+
     def __init__(self, *args, **kwargs):
         super(ISONEClient, self).__init__(*args, **kwargs)
         try:
@@ -49,21 +52,8 @@ class ISONEClient(BaseClient):
         self.handle_options(data='gen', latest=latest,
                             start_at=start_at, end_at=end_at, **kwargs)
 
-        # set up storage
-        raw_data = []
-        parsed_data = []
-
         # collect raw data
-        for endpoint in self.request_endpoints():
-            # carry out request
-            data = self.fetch_data(endpoint, self.auth)
-
-            # pull out data
-            try:
-                raw_data += data['GenFuelMixes']['GenFuelMix']
-            except KeyError as e:
-                LOGGER.warn(e)
-                continue
+        raw_data = self.fetch_raw_data(self.request_endpoints(), self.parse_json_gen_data)
 
         # parse data
         try:
@@ -81,20 +71,8 @@ class ISONEClient(BaseClient):
         self.handle_options(data='load', latest=latest, forecast=forecast,
                             start_at=start_at, end_at=end_at, **kwargs)
 
-        # set up storage
-        raw_data = []
-
         # collect raw data
-        for endpoint in self.request_endpoints():
-            # carry out request
-            data = self.fetch_data(endpoint, self.auth)
-
-            # pull out data
-            try:
-                raw_data += self.parse_json_load_data(data)
-            except ValueError as e:
-                LOGGER.warn(e)
-                continue
+        raw_data = self.fetch_raw_data(self.request_endpoints(), self.parse_json_load_data)
 
         # parse data
         try:
@@ -189,6 +167,36 @@ class ISONEClient(BaseClient):
         else:
             return {}
 
+    def fetch_raw_data(self, endpoints, parser):
+        """
+        Fetch all endpoints, up to max_workers at once, and return the combined records
+        pulled out of their json by parser, in endpoint order.
+        Endpoints whose data the parser can't handle are skipped with a warning.
+        """
+        def fetch_and_parse(endpoint):
+            # decode and pull out data in the worker, while other requests wait on the network
+            data = self.fetch_data(endpoint, self.auth)
+            try:
+                return parser(data)
+            except ValueError as e:
+                LOGGER.warn(e)
+                return []
+
+        raw_data = []
+        for records in parallel.map_ordered(fetch_and_parse, endpoints, max_workers=self.max_workers):
+            raw_data += records
+        return raw_data
+
+    def parse_json_gen_data(self, data):
+        """
+        Pull approriate keys from json data set.
+        Raise ValueError if parser fails.
+        """
+        try:
+            return data['GenFuelMixes']['GenFuelMix']
+        except (KeyError, TypeError):
+            raise ValueError('Could not parse ISONE gen data %s' % data)
+
     def parse_json_load_data(self, data):
         """
         Pull approriate keys from json data set.
@@ -271,19 +279,8 @@ class ISONEClient(BaseClient):
         except KeyError:
             raise ValueError('No LMP data available for location %s' % node_id)
 
-        # set up storage
-        raw_data = []
         # collect raw data
-        for endpoint in self.request_endpoints(locationid):
-            # carry out request
-            data = self.fetch_data(endpoint, self.auth)
-
-            # pull out data
-            try:
-                raw_data += self.parse_json_lmp_data(data)
-            except ValueError as e:
-                LOGGER.warn(e)
-                continue
+        raw_data = self.fetch_raw_data(self.request_endpoints(locationid), self.parse_json_lmp_data)
 
         # parse and slice
         df = self._parse_json(raw_data)
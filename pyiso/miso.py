@@ -1,6 +1,6 @@
 from collections import namedtuple
 from pyiso.base import BaseClient
-from pyiso import LOGGER
+from pyiso import LOGGER, parallel
 import pandas as pd
 from io import BytesIO
 from datetime import datetime, timedelta
@@ -40,8 +40,12 @@ class MISOClient(BaseClient):
 
         # get data
         if self.options['latest']:
-            content = self.get_latest_fuel_mix()
-            data = self.parse_latest_fuel_mix(content)
+            response = self.request_latest_fuel_mix()
+            if response is None:
+                data = self.parse_latest_fuel_mix(None)
+            else:
+                data = self.parse_once(response, lambda r: self.parse_latest_fuel_mix(r.content),
+                                       key='parse_latest_fuel_mix')
             extras = {
                 'ba_name': self.NAME,
                 'market': self.MARKET_CHOICES.fivemin,
@@ -97,6 +101,12 @@ class MISOClient(BaseClient):
         return self.serialize_faster(data, extras=extras)
 
     def get_latest_fuel_mix(self):
+        response = self.request_latest_fuel_mix()
+        if response is None:
+            return None
+        return response.content
+
+    def request_latest_fuel_mix(self):
         # set up request
         url = self.base_url + '/ria/FuelMix.aspx?CSV=True'
 
@@ -111,7 +121,7 @@ class MISOClient(BaseClient):
             return None
 
         # return good
-        return response.content
+        return response
 
     def parse_latest_fuel_mix(self, content):
         # handle bad input
@@ -165,13 +175,12 @@ class MISOClient(BaseClient):
         df.columns = ['hour_str'] + list(header_df.iloc[-1][1:])
 
         # set index
-        idx = []
+        local_tss = []
         for hour_str in df['hour_str']:
             # format like 'Hour 01' to 'Hour 24'
             ihour = int(hour_str[5:]) - 1
-            local_ts = datetime(date.year, date.month, date.day, ihour)
-            idx.append(self.utcify(local_ts))
-        df.index = idx
+            local_tss.append(datetime(date.year, date.month, date.day, ihour))
+        df.index = self.utcify_many(local_tss)
         df.index.set_names(['timestamp'], inplace=True)
 
         # return
@@ -266,42 +275,12 @@ class MISOClient(BaseClient):
         local_end = self.options['end_at'].astimezone(tz).date()
         # get days between start and end
         days = [local_start + timedelta(days=x) for x in range((local_end-local_start).days + 1)]
-        name_dict = {self.MARKET_CHOICES.hourly: '_rt_lmp_final.csv',
-                     self.MARKET_CHOICES.hourly_prelim: '_rt_lmp_prelim.csv',
-                     self.MARKET_CHOICES.dam: '_da_expost_lmp.csv',
-                     self.MARKET_CHOICES.dam_exante: '_da_exante_lmp.csv'}
-        pieces = []
-        for day in days:
-            # get the filename extension
-            ext = name_dict[self.options['market']]
-            datestr = day.strftime('%Y%m%d')
-            url = self.base_url + '/Library/Repository/Market%20Reports/' + datestr + ext
-
-            response = self.request(url)
-            if response.status_code == 404:
-                if self.options['market'] == self.MARKET_CHOICES.hourly:
-                    # try preliminary and tell the user
-                    self.options['market'] = self.MARKET_CHOICES.hourly_prelim
-                    ext = name_dict[self.MARKET_CHOICES.hourly_prelim]
-                    url = self.base_url + '/Library/Repository/Market%20Reports/' + datestr + ext
-                    response = self.request(url)
-
-            # if that didn't work, don't append to pieces
-            if response.status_code == 404:
-                continue
-            # skip file information
-            udf = pd.read_csv(BytesIO(response.content), skiprows=[0, 1, 2, 3])
-
-            # standardize format
-            udf = pd.melt(udf, id_vars=['Node', 'Value', 'Type'])
-
-            # get naive timestamps, HE_1 = hour ending 1
-            udf['hour'] = udf['variable'].apply(str.replace, args=('HE ', '')).astype(int) - 1
-            udf['timestamp'] = udf['hour'].apply(lambda x: timedelta(hours=x)) + day
-            udf.drop(['hour', 'variable'], axis=1, inplace=True)
-
-            pieces.append(udf)
 
+        # fetch and reshape several days at once, keeping them in date order
+        pieces = [udf for udf in parallel.map_ordered(self._historical_lmp_day, days, max_workers=self.max_workers)
+                  if udf is not None]
+        if not pieces:
+            return pd.DataFrame()
         df = pd.concat(pieces)
         if df.empty:
             return df
@@ -309,10 +288,6 @@ class MISOClient(BaseClient):
         df.set_index('timestamp', inplace=True)
         df.index = self.utcify_index(df.index)
 
-
-        # drop MCC and MLC
-        df = df[df['Value'] == 'LMP']
-
         # drop node type
         df.drop('Type', axis=1, inplace=True)
 
@@ -324,11 +299,54 @@ class MISOClient(BaseClient):
 
         # add columns
         df['freq'] = self.options['freq']
-        df['market'] = self.options['market']
         df['ba_name'] = 'MISO'
 
         return df
 
+    def _historical_lmp_url(self, day, market):
+        name_dict = {self.MARKET_CHOICES.hourly: '_rt_lmp_final.csv',
+                     self.MARKET_CHOICES.hourly_prelim: '_rt_lmp_prelim.csv',
+                     self.MARKET_CHOICES.dam: '_da_expost_lmp.csv',
+                     self.MARKET_CHOICES.dam_exante: '_da_exante_lmp.csv'}
+        datestr = day.strftime('%Y%m%d')
+        return self.base_url + '/Library/Repository/Market%20Reports/' + datestr + name_dict[market]
+
+    def _historical_lmp_day(self, day):
+        """
+        Returns a long-format DataFrame of the LMPs in the market report for this local date,
+        with the market it came from, or None if there is no report.
+        """
+        market = self.options['market']
+        response = self.request(self._historical_lmp_url(day, market))
+        if response is not None and response.status_code == 404 and market == self.MARKET_CHOICES.hourly:
+            # final prices aren't out yet for recent days, so try preliminary and tell the user
+            LOGGER.info('No final MISO LMPs for %s, using preliminary' % day)
+            market = self.MARKET_CHOICES.hourly_prelim
+            response = self.request(self._historical_lmp_url(day, market))
+
+        # if that didn't work, there's nothing for this day
+        if not response:
+            return None
+
+        # skip file information
+        udf = pd.read_csv(BytesIO(response.content), skiprows=[0, 1, 2, 3])
+
+        # drop MCC and MLC before reshaping, since each report has a row of each for every node
+        udf = udf[udf['Value'] == 'LMP']
+
+        # standardize format
+        udf = pd.melt(udf, id_vars=['Node', 'Value', 'Type'])
+
+        # get naive timestamps, HE_1 = hour ending 1
+        hours = udf['variable'].str.replace('HE ', '').astype(int) - 1
+        udf['timestamp'] = pd.Timestamp(day) + pd.to_timedelta(hours, unit='h')
+        udf.drop('variable', axis=1, inplace=True)
+
+        # days can come from different markets if the preliminary fallback was needed
+        udf['market'] = market
+
+        return udf
+
     def get_lmp(self, node_id='ILLINOIS.HUB', latest=True, **kwargs):
         """ ILLINOIS.HUB is central """
         self.handle_options(latest=latest, **kwargs)
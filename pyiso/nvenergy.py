@@ -1,5 +1,5 @@
 from pyiso.base import BaseClient
-from pyiso import LOGGER
+from pyiso import LOGGER, parallel
 import pandas as pd
 import numpy as np
 from datetime import time, datetime, timedelta
@@ -31,24 +31,8 @@ class NVEnergyClient(BaseClient):
         self.handle_options(data='load', latest=latest,
                             start_at=start_at, end_at=end_at, **kwargs)
 
-        # set up storage
-        parsed_data = []
-
         # collect data
-        for this_date in self.dates():
-            # fetch
-            try:
-                df, mode = self.fetch_df(this_date)
-            except (HTTPError, ValueError):
-                LOGGER.warn('No data available in NVEnergy at %s' % this_date)
-                continue
-
-            # store
-            try:
-                parsed_data += self.parse_load(df, this_date, mode)
-            except KeyError:
-                LOGGER.warn('Unparseable data available in NVEnergy at %s for mode %s: %s' % (this_date, mode, df))
-                continue
+        parsed_data = self.collect_data(self.parse_load)
 
         # return
         return self.time_subset(parsed_data)
@@ -59,27 +43,75 @@ class NVEnergyClient(BaseClient):
         self.handle_options(data='trade', latest=latest,
                             start_at=start_at, end_at=end_at, **kwargs)
 
-        # set up storage
-        parsed_data = []
-
         # collect data
-        for this_date in self.dates():
+        parsed_data = self.collect_data(self.parse_trade)
+
+        # return
+        return self.time_subset(parsed_data)
+
+    def handle_options(self, **kwargs):
+        super(NVEnergyClient, self).handle_options(**kwargs)
+
+        # parsed monthly pages by url, reused for every day of the month in this call
+        self.monthly_tables = {}
+
+    def collect_data(self, parser):
+        """
+        Fetch data for all dates, several at once, and return the combined output of parser(df, date, mode)
+        in date order. Each past month's page is fetched and parsed once, with distinct months fetched concurrently.
+        """
+        dates = self.dates()
+
+        # fetch the monthly pages that cover past dates first, so days don't race to parse the same month
+        monthly_urls = []
+        for this_date in dates:
+            try:
+                url, mode = self.data_url(this_date)
+            except ValueError:
+                continue
+            if mode == 'historical' and url not in monthly_urls:
+                monthly_urls.append(url)
+        parallel.map_ordered(self.fetch_monthly_table, monthly_urls, max_workers=self.max_workers)
+
+        def fetch_and_parse(this_date):
             # fetch
             try:
                 df, mode = self.fetch_df(this_date)
             except (HTTPError, ValueError):
                 LOGGER.warn('No data available in NVEnergy at %s' % this_date)
-                continue
+                return []
 
-            # store
+            # parse
             try:
-                parsed_data += self.parse_trade(df, this_date, mode)
+                return parser(df, this_date, mode)
             except KeyError:
-                LOGGER.warn('Unparseable data available in NVEnergy at %s: %s' % (this_date, df))
-                continue
+                LOGGER.warn('Unparseable data available in NVEnergy at %s for mode %s: %s' % (this_date, mode, df))
+                return []
 
-        # return
-        return self.time_subset(parsed_data)
+        parsed_data = []
+        for day_data in parallel.map_ordered(fetch_and_parse, dates, max_workers=self.max_workers):
+            parsed_data += day_data
+        return parsed_data
+
+    def fetch_monthly_table(self, url):
+        """
+        Returns the full table from a historical monthly page, or None if an error was encountered.
+        Each page is only fetched and parsed once per get_* call.
+        """
+        tables = getattr(self, 'monthly_tables', None)
+        if tables is None:
+            tables = self.monthly_tables = {}
+        if url in tables:
+            return tables[url]
+
+        # carry out request
+        response = self.request(url)
+        if not response:
+            return None
+
+        # parse html table
+        tables[url] = self.html_table(self.parse_html(response.content), 1, index_col=0)
+        return tables[url]
 
     def data_url(self, ts, mode=None):
         # today's date in local time
@@ -118,23 +150,12 @@ class NVEnergyClient(BaseClient):
         if not url:
             url, mode = self.data_url(this_date, mode=mode)
 
-        # carry out request
-        response = self.request(url)
-        if not response:
-            return pd.DataFrame(), 'error'
-
-        # parse html tables
-        dfs = pd.read_html(response.content, index_col=0)
+        # past months come from the whole month's table, which is shared by all its days
+        if mode == 'historical':
+            full_df = self.fetch_monthly_table(url)
+            if full_df is None:
+                return pd.DataFrame(), 'error'
 
-        # choose df based on mode
-        if mode == 'recent':
-            try:
-                df = dfs[1]
-            except IndexError:  # try alternate
-                return self.fetch_df(this_date, mode='alternate')
-        elif mode == 'tomorrow':
-            df = dfs[0]
-        else:  # historical
             # set up date string
             try:
                 datestr = pytz.timezone(self.TZ_NAME).localize(this_date).strftime('%Y-%m-%d')
@@ -142,9 +163,31 @@ class NVEnergyClient(BaseClient):
                 datestr = this_date.strftime('%Y-%m-%d')
 
             # pull one day of data out of full df
-            full_df = dfs[1]
             date_row_idx = np.where(full_df.index == datestr)[0][0]
-            df = full_df.iloc[date_row_idx:date_row_idx+13]
+            df = full_df.iloc[date_row_idx:date_row_idx+13].copy()
+
+            # set and slice header
+            df.columns = df.iloc[1]
+            df = df[2:]
+
+            # return
+            return df, mode
+
+        # carry out request
+        response = self.request(url)
+        if not response:
+            return pd.DataFrame(), 'error'
+
+        # parse the html table for this mode
+        doc = self.parse_html(response.content)
+        if mode == 'recent':
+            df = self.html_table(doc, 1, index_col=0)
+            if df is None:  # try alternate
+                return self.fetch_df(this_date, mode='alternate')
+        else:  # tomorrow
+            df = self.html_table(doc, 0, index_col=0)
+            if df is None:
+                return pd.DataFrame(), 'error'
 
         # set and slice header
         df.columns = df.iloc[1]
@@ -164,15 +207,16 @@ class NVEnergyClient(BaseClient):
             series = df.loc['Actual System Load']
 
         # store
+        timestamps = self.idx2ts_many(this_date, series.index)
         for shour, value in series.iteritems():
             # skip if no load data (in future)
             if not value:
                 continue
 
-            # create local time
+            # skip if not an hour
             try:
-                ts = self.idx2ts(this_date, shour)
-            except ValueError:
+                ts = timestamps[shour]
+            except KeyError:
                 continue
 
             # set up datapoint
@@ -197,6 +241,9 @@ class NVEnergyClient(BaseClient):
         # set index as counterparty bas
         df.index = df['Counterparty']
 
+        # every counterparty has the same hours
+        timestamps = self.idx2ts_many(this_date, df.columns)
+
         # store for all counterparty bas
         for iso in self.TRADE_BAS:
             # pull out data
@@ -207,10 +254,10 @@ class NVEnergyClient(BaseClient):
                 if not value:
                     continue
 
-                # create local time
+                # skip if not an hour
                 try:
-                    ts = self.idx2ts(this_date, shour)
-                except ValueError:
+                    ts = timestamps[shour]
+                except KeyError:
                     continue
 
                 # set up datapoint
@@ -260,3 +307,19 @@ class NVEnergyClient(BaseClient):
         ihour = int(shour) - 1
         local_time = datetime.combine(this_date, time(hour=ihour))
         return self.utcify(local_time)
+
+    def idx2ts_many(self, this_date, shours):
+        """
+        Takes a date object and a list-like of local hour strings,
+        and returns a dict of UTC datetime objects for the ones between '01' and '24', converted together.
+        """
+        local_times = {}
+        for shour in shours:
+            try:
+                local_times[shour] = datetime.combine(this_date, time(hour=int(shour) - 1))
+            except (ValueError, TypeError):
+                continue
+
+        hours = list(local_times.keys())
+        utc_times = self.utcify_many([local_times[shour] for shour in hours]).to_pydatetime()
+        return dict(zip(hours, utc_times))
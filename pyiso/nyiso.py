@@ -1,8 +1,10 @@
 from pyiso.base import BaseClient
-from pyiso import LOGGER
+from pyiso import LOGGER, parallel
 import numpy as np
 import pandas as pd
 from datetime import timedelta
+from functools import partial
+from io import BytesIO
 import re
 
 
@@ -146,19 +148,31 @@ class NYISOClient(BaseClient):
         if not dates_list:
             dates_list = self.dates()
 
-        # fetch and parse all csvs
-        for date in dates_list:
-            for csv in self.fetch_csvs(date, label):
+        # the first date that falls back to a monthly zip fetches it for every date in that month.
+        # this stays off the client, which is pickled when parsing in other processes
+        monthly_zips = parallel.Claims()
 
-                try:
-                    pieces.append(parser(csv))
-                except AttributeError:
-                    pass
+        # fetch csvs for several dates at once, and parse them in date order
+        parse_processes = parallel.parse_processes_for(self.parse_processes)
+
+        def fetch(date):
+            csvs = self.fetch_csvs(date, label, monthly_zips)
+            if parse_processes:
+                # parsing happens in another process, so read monthly csvs out of the zip here
+                csvs = [BytesIO(csv.read()) if hasattr(csv, 'read') else csv for csv in csvs]
+            return csvs
+
+        fetched = parallel.imap_pipeline(fetch, partial(self.parse_csvs, parser), dates_list,
+                                         max_workers=self.max_workers, parse_processes=parse_processes)
+        for parsed in fetched:
+            pieces += parsed
 
             # if fetch_csvs cannot get the individual days, it gets the whole month
             # Shortcut the loop if any call to fetch_csvs gets all dates in dates_list
+            # (and cancel fetches for the remaining dates)
             try:
                 if (pieces[-1].index[-1] - timedelta(days=1)).date() > max(dates_list):
+                    fetched.close()
                     break
             except IndexError:
                 pass
@@ -180,13 +194,34 @@ class NYISOClient(BaseClient):
         sliced = self.slice_times(df)
         return sliced
 
-    def fetch_csvs(self, date, label):
-        # construct url
+    def parse_csvs(self, parser, date, csvs):
+        """Returns a list of the dataframes that parser makes from these csvs, skipping ones it can't parse."""
+        pieces = []
+        for csv in csvs:
+            try:
+                pieces.append(parser(csv))
+            except AttributeError:
+                pass
+        return pieces
+
+    def fetch_csvs(self, date, label, monthly_zips=None):
+        """
+        Returns the csvs for this date, from the daily csv or else the monthly zip.
+        If monthly_zips is a parallel.Claims, a monthly zip that another date has claimed is not fetched again.
+        """
+        # construct urls
         datestr = date.strftime('%Y%m%d')
+        monthstr = date.strftime('%Y%m01')
         if self.options['data'] == 'lmp':
             url = '%s/%s/%s%s_zone.csv' % (self.base_url, label, datestr, label)
+            monthly_url = '%s/%s/%s%s_zone_csv.zip' % (self.base_url, label, monthstr, label)
         else:
             url = '%s/%s/%s%s.csv' % (self.base_url, label, datestr, label)
+            monthly_url = '%s/%s/%s%s_csv.zip' % (self.base_url, label, monthstr, label)
+
+        # another date in this month already got the monthly data
+        if monthly_zips is not None and monthly_url in monthly_zips:
+            return []
 
         # make request
         response = self.request(url)
@@ -195,24 +230,21 @@ class NYISOClient(BaseClient):
         if response and response.status_code == 200:
             return [response.text]
 
-        # if failure, try zipped monthly data
-        datestr = date.strftime('%Y%m01')
-        if self.options['data'] == 'lmp':
-            url = '%s/%s/%s%s_zone_csv.zip' % (self.base_url, label, datestr, label)
-        else:
-            url = '%s/%s/%s%s_csv.zip' % (self.base_url, label, datestr, label)
+        # if failure, try zipped monthly data, unless another date in this month got to it first
+        if monthly_zips is not None and not monthly_zips.claim(monthly_url):
+            return []
 
         # make request and unzip
-        response_zipped = self.request(url)
-        if response_zipped:
-            unzipped = self.unzip(response_zipped.content)
+        zipped = self.fetch_to_file(monthly_url)
+        if zipped:
+            unzipped = self.unzip(zipped)
         else:
             return []
 
-        # return
+        # return a handle for each day's csv, so they are decompressed one at a time as they are parsed
         if unzipped:
             LOGGER.info('Failed to find daily %s data for %s but found monthly data, using that' % (self.options['data'], date))
-            return unzipped
+            return unzipped.files()
         else:
             return []
 
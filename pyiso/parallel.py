@@ -0,0 +1,135 @@
+"""
+Bounded thread pools for fetching several things at once.
+
+Fetching is mostly waiting on the network, so clients run independent requests on a few threads.
+Every request still goes through the per-host rate limiter (see :py:mod:`pyiso.ratelimit`),
+so running more threads never outpaces the limit for a source.
+
+Parsing is mostly CPU work, which threads can't spread over more than one core.
+For big backfills, :py:func:`imap_pipeline` can hand fetched payloads to a pool of processes for parsing
+while the fetch threads keep downloading.
+"""
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait
+from itertools import islice
+from threading import Lock
+
+
+# default number of threads for clients that don't set max_workers
+MAX_WORKERS = 4
+
+
+# default number of processes to parse on for clients that don't set parse_processes, or 0 to parse on the fetch threads
+PARSE_PROCESSES = 0
+
+
+def _workers(max_workers):
+    return MAX_WORKERS if max_workers is None else max_workers
+
+
+def parse_processes_for(parse_processes):
+    """Returns the number of processes to parse on, given a client's parse_processes setting (0 for none)."""
+    return PARSE_PROCESSES if parse_processes is None else parse_processes
+
+
+class Claims(object):
+    """
+    Keys that threads can claim, so only the first thread to ask for a key does the work for it.
+    Keep it out of anything that gets pickled for a process pool, since it holds a lock.
+    """
+    def __init__(self):
+        self._claimed = set()
+        self._lock = Lock()
+
+    def __contains__(self, key):
+        return key in self._claimed
+
+    def claim(self, key):
+        """Returns True if this is the first claim on key, or False if it was already claimed."""
+        with self._lock:
+            if key in self._claimed:
+                return False
+            self._claimed.add(key)
+            return True
+
+
+def map_ordered(fn, items, max_workers=None):
+    """
+    Returns [fn(item) for item in items], running up to max_workers calls at once.
+    Results are in the same order as items. If any call raises, the first exception in item order is raised.
+    """
+    items = list(items)
+    max_workers = _workers(max_workers)
+    if max_workers <= 1 or len(items) <= 1:
+        return [fn(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(fn, items))
+
+
+def imap_ordered(fn, items, max_workers=None):
+    """
+    Yields fn(item) for item in items, in order, running up to max_workers calls ahead of the consumer.
+    Closing the generator early (eg breaking out of a for loop over it) cancels calls that haven't started,
+    so callers can stop once they have what they need.
+    """
+    items = iter(items)
+    max_workers = _workers(max_workers)
+    if max_workers <= 1:
+        for item in items:
+            yield fn(item)
+        return
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    pending = deque(executor.submit(fn, item) for item in islice(items, max_workers))
+    try:
+        while pending:
+            result = pending.popleft().result()
+            for item in islice(items, 1):
+                pending.append(executor.submit(fn, item))
+            yield result
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def imap_pipeline(fetch, parse, items, max_workers=None, parse_processes=None):
+    """
+    Yields parse(item, fetch(item)) for item in items, in order.
+
+    fetch runs on up to max_workers threads, as in :py:func:`imap_ordered`.
+    If parse_processes is more than 0, parse runs on a pool of that many processes while fetching carries on,
+    so parse, its item and the fetched payload must be picklable (eg a client's bound method and a string);
+    otherwise parse runs on the fetch threads.
+    Closing the generator early cancels fetches and parses that haven't started.
+    """
+    parse_processes = parse_processes_for(parse_processes)
+    if not parse_processes:
+        for result in imap_ordered(lambda item: parse(item, fetch(item)), items, max_workers=max_workers):
+            yield result
+        return
+
+    # start the parse processes before any fetch threads.
+    # they may be forked, and a process forked while another thread holds a lock can deadlock on it.
+    # a submit starts a process if none is idle, so one quick task per process starts them all
+    executor = ProcessPoolExecutor(max_workers=parse_processes)
+    wait([executor.submit(int) for _ in range(parse_processes)])
+
+    fetched = imap_ordered(lambda item: (item, fetch(item)), items, max_workers=max_workers)
+    pending = deque()
+    try:
+        for item, payload in fetched:
+            pending.append(executor.submit(parse, item, payload))
+
+            # hand back parsed results as soon as they're ready, and don't let parsing fall far behind fetching
+            while pending and (pending[0].done() or len(pending) > 2 * parse_processes):
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        fetched.close()
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
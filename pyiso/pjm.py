@@ -1,6 +1,7 @@
 from bs4 import BeautifulSoup
 from pyiso.base import BaseClient
 from pyiso import LOGGER
+import numpy as np
 import pandas as pd
 from dateutil.parser import parse
 import pytz
@@ -49,19 +50,22 @@ class PJMClient(BaseClient):
         Returns a UTC timestamp if one is found in the html content,
         or None if an error was encountered.
         """
-        # soup it up
-        soup = BeautifulSoup(content, 'lxml')
+        return self.time_as_of_html(self.parse_html(content))
 
+    def time_as_of_html(self, doc):
+        """
+        Returns a UTC timestamp if one is found in the parsed html page,
+        or None if an error was encountered.
+        """
         # like 12.11.2015 17:15
-        ts_elt = soup.find(id='ctl00_ContentPlaceHolder1_DateAndTime')
-        if not ts_elt:
-            LOGGER.error('PJM: Timestamp not found in soup:\n%s' % soup)
+        ts_elts = doc.xpath('//*[@id="ctl00_ContentPlaceHolder1_DateAndTime"]') if doc is not None else []
+        if not ts_elts:
+            LOGGER.error('PJM: Timestamp not found in page')
             return None
-        ts_str = ts_elt.string
+        ts_str = ts_elts[0].text
 
         # EDT or EST
-        tz_elt = ts_elt.next_sibling
-        tz_str = tz_elt.string.strip()
+        tz_str = (ts_elts[0].tail or '').strip()
         is_dst = tz_str == 'EDT'
 
         # utcify and return
@@ -74,16 +78,13 @@ class PJMClient(BaseClient):
         if not response:
             return None, None
 
-        # get time as of
-        ts = self.time_as_of(response.content)
+        # get time as of, and parse html to df
+        ts, df = self.parse_once(response, self._parse_edata_page)
 
         # round down to 5min
         extra_min = ts.minute % 5
         ts -= timedelta(minutes=extra_min)
 
-        # parse html to df
-        dfs = pd.read_html(response.content, header=0, index_col=0)
-        df = dfs[0]
         if key and header:
             val = df.loc[key][header]
         else:
@@ -92,6 +93,11 @@ class PJMClient(BaseClient):
         # return
         return ts, val
 
+    def _parse_edata_page(self, response):
+        doc = self.parse_html(response.content)
+        ts = self.time_as_of_html(doc)
+        return ts, self.html_table(doc, header=0, index_col=0)
+
     def fetch_edata_series(self, data_type, params=None):
         # get request
         url = self.base_url + data_type + '.aspx'
@@ -100,8 +106,9 @@ class PJMClient(BaseClient):
             return pd.Series()
 
         # parse html to df
-        dfs = pd.read_html(response.content, header=0, index_col=0)
-        df = dfs[0]
+        df = self.html_table(self.parse_html(response.content), header=0, index_col=0)
+        if df is None:
+            return pd.Series()
         df.index = pd.to_datetime(df.index, utc=True)
         df.index.set_names(['timestamp'], inplace=True)
 
@@ -119,7 +126,10 @@ class PJMClient(BaseClient):
     def fetch_historical_load(self, year, region_name='RTO'):
         # get RTO data
         url = 'http://www.pjm.com/pub/operations/hist-meter-load/%s-hourly-loads.xls' % year
-        df = pd.read_excel(url, sheetname=region_name)
+        xd = self.fetch_xls(url)
+        if xd is None:
+            return pd.DataFrame()
+        df = xd.parse(region_name)
 
         # drop unneeded cols
         drop_cols = ['Unnamed: %d' % i for i in range(35)]
@@ -141,10 +151,15 @@ class PJMClient(BaseClient):
         # utcify
         # TODO handle DST transitions properly, this just returns Not a Time
         # and utcify_index fails with AmbiguousTimeError, even with ambiguous='infer'
-        f = lambda x: pytz.timezone(self.TZ_NAME).localize(x['timestamp'])
-        df['timestamp'] = df.apply(f, axis=1)
+        # until then, rows on the days DST starts or ends are still localized one at a time, and the rest all at once
+        tz = pytz.timezone(self.TZ_NAME)
+        local_tss = df['timestamp']
+        on_transition = self.dst_transition_days(local_tss).values
+        utc_tss = np.empty(len(local_tss), dtype=object)
+        utc_tss[on_transition] = [tz.localize(ts).astimezone(pytz.utc) for ts in local_tss[on_transition]]
+        utc_tss[~on_transition] = list(self.utcify_many(local_tss[~on_transition]))
+        df['timestamp'] = pd.DatetimeIndex(list(utc_tss)).tz_convert(pytz.utc)
         df.set_index('timestamp', inplace=True)
-        df = self.utcify_index(df)
 
         # drop unneeded cols
         drop_col = ['datetime_str', 'DATE', 'hour', 'variable', 'COMP']
@@ -157,6 +172,16 @@ class PJMClient(BaseClient):
         df.dropna(subset=['load_MW'], inplace=True)
         return df
 
+    def dst_transition_days(self, local_tss):
+        """Returns a boolean Series that is True for the naive local timestamps on days when DST starts or ends."""
+        tz = pytz.timezone(self.TZ_NAME)
+        days = local_tss.dt.normalize()
+        transition_days = []
+        for day in pd.DatetimeIndex(days.dropna().unique()).to_pydatetime():
+            if tz.localize(day).utcoffset() != tz.localize(day + timedelta(days=1)).utcoffset():
+                transition_days.append(day)
+        return days.isin(transition_days)
+
     def get_load(self, latest=False, start_at=None, end_at=None, forecast=False, **kwargs):
         # set args
         self.handle_options(data='load', latest=latest,
@@ -355,15 +380,12 @@ class PJMClient(BaseClient):
             if not self.options['latest']:
                 raise ValueError('PJM generation mix only available with latest=True')
 
-    def parse_date_from_oasis(self, content):
-        # find timestamp
-        soup = BeautifulSoup(content, 'lxml')
-
+    def parse_date_from_oasis(self, doc):
         # the datetime is the only bold text on the page, this could break easily
-        ts_elt = soup.find('b')
+        ts_elt = doc.xpath('//b')[0]
 
         # do not pass tzinfos argument to dateutil.parser.parse, it fails arithmetic
-        ts = parse(ts_elt.string, ignoretz=True)
+        ts = parse(ts_elt.text_content(), ignoretz=True)
         ts = pytz.timezone('US/Eastern').localize(ts)
         ts = ts.astimezone(pytz.utc)
 
@@ -379,14 +401,12 @@ class PJMClient(BaseClient):
                 return None, None
 
         # get timestamp
-        ts = self.parse_date_from_oasis(response.content)
-
-        # parse to dataframes
-        dfs = pd.read_html(response.content, header=0, index_col=0, parse_dates=False)
+        doc = self.parse_html(response.content)
+        ts = self.parse_date_from_oasis(doc)
 
         if self.options['data'] == 'lmp':
             # parse LMP
-            df = dfs[1]
+            df = self.html_table(doc, 1, header=0, index_col=0, parse_dates=False)
 
             # parse lmp
             df['node_id'] = df.index
@@ -404,7 +424,7 @@ class PJMClient(BaseClient):
 
         elif self.options['data'] == 'load':
             # parse real-time load
-            df = dfs[4]
+            df = self.html_table(doc, 4, header=0, index_col=0, parse_dates=False)
             load_val = df.loc['PJM RTO'][0]
             return ts, load_val
 
@@ -0,0 +1,140 @@
+"""
+Process-wide, per-host rate limiting for requests to data sources.
+
+Every :py:class:`pyiso.base.BaseClient` asks the limiter for permission before each request,
+so all clients and threads in the process that talk to the same host share one budget.
+Limits are token buckets: ``rate`` requests per second on average,
+with up to ``burst`` requests allowed back to back after an idle period.
+"""
+from threading import Lock
+from time import sleep
+try:
+    from time import monotonic
+except ImportError:  # python 2
+    from time import time as monotonic
+try:
+    from urlparse import urlparse
+except ImportError:
+    from urllib.parse import urlparse
+
+
+# (requests per second, burst) for each host
+# CAISO OASIS averages one request every 5 seconds, with a burst of 3 so that a latest poll
+# or a call that needs a few queries isn't held up; a 429 still holds off the host
+RATE_LIMITS = {
+    'oasis.caiso.com': (0.2, 3),
+    'content.caiso.com': (5, 10),
+    'mis.ercot.com': (5, 10),
+    'www.ercot.com': (2, 4),
+    'mis.nyiso.com': (5, 10),
+    'webservices.iso-ne.com': (2, 4),
+    'www.misoenergy.org': (5, 10),
+    'datasnapshot.pjm.com': (2, 4),
+    'dataminer.pjm.com': (2, 4),
+    'oasis.pjm.com': (2, 4),
+    'www.oasis.oati.com': (2, 4),
+    'sveri.energy.arizona.edu': (2, 4),
+    'transmission.bpa.gov': (2, 4),
+    'transparency.entsoe.eu': (1, 2),
+}
+
+# (requests per second, burst) for hosts not in RATE_LIMITS
+DEFAULT_RATE_LIMIT = (10, 20)
+
+
+class TokenBucket(object):
+    """
+    Thread-safe token bucket.
+    Callers that find the bucket empty take a token on credit and wait until it would have refilled,
+    so waiting callers are served in the order they arrived.
+    """
+    def __init__(self, rate, burst):
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self.tokens = self.burst
+        self.updated = monotonic()
+        self.lock = Lock()
+
+    def _refill(self):
+        now = monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self):
+        """Take one token and return the number of seconds to wait before using it."""
+        with self.lock:
+            self._refill()
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0
+            return -self.tokens / self.rate
+
+    def acquire(self):
+        """Take one token, sleeping until it is available. Returns the number of seconds slept."""
+        wait = self.reserve()
+        if wait > 0:
+            sleep(wait)
+        return wait
+
+    def penalize(self, seconds):
+        """Empty the bucket so that the next token is not available for at least this many seconds."""
+        with self.lock:
+            self._refill()
+            self.tokens = min(self.tokens, -seconds * self.rate)
+
+
+_buckets = {}
+_buckets_lock = Lock()
+
+
+def host_for(url):
+    """Return the lower-case host name of a URL."""
+    return (urlparse(url).hostname or '').lower()
+
+
+def set_rate_limit(host, rate, burst=1):
+    """
+    Set the rate limit for requests to a host, shared by all clients in this process.
+
+    :param str host: Host name, eg 'oasis.caiso.com'.
+    :param float rate: Average number of requests per second. If None, requests to this host are not limited.
+    :param int burst: Number of requests allowed back to back after an idle period.
+    """
+    host = host.lower()
+    with _buckets_lock:
+        RATE_LIMITS[host] = (rate, burst)
+        _buckets.pop(host, None)
+
+
+def bucket_for(url):
+    """Return the shared TokenBucket for the host of this URL, or None if the host is not limited."""
+    host = host_for(url)
+    with _buckets_lock:
+        try:
+            return _buckets[host]
+        except KeyError:
+            rate, burst = RATE_LIMITS.get(host, DEFAULT_RATE_LIMIT)
+            bucket = TokenBucket(rate, burst) if rate else None
+            _buckets[host] = bucket
+            return bucket
+
+
+def acquire(url):
+    """Wait for permission to make a request to this URL. Returns the number of seconds waited."""
+    bucket = bucket_for(url)
+    if bucket is None:
+        return 0
+    return bucket.acquire()
+
+
+def penalize(url, seconds):
+    """Hold off all requests to the host of this URL for at least this many seconds, eg after a 429."""
+    bucket = bucket_for(url)
+    if bucket is not None:
+        bucket.penalize(seconds)
+
+
+def reset():
+    """Forget all bucket state, eg between tests."""
+    with _buckets_lock:
+        _buckets.clear()
@@ -0,0 +1,81 @@
+"""
+Retry policy for failed requests.
+
+:py:meth:`BaseClient.request` retries connection errors, timeouts and responses with a retryable status
+(throttling and server errors), waiting an exponentially growing, jittered time between attempts.
+Each get_* call may also have a deadline: once it has passed, failed requests are not retried any more,
+so one flaky endpoint can't hold up a scheduled poll indefinitely.
+"""
+import random
+from time import sleep
+try:
+    from time import monotonic
+except ImportError:  # python 2
+    from time import time as monotonic
+
+
+class RetryPolicy(object):
+    """
+    When and how long to wait before retrying a failed request.
+
+    :param int max_retries: Number of times to retry a request after its first attempt.
+    :param float backoff_sec: Wait before the first retry, doubled for each retry after that.
+    :param float max_backoff_sec: Cap on the wait between retries.
+    :param float jitter: Each wait is scaled by a random factor between 1-jitter and 1+jitter,
+        so clients that failed together don't retry together.
+    :param retry_statuses: HTTP status codes to retry.
+    :param bool retry_connection_errors: If True, retry connection errors and timeouts.
+    :param float deadline_sec: Seconds from the start of each get_* call after which nothing is retried,
+        or None for no deadline. Request timeouts are also cut short to end at the deadline.
+    """
+    def __init__(self, max_retries=3, backoff_sec=5, max_backoff_sec=60, jitter=0.25,
+                 retry_statuses=(429, 500, 502, 503, 504), retry_connection_errors=True,
+                 deadline_sec=None):
+        self.max_retries = max_retries
+        self.backoff_sec = backoff_sec
+        self.max_backoff_sec = max_backoff_sec
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_connection_errors = retry_connection_errors
+        self.deadline_sec = deadline_sec
+
+    def is_retryable_status(self, status_code):
+        return status_code in self.retry_statuses
+
+    def backoff(self, retry_num, backoff_sec=None):
+        """
+        Returns the number of seconds to wait before this retry (counting from 0).
+
+        :param float backoff_sec: Wait before the first retry, instead of the policy's.
+        """
+        if backoff_sec is None:
+            backoff_sec = self.backoff_sec
+        wait_sec = min(backoff_sec * 2 ** retry_num, self.max_backoff_sec)
+        return wait_sec * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def new_deadline(self):
+        """Returns the deadline for a get_* call starting now, in time.monotonic() seconds, or None."""
+        if self.deadline_sec is None:
+            return None
+        return monotonic() + self.deadline_sec
+
+
+def time_left(deadline):
+    """Returns the number of seconds until this deadline (negative once it's passed), or None if there is none."""
+    if deadline is None:
+        return None
+    return deadline - monotonic()
+
+
+# used by clients that don't set their own retry_policy
+DEFAULT_POLICY = RetryPolicy()
+
+
+def configure(**kwargs):
+    """
+    Replace the default retry policy for all clients in this process.
+    Takes the same keyword arguments as :py:class:`RetryPolicy`.
+    """
+    global DEFAULT_POLICY
+    DEFAULT_POLICY = RetryPolicy(**kwargs)
+    return DEFAULT_POLICY
@@ -0,0 +1,148 @@
+"""
+Process-wide pool of HTTP sessions, one per host.
+
+Clients that do not have a session of their own use the pooled session for the host they are requesting,
+so keep-alive connections (and their TCP and TLS handshakes) are reused across client instances,
+eg across the short-lived clients that :py:mod:`pyiso.tasks` builds for every task.
+
+Identical GETs made at the same time by different threads are coalesced by :py:data:`in_flight`,
+so they share one round-trip and one response.
+"""
+import os
+from threading import Event, Lock
+import requests
+from requests.adapters import HTTPAdapter
+try:
+    from urlparse import urlparse
+except ImportError:
+    from urllib.parse import urlparse
+
+
+# number of hosts to keep connection pools for, per session
+POOL_CONNECTIONS = 10
+
+# number of connections to keep open to each host, ie the number of requests that can share connections at once
+POOL_MAXSIZE = 32
+
+# retries for failures to establish a connection, see urllib3.util.retry.Retry.
+# off by default, since BaseClient.request already retries connection errors under its RetryPolicy
+MAX_RETRIES = 0
+
+# if False, ask servers to close connections after each request
+KEEP_ALIVE = True
+
+
+_sessions = {}
+_lock = Lock()
+_pid = os.getpid()
+
+
+def new_session():
+    """Return a new requests.Session with the configured connection pool and retry adapters."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE,
+                          max_retries=MAX_RETRIES)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    if not KEEP_ALIVE:
+        session.headers['Connection'] = 'close'
+    return session
+
+
+def get_session(url):
+    """Return the shared session for the host of this URL, creating it if needed."""
+    global _pid
+    key = (urlparse(url).scheme, (urlparse(url).netloc or '').lower())
+
+    with _lock:
+        # connections can't be shared with a parent process, eg after a celery worker forks
+        if os.getpid() != _pid:
+            _sessions.clear()
+            _pid = os.getpid()
+
+        try:
+            return _sessions[key]
+        except KeyError:
+            session = new_session()
+            _sessions[key] = session
+            return session
+
+
+def configure(pool_connections=None, pool_maxsize=None, max_retries=None, keep_alive=None):
+    """
+    Change the settings for pooled sessions, and close any existing ones so the settings take effect.
+
+    :param int pool_connections: Number of hosts to keep connection pools for, per session.
+    :param int pool_maxsize: Number of connections to keep open to each host.
+    :param max_retries: Retries for failed connections, as an int or a urllib3 Retry object,
+        made within each attempt that the client's RetryPolicy makes.
+    :param bool keep_alive: If False, ask servers to close connections after each request.
+    """
+    global POOL_CONNECTIONS, POOL_MAXSIZE, MAX_RETRIES, KEEP_ALIVE
+    if pool_connections is not None:
+        POOL_CONNECTIONS = pool_connections
+    if pool_maxsize is not None:
+        POOL_MAXSIZE = pool_maxsize
+    if max_retries is not None:
+        MAX_RETRIES = max_retries
+    if keep_alive is not None:
+        KEEP_ALIVE = keep_alive
+    close_all()
+
+
+def close_all():
+    """Close and forget all pooled sessions."""
+    with _lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+
+class SingleFlight(object):
+    """
+    Runs at most one call at a time for each key.
+    Callers that ask for a key while its call is running wait for it and share its result (or exception).
+    """
+    class Call(object):
+        def __init__(self):
+            self.done = Event()
+            self.result = None
+            self.error = None
+
+    def __init__(self):
+        self.lock = Lock()
+        self.calls = {}
+
+    def do(self, key, fn):
+        """Returns fn(), or the result of the call already running for this key."""
+        with self.lock:
+            call = self.calls.get(key)
+            leader = call is None
+            if leader:
+                call = self.Call()
+                self.calls[key] = call
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self.lock:
+                del self.calls[key]
+            call.done.set()
+        return call.result
+
+    def __len__(self):
+        with self.lock:
+            return len(self.calls)
+
+
+# shared by all clients in the process
+in_flight = SingleFlight()
@@ -1,5 +1,5 @@
 from pyiso.base import BaseClient
-from pyiso import LOGGER
+from pyiso import LOGGER, parallel
 from datetime import datetime, timedelta
 from dateutil.parser import parse as dateutil_parse
 import pandas as pd
@@ -28,28 +28,87 @@ class SVERIClient(BaseClient):
         'Nuclear Aggregate (MW)': 'nuclear',
     }
 
-    def _get_payload(self, ids):
+    # generation comes in two requests, one for each set of ids
+    gen_ids = ('1,2,3,4', '5,6,7,8')
+    load_ids = '0'
+
+    # longest span of days to get in one request; longer ranges are split up and fetched concurrently
+    CHUNK_DAYS = 7
+
+    def _date_range(self):
+        """Returns the local start and end dates of the requested data."""
         if self.options['latest']:
             now = datetime.now(pytz.timezone(self.TZ_NAME))
-            start = now.strftime('%Y-%m-%d')
-            end = (now + timedelta(days=1)).strftime('%Y-%m-%d')
+            return now.date(), (now + timedelta(days=1)).date()
         else:
-            start = self.options['start_at'].astimezone(pytz.timezone(self.TZ_NAME)).strftime('%Y-%m-%d')
-            end = self.options['end_at'].astimezone(pytz.timezone(self.TZ_NAME)).strftime('%Y-%m-%d')
+            start = self.options['start_at'].astimezone(pytz.timezone(self.TZ_NAME)).date()
+            end = self.options['end_at'].astimezone(pytz.timezone(self.TZ_NAME)).date()
+            return start, end
+
+    def _date_ranges(self):
+        """
+        Returns a list of (start, end) local dates that cover the requested data, each at most CHUNK_DAYS long.
+        Each chunk starts on the day the previous one ends, so none are missed whether or not endDate is inclusive.
+        """
+        start, end = self._date_range()
+        ranges = []
+        while True:
+            chunk_end = min(start + timedelta(days=self.CHUNK_DAYS), end)
+            ranges.append((start, chunk_end))
+            if chunk_end >= end:
+                return ranges
+            start = chunk_end
+
+    def _get_payload(self, ids, date_range=None):
+        start, end = date_range or self._date_range()
         return {
             'ids': ids,
-            'startDate': start,
-            'endDate': end,
+            'startDate': start.strftime('%Y-%m-%d'),
+            'endDate': end.strftime('%Y-%m-%d'),
             'saveData': 'true'
         }
 
     def get_gen_payloads(self):
-        p1 = self._get_payload('1,2,3,4')
-        p2 = self._get_payload('5,6,7,8')
-        return (p1, p2)
+        return tuple(self._get_payload(ids) for ids in self.gen_ids)
 
     def get_load_payload(self):
-        return self._get_payload('0')
+        return self._get_payload(self.load_ids)
+
+    def fetch_df(self, payload):
+        """Returns a DataFrame of the csv for this payload, or None if an error was encountered."""
+        response = self.request(self.BASE_URL, params=payload)
+        if not response or response.text.startswith('Invalid ids string'):
+            return None
+
+        return self.parse_to_df(response.content, header=0,
+                                parse_dates=True, date_parser=self.date_parser, index_col=0)
+
+    def fetch_chunks(self, id_sets):
+        """
+        Fetch and parse every chunk of the requested range for these sets of ids, several at once,
+        and return one DataFrame with a column for each id, in time order.
+        Chunks with a failed request for any set of ids are left out.
+        """
+        # each request is parsed as soon as it arrives, so a long range is never held as one huge csv
+        ranges = self._date_ranges()
+        payloads = [self._get_payload(ids, date_range) for date_range in ranges for ids in id_sets]
+        dfs = parallel.map_ordered(self.fetch_df, payloads, max_workers=self.max_workers)
+
+        # join the sets of ids for each chunk
+        pieces = []
+        for ichunk in range(len(ranges)):
+            chunk_dfs = dfs[ichunk * len(id_sets):(ichunk + 1) * len(id_sets)]
+            if any(df is None for df in chunk_dfs):
+                LOGGER.warn('%s: no data for %s to %s' % (self.NAME, ranges[ichunk][0], ranges[ichunk][1]))
+                continue
+            pieces.append(pd.concat(chunk_dfs, axis=1, join='inner'))
+
+        if not pieces:
+            return pd.DataFrame()
+
+        # neighbouring chunks can share their boundary day
+        df = pd.concat(pieces)
+        return df[~df.index.duplicated(keep='first')]
 
     def clean_df(self, df):
         # take only data at 5 minute marks
@@ -93,22 +152,8 @@ class SVERIClient(BaseClient):
                             start_at=start_at, end_at=end_at, **kwargs)
         self.no_forecast_warn()
 
-        # fetch data
-        payloads = self.get_gen_payloads()
-        response = self.request(self.BASE_URL, params=payloads[0])
-        response2 = self.request(self.BASE_URL, params=payloads[1])
-        if not response or not response2:
-            return []
-
-        if response.text == 'Invalid ids string.' or response2.text == 'Invalid ids string':
-            return []
-
-        # parse
-        df = self.parse_to_df(response.content, header=0,
-                              parse_dates=True, date_parser=self.date_parser, index_col=0)
-        df2 = self.parse_to_df(response2.content, header=0,
-                               parse_dates=True, date_parser=self.date_parser, index_col=0)
-        df = pd.concat([df, df2], axis=1, join='inner')
+        # fetch and parse data
+        df = self.fetch_chunks(self.gen_ids)
 
         # clean and serialize
         return self._clean_and_serialize(df)
@@ -119,14 +164,8 @@ class SVERIClient(BaseClient):
                             start_at=start_at, end_at=end_at, **kwargs)
         self.no_forecast_warn()
 
-        # fetch data
-        payload = self.get_load_payload()
-        response = self.request(self.BASE_URL, params=payload)
-        if not response:
-            return []
-
-        # parse
-        df = self.parse_to_df(response.content, header=0, parse_dates=True, date_parser=self.date_parser, index_col=0)
+        # fetch and parse data
+        df = self.fetch_chunks([self.load_ids])
 
         # clean and serialize
         return self._clean_and_serialize(df)
@@ -63,7 +63,7 @@ setup(
     test_suite='nose.collector',
     install_requires=[
         'beautifulsoup4==4.5.0',
-        'pandas>=0.18',
+        'pandas>=0.20',
         'python-dateutil',
         'pytz',
         'requests',
@@ -72,5 +72,6 @@ setup(
         'lxml==3.6.1',
         'html5lib',
         'mock',
+        'futures; python_version < "3"',
     ],
 )
@@ -0,0 +1,13 @@
+import requests
+
+
+def make_response(content=b'', status_code=200, headers=None, url='http://example.com/data.csv'):
+    """Returns a requests.Response with this body, as if it had been fetched from url."""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    response.headers['Content-Type'] = 'text/csv'
+    response.headers.update(headers or {})
+    response.encoding = 'utf-8'
+    response.url = url
+    return response
@@ -1,6 +1,11 @@
-from unittest import TestCase
+from unittest import TestCase, SkipTest
 from pyiso.base import BaseClient
+from tests.helpers import make_response
 from datetime import datetime, timedelta
+from io import BytesIO, StringIO
+import requests
+import zipfile
+import mock
 import pytz
 import pandas as pd
 
@@ -104,12 +109,129 @@ class TestBaseClient(TestCase):
         bc.handle_options(start_at=start, end_at=start+timedelta(days=2))
         self.assertTrue(bc.options['forecast'])
 
+    def test_utcify_many_matches_utcify(self):
+        bc = BaseClient()
+        local_tss = ['2016-11-06 00:30', '2016-11-06 01:30', '2016-03-13 02:30', '2016-07-01 12:00']
+        utc_tss = bc.utcify_many(local_tss, tz_name='US/Eastern')
+        self.assertEqual(list(utc_tss.to_pydatetime()),
+                         [bc.utcify(ts, tz_name='US/Eastern') for ts in local_tss])
+        self.assertEqual(utc_tss.tz, pytz.utc)
+
+    def test_utcify_many_is_dst(self):
+        bc = BaseClient()
+        local_tss = [datetime(2016, 11, 6, 1, 30), datetime(2016, 11, 6, 1, 30)]
+        utc_tss = bc.utcify_many(local_tss, tz_name='US/Eastern', is_dst=[True, False])
+        self.assertEqual(list(utc_tss.to_pydatetime()),
+                         [datetime(2016, 11, 6, 5, 30, tzinfo=pytz.utc), datetime(2016, 11, 6, 6, 30, tzinfo=pytz.utc)])
+
+        utc_tss = bc.utcify_many(local_tss, tz_name='US/Eastern', is_dst=True)
+        self.assertEqual(list(utc_tss.to_pydatetime()), [datetime(2016, 11, 6, 5, 30, tzinfo=pytz.utc)] * 2)
+
+    def test_utcify_many_mixed(self):
+        """Values that can't be parsed together are done one at a time"""
+        bc = BaseClient()
+        local_tss = ['2014-05-08T19:15:00-00:00', '2014-05-08 12:00']
+        utc_tss = bc.utcify_many(local_tss, tz_name='US/Pacific')
+        self.assertEqual(list(utc_tss.to_pydatetime()),
+                         [datetime(2014, 5, 8, 19, 15, tzinfo=pytz.utc), datetime(2014, 5, 8, 19, 0, tzinfo=pytz.utc)])
+
+    def test_utcify_many_empty(self):
+        bc = BaseClient()
+        self.assertEqual(len(bc.utcify_many([])), 0)
+
+    def test_utcify_index_tz_col(self):
+        bc = BaseClient()
+        bc.TZ_NAME = 'America/New_York'
+        local_index = pd.DatetimeIndex(['2016-11-06 00:30', '2016-11-06 01:30', '2016-11-06 01:30',
+                                        '2016-11-06 02:30', '2016-11-06 01:00'])
+        tz_col = pd.Series(['EDT', 'EDT', 'EST', 'EST', None], index=local_index)
+        utc_index = bc.utcify_index(local_index, tz_col=tz_col)
+
+        # EST is a known tz, EDT and missing labels fall back to the client tz with repeated times in daylight time
+        self.assertEqual(list(utc_index.to_pydatetime()),
+                         [datetime(2016, 11, 6, 4, 30, tzinfo=pytz.utc), datetime(2016, 11, 6, 5, 30, tzinfo=pytz.utc),
+                          datetime(2016, 11, 6, 6, 30, tzinfo=pytz.utc), datetime(2016, 11, 6, 7, 30, tzinfo=pytz.utc),
+                          datetime(2016, 11, 6, 5, 0, tzinfo=pytz.utc)])
+        self.assertEqual(utc_index.tz, pytz.utc)
+
+    def test_html_table(self):
+        bc = BaseClient()
+        content = u"""<html><body>
+            <p>As of <b>12:00</b></p>
+            <table><tr><td>ignored</td></tr></table>
+            <table id="prices">
+                <thead><tr><th>Node</th><th colspan="2">MW</th></tr></thead>
+                <tbody>
+                    <tr><td>A</td><td>1,200</td><td>3</td></tr>
+                    <tr><td>B</td><td>  5 </td><td style="display: none">4</td><td>6</td></tr>
+                </tbody>
+            </table>
+            </body></html>"""
+        doc = bc.parse_html(content)
+
+        # same as read_html
+        expected = pd.read_html(StringIO(content), index_col=0)[1]
+        df = bc.html_table(doc, 1, index_col=0)
+        pd.testing.assert_frame_equal(df, expected)
+        self.assertEqual(df.loc['A', 'MW'], 1200)
+
+        # by id
+        pd.testing.assert_frame_equal(bc.html_table(doc, table_id='prices', index_col=0), expected)
+
+        # missing
+        self.assertIsNone(bc.html_table(doc, 2))
+        self.assertIsNone(bc.html_table(doc, table_id='load'))
+        self.assertIsNone(bc.html_table(bc.parse_html('')))
+
     def test_bad_zipfile(self):
         bc = BaseClient()
         badzip = 'I am not a zipfile'
         result = bc.unzip(badzip)
         self.assertIsNone(result)
 
+    def make_zip(self, files):
+        zipped = BytesIO()
+        with zipfile.ZipFile(zipped, 'w') as z:
+            for name, content in files:
+                z.writestr(name, content)
+        return zipped.getvalue()
+
+    def test_unzip_lazy(self):
+        bc = BaseClient()
+        content = bc.unzip(self.make_zip([('a.csv', b'a,b\n1,2\n'), ('b.csv', b'a,b\n3,4\n')]))
+        self.assertEqual(len(content), 2)
+
+        with mock.patch.object(content.zipfile, 'read', wraps=content.zipfile.read) as mock_read:
+            self.assertEqual(content[0], b'a,b\n1,2\n')
+            self.assertEqual(content[0], b'a,b\n1,2\n')
+            self.assertEqual(mock_read.call_count, 1)
+
+        self.assertEqual(list(content), [b'a,b\n1,2\n', b'a,b\n3,4\n'])
+        df = bc.parse_to_df(content.open(1))
+        self.assertEqual(list(df['a']), [3])
+
+    def test_fetch_to_file(self):
+        bc = BaseClient()
+        bc.session = mock.MagicMock()
+        response = requests.Response()
+        response.status_code = 200
+        response.raw = BytesIO(self.make_zip([('a.csv', b'a,b\n1,2\n')]))
+        bc.session.get.return_value = response
+
+        zipped = bc.fetch_to_file('http://example.com/data_csv.zip')
+        self.assertTrue(bc.session.get.call_args[1]['stream'])
+        self.assertEqual(bc.unzip(zipped)[0], b'a,b\n1,2\n')
+
+    def test_fetch_to_file_error_closes(self):
+        bc = BaseClient()
+        bc.session = mock.MagicMock()
+        response = make_response(b'not found', status_code=404)
+        bc.session.get.return_value = response
+
+        with mock.patch.object(response, 'close') as mock_close:
+            self.assertIsNone(bc.fetch_to_file('http://example.com/data_csv.zip'))
+        mock_close.assert_called_once_with()
+
     def test_slice_empty(self):
         bc = BaseClient()
         indf = pd.DataFrame()
@@ -122,3 +244,34 @@ class TestBaseClient(TestCase):
 
         bc = BaseClient(timeout_seconds=30)
         self.assertEqual(bc.timeout_seconds, 30)
+
+    def event_loop(self):
+        """Returns a new event loop, set as the current one until the test ends. Skips the test without asyncio."""
+        try:
+            import asyncio
+        except ImportError:
+            raise SkipTest('asyncio is not available')
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self.addCleanup(loop.close)
+        self.addCleanup(asyncio.set_event_loop, None)
+        return loop
+
+    def test_aget_load(self):
+        """aget_load runs get_load on a copy of the client in the event loop's executor"""
+        class LoadClient(BaseClient):
+            def get_load(self, latest=False, **kwargs):
+                self.handle_options(latest=latest, **kwargs)
+                return [{'latest': self.options['latest']}]
+
+        bc = LoadClient()
+        loop = self.event_loop()
+        data = loop.run_until_complete(bc.aget_load(latest=True))
+
+        self.assertEqual(data, [{'latest': True}])
+        self.assertEqual(len(bc.options.keys()), 0)
+
+    def test_aget_not_implemented(self):
+        bc = BaseClient()
+        loop = self.event_loop()
+        self.assertRaises(NotImplementedError, loop.run_until_complete, bc.aget_trade(latest=True))
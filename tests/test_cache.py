@@ -0,0 +1,243 @@
+from pyiso import cache
+from pyiso.base import BaseClient
+from unittest import TestCase
+from tests.helpers import make_response
+from datetime import date
+from io import BytesIO
+import shutil
+import tempfile
+import zipfile
+import mock
+import os
+
+
+class TestResponseCache(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.store = cache.ResponseCache(self.directory)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_ttl_past_day_forever(self):
+        url = 'http://mis.nyiso.com/public/csv/pal/20160101pal.csv'
+        self.assertIsNone(self.store.ttl_for(url, today=date(2016, 6, 1)))
+
+    def test_ttl_current_day(self):
+        url = 'http://mis.nyiso.com/public/csv/pal/20160101pal.csv'
+        self.assertEqual(self.store.ttl_for(url, today=date(2016, 1, 1)), 300)
+
+    def test_ttl_month(self):
+        url = 'http://mis.nyiso.com/public/csv/pal/20160101pal_csv.zip'
+        self.assertEqual(self.store.ttl_for(url, today=date(2016, 1, 20)), 3600)
+        self.assertEqual(self.store.ttl_for(url, today=date(2016, 2, 1)), 3600)
+        self.assertIsNone(self.store.ttl_for(url, today=date(2016, 2, 10)))
+
+    def test_ttl_year(self):
+        url = 'https://transmission.bpa.gov/business/operations/wind/WindGenTotalLoadYTD_2015.xls'
+        self.assertEqual(self.store.ttl_for(url, today=date(2015, 12, 31)), 3600)
+        self.assertIsNone(self.store.ttl_for(url, today=date(2016, 3, 1)))
+
+    def test_ttl_current_page(self):
+        url = 'http://content.caiso.com/outlook/SP/renewables.html'
+        self.assertEqual(self.store.ttl_for(url), 30)
+
+    def test_ttl_params(self):
+        url = self.store.cache_url('http://oasis.caiso.com/oasisapi/SingleZip',
+                                   {'queryname': 'SLD_FCST', 'startdatetime': '20160101T08:00-0000',
+                                    'enddatetime': '20160102T08:00-0000'})
+        self.assertIsNone(self.store.ttl_for(url, today=date(2016, 6, 1)))
+
+    def test_ttl_no_rule(self):
+        self.assertEqual(self.store.ttl_for('http://mis.nyiso.com/public/csv/pal/'), 0)
+        self.assertEqual(self.store.ttl_for('http://mis.nyiso.com/public/csv/pal/20160101pal_prelim.txt'), 0)
+
+    def test_roundtrip(self):
+        url = 'http://mis.nyiso.com/public/csv/pal/20160101pal.csv'
+        self.store.set(url, make_response(b'a,b\n1,2\n'))
+        cached = self.store.get(url)
+        self.assertEqual(cached.status_code, 200)
+        self.assertEqual(cached.content, b'a,b\n1,2\n')
+        self.assertEqual(cached.text, 'a,b\n1,2\n')
+        self.assertEqual(cached.headers['content-type'], 'text/csv')
+        self.assertTrue(cached.from_cache)
+
+    def test_miss(self):
+        self.assertIsNone(self.store.get('http://mis.nyiso.com/public/csv/pal/20160101pal.csv'))
+
+    def test_expired(self):
+        url = 'http://content.caiso.com/outlook/SP/renewables.html'
+        self.store.set(url, make_response(b'<html></html>'), ttl=-1)
+        self.assertIsNone(self.store.get(url))
+
+    def make_zip(self, content):
+        zipped = BytesIO()
+        with zipfile.ZipFile(zipped, 'w') as z:
+            z.writestr('report.xml', content)
+        return zipped.getvalue()
+
+    def test_oasis_error_report_not_stored(self):
+        url = self.store.cache_url('http://oasis.caiso.com/oasisapi/SingleZip',
+                                   {'queryname': 'SLD_FCST', 'startdatetime': '20160101T08:00-0000',
+                                    'enddatetime': '20160102T08:00-0000'})
+        error = b'<m:RTO><m:ERROR><m:ERR_CODE>1000</m:ERR_CODE></m:ERROR></m:RTO>'
+        self.store.set(url, make_response(self.make_zip(error)))
+        self.assertIsNone(self.store.get(url))
+
+        self.store.set(url, make_response(b''))
+        self.assertIsNone(self.store.get(url))
+
+        report = self.make_zip(b'<m:RTO><m:REPORT_DATA><m:VALUE>1</m:VALUE></m:REPORT_DATA></m:RTO>')
+        self.store.set(url, make_response(report))
+        self.assertEqual(self.store.get(url).content, report)
+
+    def test_lru_eviction(self):
+        self.store.max_bytes = 35
+        for i in range(3):
+            url = 'http://mis.nyiso.com/public/csv/pal/2016010%dpal.csv' % (i + 1)
+            self.store.set(url, make_response(b'x' * 10))
+            # make sure mtimes differ so LRU order is well defined
+            os.utime(self.store._paths(url)[2], (i, i))
+
+        # use the oldest entry so the second one becomes least recently used
+        self.assertIsNotNone(self.store.get('http://mis.nyiso.com/public/csv/pal/20160101pal.csv'))
+        self.store.set('http://mis.nyiso.com/public/csv/pal/20160104pal.csv', make_response(b'x' * 10))
+
+        self.assertIsNone(self.store.get('http://mis.nyiso.com/public/csv/pal/20160102pal.csv'))
+        self.assertIsNotNone(self.store.get('http://mis.nyiso.com/public/csv/pal/20160104pal.csv'))
+        self.assertLessEqual(sum(size for t, size, p in self.store._entries()), 35)
+
+
+class TestCachedRequest(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        cache.configure(self.directory)
+
+    def tearDown(self):
+        cache.configure(None)
+        shutil.rmtree(self.directory)
+
+    def test_request_uses_cache(self):
+        bc = BaseClient()
+        bc.session = mock.MagicMock()
+        bc.session.get.return_value = make_response(b'a,b\n1,2\n')
+
+        url = 'http://mis.nyiso.com/public/csv/pal/20160101pal.csv'
+        first = bc.request(url)
+        second = bc.request(url)
+
+        self.assertEqual(bc.session.get.call_count, 1)
+        self.assertEqual(first.content, second.content)
+        self.assertTrue(second.from_cache)
+
+    def test_request_no_rule_not_cached(self):
+        bc = BaseClient()
+        bc.session = mock.MagicMock()
+        bc.session.get.return_value = make_response(b'a,b\n1,2\n')
+
+        bc.request('http://example.com/data.csv')
+        bc.request('http://example.com/data.csv')
+        self.assertEqual(bc.session.get.call_count, 2)
+
+    def test_fetch_to_file_uses_cache(self):
+        bc = BaseClient()
+        bc.session = mock.MagicMock()
+        response = make_response(None)
+        response.raw = BytesIO(b'x' * 1000)
+        bc.session.get.return_value = response
+
+        url = 'https://transmission.bpa.gov/business/operations/wind/WindGenTotalLoadYTD_2014.xls'
+        first = bc.fetch_to_file(url)
+        second = bc.fetch_to_file(url)
+
+        self.assertEqual(bc.session.get.call_count, 1)
+        self.assertEqual(first.read(), b'x' * 1000)
+        self.assertEqual(second.read(), b'x' * 1000)
+        second.close()
+
+    def test_fetch_xls(self):
+        bc = BaseClient()
+        bc.session = mock.MagicMock()
+        response = make_response(None)
+        with open('responses/WindGenTotalLoadYTD_2014_short.xls', 'rb') as f:
+            response.raw = BytesIO(f.read())
+        bc.session.get.return_value = response
+
+        xd = bc.fetch_xls('https://transmission.bpa.gov/business/operations/wind/WindGenTotalLoadYTD_2014.xls')
+        self.assertTrue(bc.session.get.call_args[1]['stream'])
+        self.assertGreater(len(xd.sheet_names), 0)
+
+    def test_request_error_not_cached(self):
+        bc = BaseClient()
+        bc.session = mock.MagicMock()
+        bc.session.get.return_value = make_response(b'not found', status_code=404)
+
+        url = 'http://mis.nyiso.com/public/csv/pal/20160101pal.csv'
+        bc.request(url)
+        bc.request(url)
+        self.assertEqual(bc.session.get.call_count, 2)
+
+
+class TestConditionalRequest(TestCase):
+    def tearDown(self):
+        cache.conditional.clear()
+
+    def make_validated_response(self, content, status_code=200):
+        response = make_response(content, status_code=status_code)
+        response.headers['ETag'] = '"abc"'
+        response.headers['Last-Modified'] = 'Fri, 01 Jan 2016 00:00:00 GMT'
+        return response
+
+    def test_sends_validators(self):
+        bc = BaseClient()
+        bc.session = mock.MagicMock()
+        bc.session.get.return_value = self.make_validated_response(b'<html></html>')
+
+        url = 'http://example.com/latest.html'
+        bc.request(url)
+        bc.request(url)
+
+        first_kwargs = bc.session.get.call_args_list[0][1]
+        second_kwargs = bc.session.get.call_args_list[1][1]
+        self.assertNotIn('headers', first_kwargs)
+        self.assertEqual(second_kwargs['headers']['If-None-Match'], '"abc"')
+        self.assertEqual(second_kwargs['headers']['If-Modified-Since'], 'Fri, 01 Jan 2016 00:00:00 GMT')
+
+    def test_no_validators_not_stored(self):
+        bc = BaseClient()
+        bc.session = mock.MagicMock()
+        bc.session.get.return_value = make_response(b'<html></html>')
+
+        url = 'http://example.com/latest.html'
+        bc.request(url)
+        bc.request(url)
+        self.assertNotIn('headers', bc.session.get.call_args_list[1][1])
+
+    def test_not_modified_returns_previous(self):
+        bc = BaseClient()
+        bc.session = mock.MagicMock()
+        first = self.make_validated_response(b'<html></html>')
+        bc.session.get.side_effect = [first, make_response(b'', status_code=304)]
+
+        url = 'http://example.com/latest.html'
+        bc.request(url)
+        self.assertIs(bc.request(url), first)
+
+    def test_parse_once(self):
+        bc = BaseClient()
+        bc.handle_options(data='gen', latest=True)
+        response = make_response(b'a,b\n1,2\n')
+        parser = mock.MagicMock(return_value=[{'a': 1}])
+        parser.__name__ = 'parser'
+
+        first = bc.parse_once(response, parser)
+        first[0]['a'] = 2
+        second = bc.parse_once(response, parser)
+
+        self.assertEqual(parser.call_count, 1)
+        self.assertEqual(second, [{'a': 1}])
+
+        # different options parse again
+        bc.handle_options(data='load', latest=True)
+        bc.parse_once(response, parser)
+        self.assertEqual(parser.call_count, 2)
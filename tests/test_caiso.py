@@ -1,14 +1,16 @@
 import os
 from pyiso import client_factory
 from unittest import TestCase, expectedFailure, skip
-from io import StringIO
+from io import BytesIO, StringIO
 import pandas as pd
 import pytz
 from datetime import date, datetime, timedelta
 from bs4 import BeautifulSoup
+from tests.helpers import make_response
 import numpy
 import mock
 import requests
+import zipfile
 
 fixtures_base_path = os.path.join(os.path.dirname(__file__), 'fixtures')
 def read_fixture(filename):
@@ -350,6 +352,37 @@ class TestCAISOBase(TestCase):
         self.assertEqual(list(bot_df.columns), ['Hour', 'RENEWABLES', 'NUCLEAR', 'THERMAL', 'IMPORTS', 'HYDRO'])
         self.assertEqual(len(bot_df), 24)
 
+    def test_generation_historical_in_date_order(self):
+        c = client_factory('CAISO')
+        c.handle_options(data='gen', start_at='2014-03-10 00:00', end_at='2014-03-12 12:00')
+        response = mock.MagicMock()
+        response.text = self.ren_report_tsv.getvalue()
+
+        with mock.patch.object(c, 'request', return_value=response) as mock_request:
+            data = c._generation_historical()
+
+        self.assertEqual(mock_request.call_count, 3)
+        self.assertEqual(sorted(set(call[0][0][-33:-25] for call in mock_request.call_args_list)),
+                         ['20140310', '20140311', '20140312'])
+        days = [dp['timestamp'].astimezone(pytz.timezone(c.TZ_NAME)).date() for dp in data]
+        self.assertGreater(len(data), 0)
+        self.assertEqual(days, sorted(days))
+
+    def test_generation_historical_parse_processes(self):
+        """Parsing in other processes gives the same generation as parsing on the fetch threads"""
+        results = []
+        for parse_processes in [0, 2]:
+            c = client_factory('CAISO')
+            c.parse_processes = parse_processes
+            c.handle_options(data='gen', start_at='2014-03-10 00:00', end_at='2014-03-12 12:00')
+
+            # patch the class, since the client itself is pickled for the parse processes
+            with mock.patch.object(type(c), 'request', return_value=make_response(self.ren_report_tsv.getvalue().encode('utf-8'))):
+                results.append(c._generation_historical())
+
+        self.assertGreater(len(results[0]), 0)
+        self.assertEqual(results[1], results[0])
+
     def test_parse_ren_report_bot(self):
         c = client_factory('CAISO')
 
@@ -451,6 +484,81 @@ class TestCAISOBase(TestCase):
                     'load_MW': 26755.0}
         self.assertEqual(expected, parsed_data[0])
 
+    def test_parse_oasis_xml_matches_soup(self):
+        c = client_factory('CAISO')
+        for xml in [self.sld_fcst_xml, self.ene_slrs_xml, self.sld_ren_fcst_xml]:
+            streamed = c.parse_oasis_xml(BytesIO(xml.getvalue().encode('utf-8')))
+            souped = c.oasis_frame(BeautifulSoup(xml.getvalue(), 'xml').find_all('REPORT_DATA'))
+            self.assertGreater(len(streamed), 0)
+            pd.testing.assert_frame_equal(streamed, souped)
+
+    def test_parse_oasis_xml_error(self):
+        c = client_factory('CAISO')
+        error_xml = b'<?xml version="1.0" encoding="UTF-8"?>\n\
+<m:OASISReport xmlns:m="http://www.caiso.com/soa/OASISReport_v1.xsd">\n\
+<m:RTO><m:ERROR><m:ERR_CODE>1000</m:ERR_CODE><m:ERR_DESC>No data returned</m:ERR_DESC></m:ERROR></m:RTO>\n\
+</m:OASISReport>'
+        self.assertIsNone(c.parse_oasis_xml(BytesIO(error_xml)))
+
+    def test_parse_oasis_slrs_from_frame(self):
+        c = client_factory('CAISO')
+        c.handle_options(data='trade', market=c.MARKET_CHOICES.dam, freq=c.FREQUENCY_CHOICES.dam)
+        df = c.parse_oasis_xml(BytesIO(self.ene_slrs_xml.getvalue().encode('utf-8')))
+        souped = BeautifulSoup(self.ene_slrs_xml.getvalue(), 'xml').find_all('REPORT_DATA')
+        self.assertEqual(c.parse_oasis_slrs(df), c.parse_oasis_slrs(souped))
+        self.assertEqual(c.parse_oasis_slrs(df)[0]['timestamp'].tzinfo, pytz.utc)
+
+    def test_fetch_oasis_frame(self):
+        c = client_factory('CAISO')
+        zipped = BytesIO()
+        with zipfile.ZipFile(zipped, 'w') as zf:
+            zf.writestr('SLD_FCST.xml', self.sld_fcst_xml.getvalue().encode('utf-8'))
+        zipped.seek(0)
+
+        with mock.patch.object(c, 'fetch_to_file', return_value=zipped):
+            df = c.fetch_oasis_frame(payload={'queryname': 'SLD_FCST'})
+
+        self.assertEqual(list(df.columns), ['data_item', 'resource_name', 'renewable_type', 'timestamp', 'value'])
+        self.assertGreater(len(df), 0)
+
+    def test_parse_oasis_csv(self):
+        c = client_factory('CAISO')
+        csv = BytesIO(b'INTERVALSTARTTIME_GMT,INTERVALENDTIME_GMT,OPR_DT,OPR_HR,OPR_INTERVAL,LOAD_TYPE,TAC_AREA_NAME,LABEL,XML_DATA_ITEM,POS,MW,EXECUTION_TYPE,GROUP\n\
+2014-05-08T18:55:00-00:00,2014-05-08T19:00:00-00:00,2014-05-08,12,11,0,CA ISO-TAC,Demand,SYS_FCST_5MIN_MW,1,26755,RTD,1\n\
+2014-05-08T18:55:00-00:00,2014-05-08T19:00:00-00:00,2014-05-08,12,11,0,PGE-TAC,Demand,SYS_FCST_5MIN_MW,1,11000,RTD,1\n\
+2014-05-08T19:15:00-00:00,2014-05-08T19:30:00-00:00,2014-05-08,12,4,0,CA ISO-TAC,Demand,SYS_FCST_15MIN_MW,1,26723,RTPD,1\n')
+        df = c.parse_oasis_csv(csv)
+        self.assertEqual(list(df.columns), ['data_item', 'resource_name', 'renewable_type', 'timestamp', 'value'])
+        self.assertEqual(len(df), 3)
+
+        # same output as the XML report
+        c.handle_options(market=c.MARKET_CHOICES.fivemin, freq=c.FREQUENCY_CHOICES.fivemin)
+        parsed_data = c.parse_oasis_demand_forecast(df)
+        expected = {'ba_name': 'CAISO',
+                    'timestamp': datetime(2014, 5, 8, 18, 55, tzinfo=pytz.utc),
+                    'freq': '5m', 'market': 'RT5M',
+                    'load_MW': 26755.0}
+        self.assertEqual(parsed_data, [expected])
+
+    def test_parse_oasis_csv_missing_columns(self):
+        c = client_factory('CAISO')
+        self.assertIsNone(c.parse_oasis_csv(BytesIO(b'FOO,BAR\n1,2\n')))
+
+    def test_fetch_oasis_frame_csv_error(self):
+        """CSV requests that fail come back as an XML error report"""
+        c = client_factory('CAISO')
+        zipped = BytesIO()
+        with zipfile.ZipFile(zipped, 'w') as zf:
+            zf.writestr('INVALID_REQUEST.xml', b'<?xml version="1.0" encoding="UTF-8"?>\n\
+<m:OASISReport xmlns:m="http://www.caiso.com/soa/OASISReport_v1.xsd">\n\
+<m:RTO><m:ERROR><m:ERR_CODE>1000</m:ERR_CODE><m:ERR_DESC>No data returned</m:ERR_DESC></m:ERROR></m:RTO>\n\
+</m:OASISReport>')
+        zipped.seek(0)
+
+        with mock.patch.object(c, 'fetch_to_file', return_value=zipped):
+            df = c.fetch_oasis_frame(payload={'queryname': 'SLD_FCST', 'resultformat': 6})
+        self.assertEqual(len(df), 0)
+
     def test_parse_todays_outlook_renewables(self):
         # set up soup and ts
         c = client_factory('CAISO')
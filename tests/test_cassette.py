@@ -0,0 +1,62 @@
+from pyiso import cassette
+from pyiso.base import BaseClient
+from unittest import TestCase
+from tests.helpers import make_response
+import shutil
+import tempfile
+import mock
+import os
+
+
+class TestCassette(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        cassette.configure(None)
+        shutil.rmtree(self.directory)
+
+    def record(self, *args, **kwargs):
+        cassette.configure(self.directory, mode=cassette.RECORD)
+        bc = BaseClient()
+        bc.session = mock.MagicMock()
+        bc.session.get.return_value = make_response(b'a,b\n1,2\n')
+        bc.session.post.return_value = make_response(b'posted')
+        return bc.request(*args, **kwargs)
+
+    def replay(self, *args, **kwargs):
+        cassette.configure(self.directory, mode=cassette.REPLAY)
+        bc = BaseClient()
+        bc.session = mock.MagicMock()
+        response = bc.request(*args, **kwargs)
+        self.assertFalse(bc.session.get.called)
+        self.assertFalse(bc.session.post.called)
+        return response
+
+    def test_record_replay(self):
+        self.record('http://example.com/data.csv', params={'day': '20160101'})
+        response = self.replay('http://example.com/data.csv', params={'day': '20160101'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.text, 'a,b\n1,2\n')
+        self.assertEqual(response.headers['content-type'], 'text/csv')
+        self.assertTrue(response.from_cassette)
+
+    def test_replay_miss(self):
+        self.record('http://example.com/data.csv', params={'day': '20160101'})
+        self.assertIsNone(self.replay('http://example.com/data.csv', params={'day': '20160102'}))
+
+    def test_post_body_in_key(self):
+        self.record('http://example.com/login', mode='post', data={'user': 'a'})
+        self.assertEqual(self.replay('http://example.com/login', mode='post', data={'user': 'a'}).content, b'posted')
+        self.assertIsNone(self.replay('http://example.com/login', mode='post', data={'user': 'b'}))
+
+    def test_format(self):
+        self.record('http://example.com/data.csv')
+        filenames = sorted(os.listdir(self.directory))
+        self.assertEqual(len(filenames), 2)
+        self.assertTrue(filenames[0].endswith('.body'))
+        self.assertTrue(filenames[1].endswith('.json'))
+
+    def test_invalid_mode(self):
+        self.assertRaises(ValueError, cassette.configure, self.directory, 'rewind')
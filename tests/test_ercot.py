@@ -3,6 +3,7 @@ from unittest import TestCase
 import pytz
 from datetime import datetime, timedelta
 import pandas as pd
+import mock
 
 
 class TestERCOT(TestCase):
@@ -185,3 +186,35 @@ ga('send', 'pageview');
 
         node_counts = range(612, 630)
         self.assertIn(len(df), node_counts)
+
+    def report_listing(self, times):
+        rows = ''.join('<tr><td class="labelOptional_ind">cdr.00012300.0000000000000000.%s.LMPSROSNODENP6788_%s.csv</td>'
+                       '<td><a href="/misdownload/servlets/mirDownload?doclookupId=%d">zip</a></td></tr>'
+                       % (t.strftime('%Y%m%d.%H%M%S'), t.strftime('%Y%m%d_%H%M%S'), i)
+                       for i, t in enumerate(times))
+        response = mock.MagicMock()
+        response.content = ('<html><table>%s</table></html>' % rows).encode('utf-8')
+        return response
+
+    def test_request_reports_one_listing(self):
+        """A range of 5 minute reports fetches the reports list once"""
+        tz = pytz.timezone(self.c.TZ_NAME)
+        times = [tz.localize(datetime(2016, 1, 1, 12, 0) + timedelta(minutes=5 * i)) for i in range(6)]
+        self.c.request = mock.MagicMock(return_value=self.report_listing(reversed(times)))
+        self.c._fetch_report = mock.MagicMock(side_effect=lambda endpoint: endpoint)
+
+        # report times are a few seconds after the period starts
+        periods = [t + timedelta(minutes=1) for t in times[1:4]] + [times[-1] + timedelta(minutes=30)]
+        reports = self.c._request_reports('rt5m_lmp', periods)
+
+        self.assertEqual(self.c.request.call_count, 1)
+        self.assertEqual(reports, ['http://mis.ercot.com/misdownload/servlets/mirDownload?doclookupId=%d' % i
+                                   for i in [4, 3, 2]])
+
+    def test_find_report_latest(self):
+        tz = pytz.timezone(self.c.TZ_NAME)
+        times = [tz.localize(datetime(2016, 1, 1, 12, 5)), tz.localize(datetime(2016, 1, 1, 12, 0))]
+        self.c.request = mock.MagicMock(return_value=self.report_listing(times))
+        listing = self.c._request_report_listing('rt5m_lmp')
+        self.assertEqual(self.c._find_report(listing, 'rt5m_lmp'), listing[0][1])
+        self.assertEqual(self.c._find_report(listing, 'rt5m_lmp', times[1] + timedelta(minutes=2)), listing[1][1])
@@ -62,3 +62,51 @@ class TestEU(TestCase):
 
     def test_bad_control_area(self):
         self.assertRaises(ValueError, self.c.get_load, 'not-a-cta', latest=True)
+
+    def load_csv(self, payload):
+        day = payload['dateTime.dateTime'][:10]
+        rows = ['"%s %02d:00 - %s %02d:00","%d","%d"' % (day, h, day, h + 1, 100 + h, 200 + h) for h in range(23)]
+        return '\n'.join(['"Time (UTC)","Day-ahead Total Load Forecast [MW] - CTA|X","Actual Total Load [MW] - CTA|X"'] + rows)
+
+    def test_get_load_many_control_areas(self):
+        self.c.session = mock.MagicMock()
+        with mock.patch.object(self.c, 'fetch_entsoe', side_effect=lambda url, payload: self.load_csv(payload)) as mock_fetch:
+            data = self.c.get_load(['AT', 'BE'], start_at='2016-01-01 00:00', end_at='2016-01-02 23:00')
+
+        self.assertEqual(mock_fetch.call_count, 4)
+        self.assertEqual(set(dp['ba_name'] for dp in data), set(['AT', 'BE']))
+        self.assertEqual(len([dp for dp in data if dp['ba_name'] == 'AT']), 46)
+        self.assertEqual(data[0]['load_MW'], 200)
+
+    def test_request_failed(self):
+        with mock.patch.object(self.c, 'request', return_value=None):
+            self.c.session = mock.MagicMock()
+            self.assertFalse(self.c.fetch_entsoe('url', 'payload'))
+
+    def test_get_load_one_control_area_fails(self):
+        self.c.session = mock.MagicMock()
+
+        def fetch_entsoe(url, payload):
+            if payload['biddingZone.values'] == self.c.CONTROL_AREAS['BE']['ENTSOe_ID']:
+                raise ValueError('bad response')
+            return self.load_csv(payload)
+
+        with mock.patch.object(self.c, 'fetch_entsoe', side_effect=fetch_entsoe):
+            data = self.c.get_load(['AT', 'BE'], start_at='2016-01-01 00:00', end_at='2016-01-02 23:00')
+
+        self.assertEqual(set(dp['ba_name'] for dp in data), set(['AT']))
+        self.assertEqual(len(data), 46)
+
+    def test_get_load_programming_error_raises(self):
+        self.c.session = mock.MagicMock()
+        with mock.patch.object(self.c, 'fetch_entsoe', side_effect=AttributeError('bug')):
+            self.assertRaises(AttributeError, self.c.get_load, ['AT', 'BE'],
+                              start_at='2016-01-01 00:00', end_at='2016-01-01 23:00')
+
+    def test_get_load_all_control_areas(self):
+        self.c.session = mock.MagicMock()
+        with mock.patch.object(self.c, 'fetch_entsoe', return_value=False) as mock_fetch:
+            data = self.c.get_load('all', start_at='2016-01-01 00:00', end_at='2016-01-01 23:00')
+
+        self.assertEqual(mock_fetch.call_count, len(self.c.CONTROL_AREAS))
+        self.assertEqual(data, [])
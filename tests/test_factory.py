@@ -1,6 +1,9 @@
-from pyiso import client_factory
+from pyiso import client_factory, fetch_many
 from unittest import TestCase
+from concurrent.futures import TimeoutError
 import inspect
+import time
+import mock
 
 
 class TestFactory(TestCase):
@@ -26,3 +29,66 @@ class TestFactory(TestCase):
 
             # check for BaseClient
             self.assertIn('BaseClient', parent_names)
+
+
+class TestFetchMany(TestCase):
+    def client(self, get_load):
+        c = mock.MagicMock(retry_policy=None)
+        c.get_load.side_effect = get_load
+        return c
+
+    def test_results_by_ba(self):
+        clients = {
+            'ISONE': self.client(lambda **kwargs: ['isone', kwargs]),
+            'MISO': self.client(lambda **kwargs: ['miso', kwargs]),
+        }
+        with mock.patch('pyiso.client_factory', side_effect=lambda name: clients[name]):
+            results = fetch_many(['ISONE', 'MISO'], latest=True)
+
+        self.assertEqual(results, {
+            'ISONE': ['isone', {'latest': True}],
+            'MISO': ['miso', {'latest': True}],
+        })
+
+    def test_failure_isolated(self):
+        def fail(**kwargs):
+            raise ValueError('bad')
+
+        clients = {'ISONE': self.client(fail), 'MISO': self.client(lambda **kwargs: ['miso'])}
+        with mock.patch('pyiso.client_factory', side_effect=lambda name: clients[name]):
+            results = fetch_many(['ISONE', 'MISO'])
+            self.assertEqual(results, {'MISO': ['miso']})
+
+            results = fetch_many(['ISONE', 'MISO'], return_exceptions=True)
+            self.assertIsInstance(results['ISONE'], ValueError)
+            self.assertEqual(results['MISO'], ['miso'])
+
+    def test_timeout_per_ba(self):
+        def slow(**kwargs):
+            time.sleep(0.5)
+            return ['pjm']
+
+        clients = {'PJM': self.client(slow), 'MISO': self.client(lambda **kwargs: ['miso'])}
+        with mock.patch('pyiso.client_factory', side_effect=lambda name: clients[name]):
+            start = time.time()
+            results = fetch_many(['PJM', 'MISO'], timeout_sec=0.1, return_exceptions=True)
+
+        # didn't wait for the slow BA
+        self.assertLess(time.time() - start, 0.4)
+        self.assertIsInstance(results['PJM'], TimeoutError)
+        self.assertEqual(results['MISO'], ['miso'])
+
+        # the timeout also caps the slow BA's retries
+        self.assertEqual(clients['PJM'].retry_policy.deadline_sec, 0.1)
+
+    def test_timeout_dict(self):
+        def slow(**kwargs):
+            time.sleep(0.3)
+            return ['pjm']
+
+        clients = {'PJM': self.client(slow), 'MISO': self.client(lambda **kwargs: ['miso'])}
+        with mock.patch('pyiso.client_factory', side_effect=lambda name: clients[name]):
+            results = fetch_many(['PJM', 'MISO'], timeout_sec={'MISO': 0.1})
+
+        self.assertEqual(results, {'PJM': ['pjm'], 'MISO': ['miso']})
+        self.assertIsNone(clients['PJM'].retry_policy)
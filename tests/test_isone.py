@@ -251,3 +251,17 @@ class TestISONE(TestCase):
     def test_get_sevendayforecast_bad_date(self):
         self.assertRaises(ValueError, self.c.get_sevendayforecast, day="foo")
 
+    def test_fetch_raw_data_concurrent_in_order(self):
+        self.c.handle_options(data='gen', start_at='2016-05-01 12:00', end_at='2016-05-04 12:00')
+        endpoints = self.c.request_endpoints()
+
+        def fetch_data(endpoint, auth):
+            if endpoint == endpoints[1]:
+                return {}
+            return {'GenFuelMixes': {'GenFuelMix': [endpoint]}}
+
+        with mock.patch.object(self.c, 'fetch_data', side_effect=fetch_data) as mock_fetch:
+            raw_data = self.c.fetch_raw_data(endpoints, self.c.parse_json_gen_data)
+
+        self.assertEqual(mock_fetch.call_count, len(endpoints))
+        self.assertEqual(raw_data, [endpoints[0]] + endpoints[2:])
@@ -1,5 +1,6 @@
 from pyiso import client_factory
 from unittest import TestCase
+import mock
 import pytz
 
 
@@ -21,3 +22,30 @@ class TestMISO(TestCase):
         bad_content = b'header1,header2\nnotadate,2016-01-01'
         data = self.c.parse_latest_fuel_mix(bad_content)
         self.assertEqual(len(data), 0)
+
+    def test_historical_lmp_prelim_fallback_per_day(self):
+        header = 'Node,Type,Value,' + ','.join('HE %d' % h for h in range(1, 25))
+        report = '\n'.join(['info'] * 4 + [
+            header,
+            'HUB1,Hub,LMP,' + ','.join(['20'] * 24),
+            'HUB1,Hub,MCC,' + ','.join(['1'] * 24),
+            'HUB1,Hub,MLC,' + ','.join(['2'] * 24),
+        ]).encode('utf-8')
+
+        def request(url):
+            # final report only on the first day
+            if '20160101_rt_lmp_final' in url or 'prelim' in url:
+                return mock.Mock(status_code=200, content=report)
+            return mock.MagicMock(status_code=404, __bool__=lambda self: False, __nonzero__=lambda self: False)
+
+        self.c.handle_options(start_at='2016-01-01 12:00', end_at='2016-01-02 12:00', market=self.c.MARKET_CHOICES.hourly)
+        with mock.patch.object(self.c, 'request', side_effect=request) as mocker:
+            df = self.c.get_historical_lmp()
+
+        # final for day 1, final then prelim for day 2
+        self.assertEqual(mocker.call_count, 3)
+        self.assertEqual(len(df), 48)
+        self.assertEqual(set(df['lmp_type']), set(['LMP']))
+        self.assertEqual(list(df['market'][:24].unique()), [self.c.MARKET_CHOICES.hourly])
+        self.assertEqual(list(df['market'][24:].unique()), [self.c.MARKET_CHOICES.hourly_prelim])
+        self.assertTrue(df.index.is_monotonic_increasing)
@@ -3915,6 +3915,21 @@ class TestNVEnergy(TestCase):
                 self.assertEqual(dp['ba_name'], 'NEVP')
                 self.assertEqual(dp['load_MW'], df.ix['Actual System Load', idp+1])
 
+    def test_fetch_df_last_month_fetches_month_once(self):
+        with mock.patch.object(self.c, 'request') as mocker:
+            one_month.seek(0)
+            mocker.return_value = mock.Mock(status_code=200, content=one_month.read())
+            df1, mode1 = self.c.fetch_df(datetime(2015, 7, 1, 12))
+            df2, mode2 = self.c.fetch_df(datetime(2015, 7, 2, 12))
+
+        # both days come from one request for the month's page
+        self.assertEqual(mocker.call_count, 1)
+        self.assertEqual(mode1, 'historical')
+        self.assertEqual(mode2, 'historical')
+        self.assertEqual(len(df1), 11)
+        self.assertEqual(len(df2), 11)
+        self.assertIn('Actual System Load', df2.index)
+
     def test_parse_trade_today(self):
         with mock.patch.object(self.c, 'request') as mocker:
             # set up df from StringIO
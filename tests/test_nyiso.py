@@ -1,8 +1,12 @@
 from pyiso import client_factory
 from unittest import TestCase
-from io import StringIO
+from io import StringIO, BytesIO
 from datetime import date, datetime
+import pandas as pd
 import pytz
+import time
+import zipfile
+import mock
 
 
 class TestNYISOBase(TestCase):
@@ -366,6 +370,21 @@ class TestNYISOBase(TestCase):
         # should have 4 dps, even though file has 5 (last one has no data)
         self.assertEqual(len(data), 4)
 
+    def test_parse_tz_col_timestamps(self):
+        """Timestamps at the end of 5min intervals are moved to the start, once"""
+        c = client_factory('NYISO')
+        c.options = {'data': 'dummy'}
+
+        # 00:00 EDT is 04:00 UTC
+        load = c.parse_load_rtm(self.load_csv)
+        self.assertEqual(list(load.index.to_pydatetime()),
+                         [datetime(2014, 9, 10, 3, 55, tzinfo=pytz.utc), datetime(2014, 9, 10, 4, 0, tzinfo=pytz.utc),
+                          datetime(2014, 9, 10, 4, 5, tzinfo=pytz.utc), datetime(2014, 9, 10, 4, 10, tzinfo=pytz.utc)])
+
+        # 00:05 EST is 05:05 UTC
+        genmix = c.parse_genmix(self.genmix_csv)
+        self.assertEqual(genmix.index[0].to_pydatetime(), datetime(2016, 1, 19, 5, 0, tzinfo=pytz.utc))
+
     def test_parse_load_forecast(self):
         c = client_factory('NYISO')
         c.options = {'data': 'dummy'}
@@ -476,3 +495,101 @@ class TestNYISOBase(TestCase):
         self.assertEqual(len(content_list), 1)
         self.assertEqual(content_list[0].split('\r\n')[0],
                          '"Time Stamp","Name","PTID","LBMP ($/MWHr)","Marginal Cost Losses ($/MWHr)","Marginal Cost Congestion ($/MWHr)"')
+
+    def test_get_any_concurrent_in_order(self):
+        c = client_factory('NYISO')
+        c.handle_options(data='load', start_at='2016-01-01 00:00', end_at='2016-01-05 12:00')
+        c.max_workers = 3
+
+        def fetch_csvs(day, label, monthly_zips=None):
+            # later days finish first
+            time.sleep(0.01 * (32 - day.day))
+            return [day]
+        parser = lambda day: pd.DataFrame({'day': [day.day]}, index=[pd.Timestamp(day).tz_localize(c.TZ_NAME)])
+
+        with mock.patch.object(c, 'fetch_csvs', side_effect=fetch_csvs) as mock_fetch:
+            df = c.get_any('pal', parser)
+
+        called_days = [call[0][0] for call in mock_fetch.call_args_list]
+        self.assertEqual(sorted(called_days), c.dates())
+        self.assertEqual(list(df['day']), [1, 2, 3, 4, 5])
+
+    def test_get_any_monthly_shortcut(self):
+        """Once one fetch covers the rest of the range, remaining dates are not fetched"""
+        c = client_factory('NYISO')
+        c.handle_options(data='load', start_at='2016-01-01 00:00', end_at='2016-01-20 12:00')
+        c.max_workers = 2
+
+        month = pd.date_range('2016-01-01', '2016-01-31', freq='D', tz=c.TZ_NAME)
+        parser = lambda content: pd.DataFrame({'day': month.day}, index=month)
+
+        with mock.patch.object(c, 'fetch_csvs', return_value=['month']) as mock_fetch:
+            df = c.get_any('pal', parser)
+
+        self.assertLessEqual(mock_fetch.call_count, 3)
+        self.assertEqual(len(df), 20)
+
+    def test_get_any_fetches_monthly_zip_once(self):
+        """When daily csvs are missing, each monthly zip is only downloaded once"""
+        c = client_factory('NYISO')
+        c.handle_options(data='load', start_at='2016-01-02 00:00', end_at='2016-02-10 12:00')
+        c.max_workers = 4
+
+        def request(url):
+            # daily csvs are missing
+            time.sleep(0.01)
+            return None
+
+        def fetch_to_file(url):
+            zipped = BytesIO()
+            with zipfile.ZipFile(zipped, 'w') as z:
+                z.writestr('month.csv', url[-19:-11])
+            zipped.seek(0)
+            return zipped
+
+        def parser(content):
+            start = pd.Timestamp(content.read().decode('utf-8')).tz_localize(c.TZ_NAME)
+            month = pd.date_range(start, start + pd.offsets.MonthEnd(), freq='D')
+            return pd.DataFrame({'day': month.day}, index=month)
+
+        with mock.patch.object(c, 'request', side_effect=request):
+            with mock.patch.object(c, 'fetch_to_file', side_effect=fetch_to_file) as mock_fetch:
+                df = c.get_any('pal', parser)
+
+        monthly_urls = [call[0][0] for call in mock_fetch.call_args_list]
+        self.assertEqual(sorted(monthly_urls), ['http://mis.nyiso.com/public/csv/pal/20160101pal_csv.zip',
+                                                'http://mis.nyiso.com/public/csv/pal/20160201pal_csv.zip'])
+        self.assertEqual(len(df), 40)
+
+    def test_get_load_parse_processes(self):
+        """Parsing in other processes gives the same load as parsing on the fetch threads"""
+        def load_csv(day):
+            rows = ['"%s 00:%02d:00","EST","CAPITL",61757,%d' % (day.strftime('%m/%d/%Y'), minute, day.day * 100 + minute)
+                    for minute in range(30, 45, 5)]
+            return '\r\n'.join(['"Time Stamp","Time Zone","Name","PTID","Load"'] + rows)
+
+        def request(url):
+            # daily csvs are missing
+            return None
+
+        def fetch_to_file(url):
+            zipped = BytesIO()
+            with zipfile.ZipFile(zipped, 'w') as z:
+                for day in pd.date_range('2016-01-01', '2016-01-31', freq='D'):
+                    z.writestr(day.strftime('%Y%m%dpal.csv'), load_csv(day))
+            zipped.seek(0)
+            return zipped
+
+        results = []
+        for parse_processes in [0, 2]:
+            c = client_factory('NYISO')
+            c.parse_processes = parse_processes
+
+            # patch the class, since the client itself is pickled for the parse processes
+            with mock.patch.object(type(c), 'request', side_effect=request):
+                with mock.patch.object(type(c), 'fetch_to_file', side_effect=fetch_to_file) as mock_fetch:
+                    results.append(c.get_load(start_at='2016-01-04 00:00', end_at='2016-01-06 12:00'))
+            self.assertEqual(mock_fetch.call_count, 1)
+
+        self.assertEqual(results[1], results[0])
+        self.assertEqual([d['load_MW'] for d in results[1]], [430, 435, 440, 530, 535, 540, 630, 635, 640])
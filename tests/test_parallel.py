@@ -0,0 +1,90 @@
+from pyiso import parallel
+from unittest import TestCase
+from threading import Lock
+import multiprocessing
+import os
+import time
+
+
+def parse_in_process(item, payload):
+    return item, payload.upper(), os.getpid()
+
+
+class TestParallel(TestCase):
+    def test_map_ordered(self):
+        def slow_square(x):
+            time.sleep(0.01 * (5 - x))
+            return x * x
+        self.assertEqual(parallel.map_ordered(slow_square, range(5), max_workers=3), [0, 1, 4, 9, 16])
+
+    def test_map_ordered_serial(self):
+        self.assertEqual(parallel.map_ordered(lambda x: x + 1, [1, 2], max_workers=1), [2, 3])
+
+    def test_map_ordered_raises(self):
+        def fail_on_two(x):
+            if x == 2:
+                raise ValueError(x)
+            return x
+        self.assertRaises(ValueError, parallel.map_ordered, fail_on_two, range(4), max_workers=2)
+
+    def test_imap_bounded(self):
+        """No more than max_workers calls run at once"""
+        lock = Lock()
+        state = {'running': 0, 'most': 0}
+
+        def track(x):
+            with lock:
+                state['running'] += 1
+                state['most'] = max(state['most'], state['running'])
+            time.sleep(0.02)
+            with lock:
+                state['running'] -= 1
+            return x
+
+        self.assertEqual(list(parallel.imap_ordered(track, range(10), max_workers=3)), list(range(10)))
+        self.assertLessEqual(state['most'], 3)
+
+    def test_imap_close_cancels(self):
+        calls = []
+
+        def record(x):
+            calls.append(x)
+            return x
+
+        results = parallel.imap_ordered(record, range(100), max_workers=2)
+        self.assertEqual(next(results), 0)
+        results.close()
+        time.sleep(0.05)
+        self.assertLess(len(calls), 5)
+
+    def test_pipeline_inline(self):
+        def fetch(x):
+            time.sleep(0.01 * (5 - x))
+            return 'payload%d' % x
+
+        results = list(parallel.imap_pipeline(fetch, parse_in_process, range(5), max_workers=3, parse_processes=0))
+        self.assertEqual([(item, payload) for item, payload, pid in results],
+                         [(x, 'PAYLOAD%d' % x) for x in range(5)])
+        self.assertEqual(set(pid for item, payload, pid in results), set([os.getpid()]))
+
+    def test_pipeline_processes(self):
+        results = list(parallel.imap_pipeline(lambda x: 'payload%d' % x, parse_in_process, range(8),
+                                              max_workers=3, parse_processes=2))
+
+        # parsed in order, in other processes
+        self.assertEqual([(item, payload) for item, payload, pid in results],
+                         [(x, 'PAYLOAD%d' % x) for x in range(8)])
+        self.assertNotIn(os.getpid(), set(pid for item, payload, pid in results))
+
+    def test_pipeline_processes_start_before_fetching(self):
+        """Parse processes are started before any fetch thread, so none is forked while a fetch holds a lock"""
+        def fetch(x):
+            return 'payload%d' % len(multiprocessing.active_children())
+
+        results = list(parallel.imap_pipeline(fetch, parse_in_process, range(4), max_workers=2, parse_processes=2))
+        for item, payload, pid in results:
+            self.assertGreaterEqual(int(payload[len('PAYLOAD'):]), 2)
+
+    def test_pipeline_processes_raises(self):
+        results = parallel.imap_pipeline(lambda x: None, parse_in_process, range(3), parse_processes=2)
+        self.assertRaises(AttributeError, list, results)
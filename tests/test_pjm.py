@@ -3,6 +3,7 @@ from unittest import TestCase
 import pandas as pd
 from datetime import datetime, timedelta
 import pytz
+import mock
 
 
 class TestPJM(TestCase):
@@ -97,6 +98,13 @@ class TestPJM(TestCase):
         ts = self.c.time_as_of(self.edata_inst_load)
         self.assertEqual(ts, datetime(2015, 12, 11, 17, 23, tzinfo=pytz.utc) + timedelta(hours=5))
 
+    def test_parse_edata_page(self):
+        response = mock.Mock(content=self.edata_inst_load.encode('utf-8'))
+        ts, df = self.c._parse_edata_page(response)
+        self.assertEqual(ts, datetime(2015, 12, 11, 17, 23, tzinfo=pytz.utc) + timedelta(hours=5))
+        self.assertEqual(list(df.columns), ['MW'])
+        self.assertEqual(df.loc['PJM RTO Total']['MW'], 91419)
+
     def test_parse_inst_load(self):
         dfs = pd.read_html(self.edata_inst_load, header=0, index_col=0)
         df = dfs[0]
@@ -155,6 +163,35 @@ class TestPJM(TestCase):
         self.assertEqual(df.ix[tz_func(datetime(2015, 6, 4, 2))]['load_MW'], 64705.985)
         self.assertEqual(df.ix[tz_func(datetime(2015, 12, 15, 23))]['load_MW'], 79345.672)
 
+    def fetch_fake_historical_load(self, start, end):
+        dates = pd.date_range(start, end, freq='D')
+        wide = pd.DataFrame({'DATE': dates, 'COMP': 'RTO'})
+        for hour in range(1, 25):
+            wide['HE%02d' % hour] = float(hour)
+        xd = mock.MagicMock()
+        xd.parse.return_value = wide
+
+        with mock.patch.object(self.c, 'fetch_xls', return_value=xd):
+            df = self.c.fetch_historical_load(2015)
+        self.assertEqual(len(df), len(dates) * 24)
+        self.assertEqual(df.index.tz, pytz.utc)
+        return df
+
+    def test_fetch_historical_load_dst(self):
+        """Hours on DST transition days are localized like they always were, the rest all at once"""
+        # ambiguous 1am when DST ends is daylight time
+        df = self.fetch_fake_historical_load('2015-10-31', '2015-11-02')
+        self.assertEqual(df.loc[datetime(2015, 11, 1, 5, tzinfo=pytz.utc), 'load_MW'], 2)
+        self.assertNotIn(datetime(2015, 11, 1, 6, tzinfo=pytz.utc), df.index)
+        self.assertEqual(df.loc[datetime(2015, 10, 31, 4, tzinfo=pytz.utc), 'load_MW'], 1)
+        self.assertEqual(df.loc[datetime(2015, 11, 2, 5, tzinfo=pytz.utc), 'load_MW'], 1)
+
+        # skipped 2am when DST starts is standard time, so lands on 3am
+        df = self.fetch_fake_historical_load('2015-03-07', '2015-03-09')
+        self.assertEqual(list(df.loc[datetime(2015, 3, 8, 7, tzinfo=pytz.utc), 'load_MW']), [3, 4])
+        self.assertEqual(df.loc[datetime(2015, 3, 7, 5, tzinfo=pytz.utc), 'load_MW'], 1)
+        self.assertEqual(df.loc[datetime(2015, 3, 9, 4, tzinfo=pytz.utc), 'load_MW'], 1)
+
     def test_parse_date_from_markets_operations(self):
         soup = self.c.fetch_markets_operations_soup()
         ts = self.c.parse_date_from_markets_operations(soup)
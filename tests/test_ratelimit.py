@@ -0,0 +1,98 @@
+from pyiso import ratelimit
+from pyiso.base import BaseClient
+from unittest import TestCase
+from tests.helpers import make_response
+import mock
+
+
+class TestTokenBucket(TestCase):
+    def test_burst(self):
+        """Up to burst tokens are available immediately, then callers wait"""
+        bucket = ratelimit.TokenBucket(rate=1, burst=3)
+        waits = [bucket.reserve() for i in range(4)]
+        self.assertEqual(waits[:3], [0, 0, 0])
+        self.assertAlmostEqual(waits[3], 1, places=1)
+
+    def test_waits_queue(self):
+        """Each waiting caller waits one more interval than the one before"""
+        bucket = ratelimit.TokenBucket(rate=2, burst=1)
+        bucket.reserve()
+        self.assertAlmostEqual(bucket.reserve(), 0.5, places=1)
+        self.assertAlmostEqual(bucket.reserve(), 1.0, places=1)
+
+    def test_penalize(self):
+        bucket = ratelimit.TokenBucket(rate=1, burst=5)
+        bucket.penalize(10)
+        self.assertAlmostEqual(bucket.reserve(), 11, places=1)
+
+
+class TestRegistry(TestCase):
+    def setUp(self):
+        ratelimit.reset()
+
+    def tearDown(self):
+        ratelimit.reset()
+
+    def test_shared_by_host(self):
+        b1 = ratelimit.bucket_for('http://mis.nyiso.com/public/csv/pal/20160101pal.csv')
+        b2 = ratelimit.bucket_for('http://MIS.nyiso.com/public/csv/rtfuelmix/20160101rtfuelmix.csv')
+        b3 = ratelimit.bucket_for('http://oasis.caiso.com/oasisapi/SingleZip')
+        self.assertIs(b1, b2)
+        self.assertIsNot(b1, b3)
+
+    def test_configured_limits(self):
+        rate, burst = ratelimit.RATE_LIMITS['oasis.caiso.com']
+        bucket = ratelimit.bucket_for('http://oasis.caiso.com/oasisapi/SingleZip')
+        self.assertEqual(bucket.rate, rate)
+        self.assertEqual(bucket.burst, burst)
+
+    def test_default_limit(self):
+        bucket = ratelimit.bucket_for('http://example.com/data.csv')
+        self.assertEqual((bucket.rate, bucket.burst), ratelimit.DEFAULT_RATE_LIMIT)
+
+    def test_set_rate_limit(self):
+        old = ratelimit.RATE_LIMITS.get('example.com')
+        try:
+            ratelimit.set_rate_limit('example.com', 3, 7)
+            bucket = ratelimit.bucket_for('http://example.com/data.csv')
+            self.assertEqual((bucket.rate, bucket.burst), (3, 7))
+
+            ratelimit.set_rate_limit('example.com', None)
+            self.assertIsNone(ratelimit.bucket_for('http://example.com/data.csv'))
+            self.assertEqual(ratelimit.acquire('http://example.com/data.csv'), 0)
+        finally:
+            if old is None:
+                ratelimit.RATE_LIMITS.pop('example.com', None)
+            else:
+                ratelimit.RATE_LIMITS['example.com'] = old
+
+
+class TestThrottledRequest(TestCase):
+    def setUp(self):
+        ratelimit.reset()
+
+    def tearDown(self):
+        ratelimit.reset()
+
+    @mock.patch('pyiso.ratelimit.sleep')
+    def test_retry_after_429(self, mock_sleep):
+        """A 429 holds off the host for Retry-After seconds, then retries"""
+        bc = BaseClient()
+        bc.session = mock.MagicMock()
+        bc.session.get.side_effect = [make_response(status_code=429, headers={'Retry-After': '30'}),
+                                      make_response(status_code=200)]
+
+        response = bc.request('http://example.com/data.csv')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(bc.session.get.call_count, 2)
+        self.assertGreaterEqual(mock_sleep.call_args[0][0], 30)
+
+    @mock.patch('pyiso.ratelimit.sleep')
+    def test_exhausted_429(self, mock_sleep):
+        bc = BaseClient()
+        bc.session = mock.MagicMock()
+        bc.session.get.return_value = make_response(status_code=429)
+
+        response = bc.request('http://example.com/data.csv', retries_remaining=2)
+        self.assertIsNone(response)
+        self.assertEqual(bc.session.get.call_count, 3)
@@ -0,0 +1,77 @@
+from pyiso import retry, ratelimit
+from pyiso.base import BaseClient
+from unittest import TestCase
+from tests.helpers import make_response
+import requests
+import mock
+
+
+class TestRetryPolicy(TestCase):
+    def test_backoff(self):
+        policy = retry.RetryPolicy(backoff_sec=2, max_backoff_sec=10, jitter=0)
+        self.assertEqual([policy.backoff(i) for i in range(4)], [2, 4, 8, 10])
+
+    def test_backoff_jitter(self):
+        policy = retry.RetryPolicy(backoff_sec=10, jitter=0.5)
+        for i in range(20):
+            self.assertTrue(5 <= policy.backoff(0) <= 15)
+
+    def test_deadline(self):
+        self.assertIsNone(retry.RetryPolicy().new_deadline())
+        self.assertGreater(retry.time_left(retry.RetryPolicy(deadline_sec=60).new_deadline()), 59)
+
+
+class TestRetriedRequest(TestCase):
+    def setUp(self):
+        ratelimit.reset()
+        self.bc = BaseClient()
+        self.bc.retry_policy = retry.RetryPolicy(max_retries=2, backoff_sec=1, jitter=0)
+        self.bc.session = mock.MagicMock()
+
+    def tearDown(self):
+        ratelimit.reset()
+
+    @mock.patch('pyiso.retry.sleep')
+    def test_retry_connection_error(self, mock_sleep):
+        self.bc.session.get.side_effect = [requests.exceptions.ConnectionError('down'),
+                                           make_response(status_code=200)]
+        response = self.bc.request('http://example.com/data.csv')
+        self.assertEqual(response.status_code, 200)
+        mock_sleep.assert_called_once_with(1)
+
+    @mock.patch('pyiso.retry.sleep')
+    def test_exhausted_connection_error(self, mock_sleep):
+        self.bc.session.get.side_effect = requests.exceptions.Timeout('slow')
+        self.assertIsNone(self.bc.request('http://example.com/data.csv'))
+        self.assertEqual(self.bc.session.get.call_count, 3)
+        self.assertEqual([c[0][0] for c in mock_sleep.call_args_list], [1, 2])
+
+    @mock.patch('pyiso.retry.sleep')
+    def test_retry_server_error(self, mock_sleep):
+        self.bc.session.get.side_effect = [make_response(status_code=503), make_response(status_code=200)]
+        self.assertEqual(self.bc.request('http://example.com/data.csv').status_code, 200)
+
+    @mock.patch('pyiso.retry.sleep')
+    def test_exhausted_server_error(self, mock_sleep):
+        """Once retries run out, a server error is passed through"""
+        self.bc.session.get.return_value = make_response(status_code=500)
+        self.assertEqual(self.bc.request('http://example.com/data.csv').status_code, 500)
+        self.assertEqual(self.bc.session.get.call_count, 3)
+
+    @mock.patch('pyiso.retry.sleep')
+    def test_not_retryable(self, mock_sleep):
+        self.bc.session.get.return_value = make_response(status_code=404)
+        self.assertEqual(self.bc.request('http://example.com/data.csv').status_code, 404)
+        self.assertEqual(self.bc.session.get.call_count, 1)
+        self.assertFalse(mock_sleep.called)
+
+    @mock.patch('pyiso.retry.sleep')
+    def test_deadline_cancels_retries(self, mock_sleep):
+        self.bc.retry_policy = retry.RetryPolicy(max_retries=5, backoff_sec=10, jitter=0, deadline_sec=5)
+        self.bc.handle_options()
+        self.bc.session.get.side_effect = requests.exceptions.ConnectionError('down')
+
+        self.assertIsNone(self.bc.request('http://example.com/data.csv'))
+        self.assertEqual(self.bc.session.get.call_count, 1)
+        self.assertFalse(mock_sleep.called)
+        self.assertLessEqual(self.bc.session.get.call_args[1]['timeout'], 5)
@@ -0,0 +1,121 @@
+from pyiso import sessions
+from pyiso.base import BaseClient
+from unittest import TestCase
+from threading import Event, Thread
+import time
+import mock
+
+
+class TestSessions(TestCase):
+    def tearDown(self):
+        sessions.close_all()
+
+    def test_shared_by_host(self):
+        s1 = sessions.get_session('http://mis.nyiso.com/public/csv/pal/20160101pal.csv')
+        s2 = sessions.get_session('http://mis.nyiso.com/public/csv/rtfuelmix/20160101rtfuelmix.csv')
+        s3 = sessions.get_session('http://oasis.caiso.com/oasisapi/SingleZip')
+        self.assertIs(s1, s2)
+        self.assertIsNot(s1, s3)
+
+    def test_adapter_settings(self):
+        session = sessions.new_session()
+        adapter = session.get_adapter('https://webservices.iso-ne.com/api/v1.1')
+        self.assertEqual(adapter._pool_maxsize, sessions.POOL_MAXSIZE)
+        self.assertEqual(adapter.max_retries.total, sessions.MAX_RETRIES)
+
+        # connection errors are only retried by the client's RetryPolicy
+        self.assertEqual(sessions.MAX_RETRIES, 0)
+
+    def test_configure(self):
+        old = (sessions.POOL_MAXSIZE, sessions.KEEP_ALIVE)
+        try:
+            s1 = sessions.get_session('http://mis.nyiso.com/')
+            sessions.configure(pool_maxsize=5, keep_alive=False)
+            s2 = sessions.get_session('http://mis.nyiso.com/')
+            self.assertIsNot(s1, s2)
+            self.assertEqual(s2.get_adapter('http://mis.nyiso.com/')._pool_maxsize, 5)
+            self.assertEqual(s2.headers['Connection'], 'close')
+        finally:
+            sessions.configure(pool_maxsize=old[0], keep_alive=old[1])
+
+    def test_clients_share_session(self):
+        """Clients without their own session make requests through the pooled session"""
+        pooled = mock.MagicMock()
+        with mock.patch('pyiso.sessions.get_session', return_value=pooled) as mock_get_session:
+            BaseClient().request('http://example.com/data.csv')
+            BaseClient().request('http://example.com/data.csv')
+
+        self.assertEqual(mock_get_session.call_count, 2)
+        self.assertEqual(pooled.get.call_count, 2)
+
+    def test_own_session_preferred(self):
+        bc = BaseClient()
+        bc.session = mock.MagicMock()
+        with mock.patch('pyiso.sessions.get_session') as mock_get_session:
+            bc.request('http://example.com/data.csv')
+
+        self.assertFalse(mock_get_session.called)
+        self.assertEqual(bc.session.get.call_count, 1)
+
+
+class TestSingleFlight(TestCase):
+    def run_concurrently(self, fn, n):
+        results = []
+        threads = [Thread(target=lambda: results.append(fn())) for i in range(n)]
+        for thread in threads:
+            thread.start()
+        return threads, results
+
+    def test_shared_result(self):
+        flight = sessions.SingleFlight()
+        release = Event()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            release.wait(5)
+            return 'result'
+
+        threads, results = self.run_concurrently(lambda: flight.do('key', slow), 4)
+        # wait for every caller to join the flight before letting it land
+        time.sleep(0.2)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ['result'] * 4)
+        self.assertEqual(len(flight), 0)
+
+    def test_shared_error(self):
+        flight = sessions.SingleFlight()
+        self.assertRaises(ValueError, flight.do, 'key', mock.MagicMock(side_effect=ValueError))
+        self.assertEqual(flight.do('key', lambda: 'ok'), 'ok')
+
+    def test_requests_coalesced(self):
+        release = Event()
+        pooled = mock.MagicMock()
+
+        def slow_get(*args, **kwargs):
+            release.wait(5)
+            return mock.MagicMock(status_code=200, headers={})
+        pooled.get.side_effect = slow_get
+
+        with mock.patch('pyiso.sessions.get_session', return_value=pooled):
+            threads, results = self.run_concurrently(
+                lambda: BaseClient().request('http://example.com/data.csv', params={'a': 1}), 3)
+            time.sleep(0.2)
+            release.set()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(pooled.get.call_count, 1)
+        self.assertIs(results[0], results[1])
+        self.assertIs(results[0], results[2])
+
+    def test_different_requests_not_coalesced(self):
+        bc = BaseClient()
+        self.assertNotEqual(bc._in_flight_key('http://example.com/data.csv', 'get', {'params': {'a': 1}}),
+                            bc._in_flight_key('http://example.com/data.csv', 'get', {'params': {'a': 2}}))
+        self.assertIsNone(bc._in_flight_key('http://example.com/login', 'post', {'data': {'a': 1}}))
+        self.assertIsNone(bc._in_flight_key('http://example.com/data.zip', 'get', {'stream': True}))
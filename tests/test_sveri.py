@@ -1,7 +1,9 @@
 from pyiso import client_factory
 from unittest import TestCase
-from datetime import time, datetime, timedelta
+from datetime import time, datetime, timedelta, date
+import pandas as pd
 import pytz
+import mock
 
 
 class TestSVERI(TestCase):
@@ -104,3 +106,45 @@ class TestSVERI(TestCase):
 
         result['ids'] = '0'  # load
         self.assertEquals(self.c.get_load_payload(), result)
+
+    def test_date_ranges_chunked(self):
+        self.c.handle_options(data='load', latest=False, start_at='2016-01-01 12:00', end_at='2016-01-20 12:00')
+        self.assertEqual(self.c._date_ranges(), [
+            (date(2016, 1, 1), date(2016, 1, 8)),
+            (date(2016, 1, 8), date(2016, 1, 15)),
+            (date(2016, 1, 15), date(2016, 1, 20)),
+        ])
+
+    def test_date_ranges_short(self):
+        self.c.handle_options(data='load', latest=False, start_at='2016-01-01 12:00', end_at='2016-01-01 18:00')
+        self.assertEqual(self.c._date_ranges(), [(date(2016, 1, 1), date(2016, 1, 1))])
+
+    def test_fetch_chunks(self):
+        self.c.handle_options(data='gen', latest=False, start_at='2016-01-01 12:00', end_at='2016-01-10 12:00')
+
+        def fetch_df(payload):
+            # each chunk has a row for its first and last day, so neighbours overlap by one row
+            idx = pd.to_datetime([payload['startDate'], payload['endDate']])
+            return pd.DataFrame({'ids%s' % payload['ids']: [1, 2]}, index=idx)
+
+        with mock.patch.object(self.c, 'fetch_df', side_effect=fetch_df) as mocker:
+            df = self.c.fetch_chunks(self.c.gen_ids)
+
+        # one request per chunk and set of ids
+        self.assertEqual(mocker.call_count, 4)
+
+        # ids side by side, chunks one after the other without repeats
+        self.assertEqual(list(df.columns), ['ids1,2,3,4', 'ids5,6,7,8'])
+        self.assertEqual(list(df.index), list(pd.to_datetime(['2016-01-01', '2016-01-08', '2016-01-10'])))
+
+    def test_fetch_chunks_skips_failed(self):
+        self.c.handle_options(data='load', latest=False, start_at='2016-01-01 12:00', end_at='2016-01-10 12:00')
+
+        def fetch_df(payload):
+            if payload['startDate'] == '2016-01-01':
+                return None
+            return pd.DataFrame({'load': [1]}, index=pd.to_datetime([payload['startDate']]))
+
+        with mock.patch.object(self.c, 'fetch_df', side_effect=fetch_df):
+            df = self.c.fetch_chunks([self.c.load_ids])
+        self.assertEqual(list(df.index), list(pd.to_datetime(['2016-01-08'])))